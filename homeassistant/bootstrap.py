@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from datetime import datetime, timedelta
+import importlib
 import logging
 import logging.handlers
 import os
@@ -11,6 +12,8 @@ import platform
 import sys
 import threading
 from time import monotonic
+from timeit import default_timer as timer
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
@@ -23,6 +26,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    Platform,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
@@ -40,15 +44,18 @@ from .helpers.dispatcher import async_dispatcher_send
 from .helpers.typing import ConfigType
 from .setup import (
     DATA_SETUP,
+    DATA_SETUP_SPANS,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    SetupSpan,
+    async_get_setup_critical_path,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
 from .util import dt as dt_util
 from .util.logging import async_activate_log_queue_handler
-from .util.package import async_get_user_site, is_virtual_env
+from .util.package import async_get_user_site, is_installed, is_virtual_env
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -489,6 +496,190 @@ def _get_domains(hass: core.HomeAssistant, config: dict[str, Any]) -> set[str]:
     return domains
 
 
+def _get_yaml_platforms(
+    config: dict[str, Any], domains: set[str]
+) -> dict[str, set[str]]:
+    """Get the platforms set up from YAML by the integration providing them."""
+    platforms: dict[str, set[str]] = {}
+    for domain in domains:
+        for platform_name, _ in conf_util.config_per_platform(config, domain):
+            if isinstance(platform_name, str) and core.valid_domain(platform_name):
+                platforms.setdefault(platform_name, set()).add(domain)
+    return platforms
+
+
+def _find_entry_platforms(
+    integrations: list[loader.Integration],
+) -> dict[str, set[str]]:
+    """Find the entity platforms shipped by integrations set up by config entries.
+
+    Must be called from an executor thread.
+    """
+    entity_platforms = {entity_platform.value for entity_platform in Platform}
+    platforms: dict[str, set[str]] = {}
+    for integration in integrations:
+        try:
+            names = os.listdir(integration.file_path)
+        except OSError:
+            continue
+        if found := {name.partition(".")[0] for name in names} & entity_platforms:
+            platforms[integration.domain] = found
+    return platforms
+
+
+def _find_installed_requirements(requirements: set[str]) -> set[str]:
+    """Return the requirements that are already installed.
+
+    Must be called from an executor thread.
+    """
+    return {requirement for requirement in requirements if is_installed(requirement)}
+
+
+def _preimport_module(module_name: str) -> tuple[float, float] | None:
+    """Import a module and return when the import started and finished.
+
+    Returns None if the module was already imported or failed to import.
+
+    Must be called from an executor thread.
+    """
+    if module_name in sys.modules:
+        return None
+    start = timer()
+    try:
+        importlib.import_module(module_name)
+    except Exception:  # pylint: disable=broad-except
+        # The error is reported when the module is imported again
+        # while setting up the integration
+        _LOGGER.debug("Unable to preimport %s", module_name, exc_info=True)
+        return None
+    return start, timer()
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integration_cache: dict[str, loader.Integration],
+    setup_spans: list[SetupSpan],
+) -> None:
+    """Import the integrations and platforms that are about to be set up.
+
+    Modules are imported concurrently in the executor instead of one by
+    one in the event loop once each integration is set up. To avoid
+    import threads waiting on each other's import locks, modules are
+    imported in waves where a module is only imported once the
+    integrations it depends on have been imported.
+
+    Only built-in integrations are imported, and only if the
+    requirements of the integration and its dependencies are already
+    installed. Other integrations are imported after their requirements
+    have been processed while they are set up, so they do not end up
+    running against an outdated or missing library.
+    """
+    components: dict[str, ModuleType] = hass.data[loader.DATA_COMPONENTS]
+    integrations = {
+        domain: integration
+        for domain, integration in integration_cache.items()
+        if await integration.resolve_dependencies()
+    }
+    platforms = _get_yaml_platforms(config, set(integrations))
+    entry_integrations = [
+        integrations[domain]
+        for domain in integrations.keys() & hass.config_entries.async_domains()
+        if domain not in components
+    ]
+    for domain, entry_platforms in (
+        await hass.async_add_executor_job(_find_entry_platforms, entry_integrations)
+    ).items():
+        platforms.setdefault(domain, set()).update(entry_platforms)
+
+    # Entity platforms depend on the integration providing them and on
+    # the entity component which may not be set up from the config
+    if to_resolve := (
+        platforms.keys() | {domain for names in platforms.values() for domain in names}
+    ) - integrations.keys():
+        resolved = await loader.async_get_integrations(hass, to_resolve)
+        for domain, int_or_exc in resolved.items():
+            if isinstance(
+                int_or_exc, loader.Integration
+            ) and await int_or_exc.resolve_dependencies():
+                integrations[domain] = int_or_exc
+
+    installed = await hass.async_add_executor_job(
+        _find_installed_requirements,
+        {
+            requirement
+            for integration in integrations.values()
+            for requirement in integration.requirements
+        },
+    )
+    importable = {
+        domain
+        for domain, integration in integrations.items()
+        if integration.is_built_in
+        and installed.issuperset(integration.requirements)
+    }
+    integrations = {
+        domain: integration
+        for domain, integration in integrations.items()
+        if domain in importable
+        and all(
+            dependency in importable or dependency in components
+            for dependency in integration.all_dependencies
+        )
+    }
+
+    waves: dict[str, int] = {}
+
+    def _wave(domain: str) -> int:
+        """Return the wave the integration is imported in."""
+        if (wave := waves.get(domain)) is None:
+            wave = waves[domain] = 1 + max(
+                (
+                    _wave(dependency)
+                    for dependency in integrations[domain].all_dependencies
+                    if dependency in integrations
+                ),
+                default=-1,
+            )
+        return wave
+
+    to_import: dict[int, dict[str, str]] = {}
+    for domain, integration in integrations.items():
+        if domain in components:
+            continue
+        to_import.setdefault(_wave(domain), {})[domain] = integration.pkg_path
+        for platform_name in platforms.get(domain, ()):
+            if platform_name not in integrations:
+                continue
+            full_name = f"{domain}.{platform_name}"
+            if full_name in components:
+                continue
+            wave = max(_wave(domain), _wave(platform_name)) + 1
+            module_name = f"{integration.pkg_path}.{platform_name}"
+            to_import.setdefault(wave, {})[full_name] = module_name
+
+    import_times: dict[str, float] = {}
+    for wave in sorted(to_import):
+        module_names = to_import[wave]
+        results = await asyncio.gather(
+            *(
+                hass.async_add_executor_job(_preimport_module, module_name)
+                for module_name in module_names.values()
+            )
+        )
+        for name, result in zip(module_names, results):
+            if result is None:
+                continue
+            start, end = result
+            setup_spans.append(SetupSpan(name, "preimport", start, end))
+            import_times[name] = end - start
+
+    _LOGGER.debug(
+        "Integration import times: %s",
+        dict(sorted(import_times.items(), key=lambda item: item[1])),
+    )
+
+
 async def _async_watch_pending_setups(hass: core.HomeAssistant) -> None:
     """Periodic log of setups that are pending.
 
@@ -550,6 +741,7 @@ async def _async_set_up_integrations(
     """Set up all the integrations."""
     hass.data[DATA_SETUP_STARTED] = {}
     setup_time: dict[str, timedelta] = hass.data.setdefault(DATA_SETUP_TIME, {})
+    setup_spans: list[SetupSpan] = hass.data.setdefault(DATA_SETUP_SPANS, [])
 
     watch_task = asyncio.create_task(_async_watch_pending_setups(hass))
 
@@ -591,6 +783,8 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    await _async_preimport_integrations(hass, config, integration_cache, setup_spans)
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -684,6 +878,9 @@ async def _async_set_up_integrations(
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATIONS, {})
 
+    # Index the manifests and dependencies resolved while starting
+    await loader.async_save_manifest_index(hass)
+
     _LOGGER.debug(
         "Integration setup times: %s",
         {
@@ -693,3 +890,7 @@ async def _async_set_up_integrations(
             )
         },
     )
+    _LOGGER.debug(
+        "Integration setup critical path: %s",
+        " -> ".join(async_get_setup_critical_path(setup_spans)),
+    )
@@ -1,7 +1,12 @@
 """History integration constants."""
+from datetime import timedelta
 
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Historical states for long time ranges are fetched and sent
+# to stream subscribers in chunks of this size
+HISTORY_STREAM_CHUNK_TIME = timedelta(days=1)
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable, MutableMapping
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 import logging
 from typing import Any, cast
 
@@ -12,6 +12,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.models import CompressedStates
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -38,7 +39,11 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,6 +67,49 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _states_to_json_ready(
+    states: Mapping[str, Sequence[Any]],
+) -> dict[str, Any]:
+    """Replace CompressedStates with their serialized rows.
+
+    This lets the rows be serialized straight from their columns.
+    """
+    return {
+        entity_id: (
+            state_list.json_fragment()
+            if isinstance(state_list, CompressedStates)
+            else state_list
+        )
+        for entity_id, state_list in states.items()
+    }
+
+
+def _downsample_bucket_size(
+    start_time: dt, end_time: dt, max_points: int | None
+) -> float | None:
+    """Return the bucket size in seconds to fit a time range into max_points."""
+    if not max_points:
+        return None
+    # Downsampling keeps up to four states per bucket
+    bucket_size = (end_time - start_time).total_seconds() * 4 / max_points
+    return bucket_size if bucket_size > 0 else None
+
+
+def _downsample_states(
+    states: Mapping[str, Sequence[Any]], bucket_size: float | None
+) -> None:
+    """Downsample numeric states in place for graphs that cannot show every state.
+
+    Only the columnar states returned by the recorder can be downsampled,
+    any other states are sent unchanged.
+    """
+    if bucket_size is None:
+        return
+    for state_list in states.values():
+        if isinstance(state_list, CompressedStates):
+            state_list.downsample(bucket_size)
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
@@ -72,25 +120,23 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    bucket_size: float | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
-    return JSON_DUMP(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = history.get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
     )
+    _downsample_states(states, bucket_size)
+    return JSON_DUMP(messages.result_message(msg_id, _states_to_json_ready(states)))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +149,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -154,6 +201,9 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    bucket_size = _downsample_bucket_size(
+        start_time, end_time or dt_util.utcnow(), msg.get("max_points")
+    )
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -167,6 +217,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            bucket_size,
         )
     )
 
@@ -200,12 +251,15 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: MutableMapping[str, list[dict[str, Any]]],
+    states: Mapping[str, Sequence[dict[str, Any]]],
 ) -> str:
     """Generate a websocket response."""
     return JSON_DUMP(
         messages.event_message(
-            msg_id, _generate_stream_message(states, start_time, end_time)
+            msg_id,
+            _generate_stream_message(
+                _states_to_json_ready(states), start_time, end_time
+            ),
         )
     )
 
@@ -221,10 +275,11 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    bucket_size: float | None,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
     states = cast(
-        MutableMapping[str, list[dict[str, Any]]],
+        MutableMapping[str, Sequence[dict[str, Any]]],
         history.get_significant_states(
             hass,
             start_time,
@@ -238,6 +293,7 @@ def _generate_historical_response(
             True,
         ),
     )
+    _downsample_states(states, bucket_size)
     last_time_ts = 0.0
     for state_list in states.values():
         if (
@@ -276,25 +332,53 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    bucket_size: float | None = None,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    Long time ranges are fetched, serialized and sent in chunks of
+    HISTORY_STREAM_CHUNK_TIME so only a single chunk of states has to
+    be held in memory at a time, and the client can start rendering
+    before the whole range has been fetched.
+
+    When a bucket_size is given numeric states are downsampled into
+    buckets aligned to the epoch so every chunk is downsampled the same.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_time_dt: dt | None = None
+    chunk_start_time = start_time
+    while True:
+        chunk_end_time = min(chunk_start_time + HISTORY_STREAM_CHUNK_TIME, end_time)
+        is_last_chunk = chunk_end_time >= end_time
+        (
+            chunk_last_time_ts,
+            chunk_last_time_dt,
+            payload,
+        ) = await instance.async_add_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start_time,
+            chunk_end_time,
+            entity_ids,
+            include_start_time_state and chunk_start_time == start_time,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty and is_last_chunk and last_time_dt is None,
+            bucket_size,
+        )
+        if payload:
+            connection.send_message(payload)
+        if chunk_last_time_ts != 0:
+            last_time_dt = chunk_last_time_dt
+        if is_last_chunk or msg_id not in connection.subscriptions:
+            # Done, or the client unsubscribed while we were sending
+            return last_time_dt
+        # The start time is exclusive and the end time is not included
+        # in the query so we start the next chunk just before the end
+        # of this one to avoid missing a state on the boundary.
+        chunk_start_time = chunk_end_time - timedelta(microseconds=1)
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -405,6 +489,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.async_response
@@ -444,6 +529,9 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    bucket_size = _downsample_bucket_size(
+        start_time, end_time or utc_now, msg.get("max_points")
+    )
 
     if end_time and end_time <= utc_now:
         if (
@@ -470,6 +558,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            bucket_size,
         )
         return
 
@@ -534,6 +623,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        bucket_size,
     )
 
     if msg_id not in connection.subscriptions:
@@ -575,4 +665,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        bucket_size=bucket_size,
     )
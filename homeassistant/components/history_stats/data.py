@@ -3,8 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import datetime
+from typing import cast
 
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.models import CompressedStates
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.template import Template
@@ -145,30 +147,38 @@ class HistoryStats:
     ) -> None:
         """Update history data for the current period from the database."""
         instance = get_instance(self.hass)
-        states = await instance.async_add_executor_job(
+        self._history_current_period = await instance.async_add_executor_job(
             self._state_changes_during_period,
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
 
     def _state_changes_during_period(
         self, start_ts: float, end_ts: float
-    ) -> list[State]:
+    ) -> list[HistoryState]:
         """Return state changes during a period."""
         start = dt_util.utc_from_timestamp(start_ts)
         end = dt_util.utc_from_timestamp(end_ts)
-        return history.state_changes_during_period(
+        states = history.state_changes_during_period(
             self.hass,
             start,
             end,
             self.entity_id,
             include_start_time_state=True,
             no_attributes=True,
+            columnar=True,
         ).get(self.entity_id, [])
+        if isinstance(states, CompressedStates):
+            # Read the columns directly instead of creating a State per row
+            return [
+                HistoryState(state or "", last_changed_ts)
+                for state, last_changed_ts in states.state_changes()
+            ]
+        # The legacy schema returns State objects without columnar support
+        return [
+            HistoryState(state.state, state.last_changed.timestamp())
+            for state in cast(list[State], states)
+        ]
 
     def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
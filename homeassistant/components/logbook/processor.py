@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Generator, Sequence
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 import logging
 from typing import Any
@@ -81,6 +81,7 @@ class LogbookRun:
     include_entity_name: bool
     format_time: Callable[[Row | EventAsRow], Any]
     memoize_new_contexts: bool = True
+    context_augmentation: dict[bytes, dict[str, Any]] = field(default_factory=dict)
 
 
 class EventProcessor:
@@ -133,6 +134,7 @@ class EventProcessor:
         """
         self.logbook_run.event_cache.clear()
         self.logbook_run.context_lookup.clear()
+        self.logbook_run.context_augmentation.clear()
         self.logbook_run.memoize_new_contexts = False
 
     def get_events(
@@ -166,7 +168,13 @@ class EventProcessor:
                 self.context_id,
             )
             return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+                execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    dt_util.as_utc(start_day),
+                    dt_util.as_utc(end_day),
+                    orm_rows=False,
+                )
             )
 
     def humanify(
@@ -200,6 +208,7 @@ def _humanify(
     format_time = logbook_run.format_time
     memoize_new_contexts = logbook_run.memoize_new_contexts
     memoize_context = context_lookup.setdefault
+    augment = context_augmenter.augment
 
     # Process rows
     for row in rows:
@@ -234,7 +243,7 @@ def _humanify(
             if icon := row.icon:
                 data[LOGBOOK_ENTRY_ICON] = icon
 
-            context_augmenter.augment(data, row, context_id_bin)
+            augment(data, row, context_id_bin)
             yield data
 
         elif event_type in external_events:
@@ -248,7 +257,7 @@ def _humanify(
                 continue
             data[LOGBOOK_ENTRY_WHEN] = format_time(row)
             data[LOGBOOK_ENTRY_DOMAIN] = domain
-            context_augmenter.augment(data, row, context_id_bin)
+            augment(data, row, context_id_bin)
             yield data
 
         elif event_type == EVENT_LOGBOOK_ENTRY:
@@ -267,7 +276,7 @@ def _humanify(
                 LOGBOOK_ENTRY_DOMAIN: entry_domain,
                 LOGBOOK_ENTRY_ENTITY_ID: entry_entity_id,
             }
-            context_augmenter.augment(data, row, context_id_bin)
+            augment(data, row, context_id_bin)
             yield data
 
 
@@ -276,7 +285,9 @@ class ContextAugmenter:
 
     def __init__(self, logbook_run: LogbookRun) -> None:
         """Init the augmenter."""
+        self.logbook_run = logbook_run
         self.context_lookup = logbook_run.context_lookup
+        self.context_augmentation = logbook_run.context_augmentation
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
@@ -303,6 +314,14 @@ class ContextAugmenter:
         if context_user_id_bin := row.context_user_id_bin:
             data[CONTEXT_USER_ID] = bytes_to_uuid_hex_or_none(context_user_id_bin)
 
+        # Every row after the first one in a context is augmented with the
+        # same data so it is only described once per context.
+        if context_id_bin is not None and (
+            context_data := self.context_augmentation.get(context_id_bin)
+        ):
+            data.update(context_data)
+            return
+
         if not (context_row := self._get_context_row(context_id_bin, row)):
             return
 
@@ -324,6 +343,21 @@ class ContextAugmenter:
             # this log entry.
             if _rows_match(row, context_row):
                 return
+            data.update(self._describe_context_row(context_row))
+            return
+
+        context_data = self._describe_context_row(context_row)
+        if (
+            context_id_bin is not None
+            and context_data
+            and self.logbook_run.memoize_new_contexts
+        ):
+            self.context_augmentation[context_id_bin] = context_data
+        data.update(context_data)
+
+    def _describe_context_row(self, context_row: Row | EventAsRow) -> dict[str, Any]:
+        """Describe the row that started a context."""
+        data: dict[str, Any] = {}
         event_type = context_row.event_type
         # State change
         if context_entity_id := context_row.entity_id:
@@ -333,7 +367,7 @@ class ContextAugmenter:
                 data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(
                     context_entity_id
                 )
-            return
+            return data
 
         # Call service
         if event_type == EVENT_CALL_SERVICE:
@@ -342,10 +376,10 @@ class ContextAugmenter:
             data[CONTEXT_DOMAIN] = event_data.get(ATTR_DOMAIN)
             data[CONTEXT_SERVICE] = event_data.get(ATTR_SERVICE)
             data[CONTEXT_EVENT_TYPE] = event_type
-            return
+            return data
 
         if event_type not in self.external_events:
-            return
+            return data
 
         domain, describe_event = self.external_events[event_type]
         data[CONTEXT_EVENT_TYPE] = event_type
@@ -355,7 +389,7 @@ class ContextAugmenter:
             described = describe_event(event)
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error with %s describe event for %s", domain, event_type)
-            return
+            return data
         if name := described.get(LOGBOOK_ENTRY_NAME):
             data[CONTEXT_NAME] = name
         if message := described.get(LOGBOOK_ENTRY_MESSAGE):
@@ -364,10 +398,11 @@ class ContextAugmenter:
         if source := described.get(LOGBOOK_ENTRY_SOURCE):
             data[CONTEXT_SOURCE] = source
         if not (attr_entity_id := described.get(LOGBOOK_ENTRY_ENTITY_ID)):
-            return
+            return data
         data[CONTEXT_ENTITY_ID] = attr_entity_id
         if self.include_entity_name:
             data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
+        return data
 
 
 def _rows_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
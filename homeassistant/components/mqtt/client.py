@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 from dataclasses import dataclass
 from functools import lru_cache
 from itertools import chain, groupby
@@ -93,6 +94,9 @@ INITIAL_SUBSCRIBE_COOLDOWN = 1.0
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+# Maximum number of received messages handled in one event loop iteration
+MAX_MESSAGES_PER_BATCH = 500
 
 MQTT_ENTRIES_NAMING_BLOG_URL = (
     "https://developers.home-assistant.io/blog/2023-057-21-change-naming-mqtt-entities/"
@@ -232,12 +236,100 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """Node of the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Trie of wildcard subscriptions keyed by topic level.
+
+    Matching a topic walks the trie one topic level at a time,
+    so the cost depends on the depth of the topic and not on
+    the number of subscriptions.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._filters: dict[str, list[Subscription]] = {}
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if there is a subscription for the topic filter."""
+        return topic_filter in self._filters
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over the subscriptions."""
+        return chain.from_iterable(self._filters.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._filters[subscription.topic] = node.subscriptions
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError or ValueError if the subscription is not in the trie.
+        """
+        topic_filter = subscription.topic
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        if node.subscriptions:
+            return
+        del self._filters[topic_filter]
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a filter matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level must not match topics
+        # starting with $, see section 4.7.2 of the MQTT specification.
+        system_topic = topic.startswith("$")
+        matches: list[Subscription] = []
+        stack: list[tuple[_SubscriptionTrieNode, int]] = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            wildcards = idx > 0 or not system_topic
+            # A multi-level wildcard also matches the parent level
+            if wildcards and (child := children.get("#")) is not None:
+                matches.extend(child.subscriptions)
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                stack.append((child, idx + 1))
+            if wildcards and (child := children.get("+")) is not None:
+                stack.append((child, idx + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -396,7 +488,7 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -418,6 +510,12 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Messages received by the paho thread which are waiting
+        # to be handled in the event loop
+        self._received_messages: deque[mqtt.MQTTMessage] = deque()
+        self._received_messages_scheduled = False
+        self.received_messages_backlog_max = 0
+        self.received_messages_deferred_batches = 0
 
         if self.hass.state == CoreState.running:
             self._ha_started.set()
@@ -499,8 +597,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -596,7 +694,7 @@ class MQTT:
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -649,9 +747,7 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -822,16 +918,46 @@ class MQTT:
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
         """Message received callback."""
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        # deque.append is thread-safe, the event loop is only woken up
+        # when there is no pending call to handle the received messages.
+        self._received_messages.append(msg)
+        if not self._received_messages_scheduled:
+            self._received_messages_scheduled = True
+            self.loop.call_soon_threadsafe(self._mqtt_handle_received_messages)
+
+    @callback
+    def _mqtt_handle_received_messages(self) -> None:
+        """Handle a batch of messages received by the paho thread.
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+        At most MAX_MESSAGES_PER_BATCH messages are handled per call
+        so other tasks are not starved during a flood of messages,
+        for example retained messages after reconnecting.
+        """
+        received_messages = self._received_messages
+        # Clear the flag before reading the backlog, messages received
+        # after this point will schedule a new call.
+        self._received_messages_scheduled = False
+        if (backlog := len(received_messages)) > self.received_messages_backlog_max:
+            self.received_messages_backlog_max = backlog
+        if backlog > MAX_MESSAGES_PER_BATCH:
+            backlog = MAX_MESSAGES_PER_BATCH
+            self.received_messages_deferred_batches += 1
+        try:
+            for _ in range(backlog):
+                self._mqtt_handle_message(received_messages.popleft())
+        finally:
+            # Handle the rest of the messages in the next call, also when
+            # handling a message raised. Racing the paho thread may schedule
+            # a spare call which finds no messages.
+            if received_messages and not self._received_messages_scheduled:
+                self._received_messages_scheduled = True
+                self.loop.call_soon(self._mqtt_handle_received_messages)
+
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        subscriptions = self._wildcard_subscriptions.match(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+            subscriptions[0:0] = self._simple_subscriptions[topic]
         return subscriptions
 
     @callback
@@ -976,13 +1102,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -53,6 +53,10 @@ def _async_get_diagnostics(
     data = {
         "connected": is_connected(hass),
         "mqtt_config": redacted_config,
+        "received_messages": {
+            "backlog_max": mqtt_instance.received_messages_backlog_max,
+            "deferred_batches": mqtt_instance.received_messages_deferred_batches,
+        },
     }
 
     if device:
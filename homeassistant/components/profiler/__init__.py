@@ -21,7 +21,13 @@ from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import save_json
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.setup import (
+    DATA_SETUP_SPANS,
+    SetupSpan,
+    async_get_setup_critical_path,
+)
 
 from .const import DOMAIN
 
@@ -35,6 +41,7 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_DUMP_STARTUP_TRACE = "dump_startup_trace"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -46,6 +53,7 @@ _KNOWN_LRU_CLASSES = (
     "StateAttributesManager",
     "StatisticsMetaManager",
     "IntegrationMatcher",
+    "TemplateEnvironment",
 )
 
 SERVICES = (
@@ -57,6 +65,7 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_DUMP_STARTUP_TRACE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -254,6 +263,10 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    async def _async_dump_startup_trace(call: ServiceCall) -> None:
+        """Write the startup trace."""
+        await _async_generate_startup_trace(hass)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,6 +361,13 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_STARTUP_TRACE,
+        _async_dump_startup_trace,
+    )
+
     return True
 
 
@@ -429,6 +449,79 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
     )
 
 
+async def _async_generate_startup_trace(hass: HomeAssistant) -> None:
+    """Write how integrations were set up during startup as a Chrome trace."""
+    spans: list[SetupSpan] | None = hass.data.get(DATA_SETUP_SPANS)
+    if not spans:
+        raise HomeAssistantError("No setup of integrations was recorded at startup")
+
+    start_time = int(time.time() * 1000000)
+    trace_path = hass.config.path(f"startup_trace.{start_time}.json")
+    critical_path = async_get_setup_critical_path(spans)
+    await hass.async_add_executor_job(
+        _write_startup_trace, list(spans), critical_path, trace_path
+    )
+    persistent_notification.async_create(
+        hass,
+        (
+            f"Wrote the startup trace to {trace_path}, open it with"
+            " https://ui.perfetto.dev or chrome://tracing. Startup waited on:"
+            f" {' -> '.join(critical_path)}"
+        ),
+        title="Startup Trace",
+        notification_id=f"profiler_startup_trace_{start_time}",
+    )
+
+
+def _write_startup_trace(
+    spans: list[SetupSpan], critical_path: list[str], trace_path: str
+) -> None:
+    """Write setup spans in the Chrome trace event format.
+
+    Each integration gets its own track and the spans of its platforms
+    are shown on the track of the integration providing them.
+    """
+    trace_start = min(span.start for span in spans)
+    tracks: dict[str, int] = {}
+    events: list[dict[str, Any]] = []
+    for span in sorted(spans, key=lambda span: span.start):
+        integration = span.name.partition(".")[0]
+        if (track := tracks.get(integration)) is None:
+            track = tracks[integration] = len(tracks) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": track,
+                    "args": {"name": integration},
+                }
+            )
+        args: dict[str, Any] = {"critical_path": integration in critical_path}
+        if span.waits_on:
+            args["waits_on"] = list(span.waits_on)
+        events.append(
+            {
+                "name": f"{span.name} {span.phase}",
+                "cat": span.phase,
+                "ph": "X",
+                "pid": 1,
+                "tid": track,
+                "ts": round((span.start - trace_start) * 1000000),
+                "dur": round((span.end - span.start) * 1000000),
+                "args": args,
+            }
+        )
+    save_json(
+        trace_path,
+        {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"critical_path": critical_path},
+        },
+    )
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
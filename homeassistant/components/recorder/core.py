@@ -39,6 +39,7 @@ from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from . import migration, statistics
 from .const import (
@@ -79,6 +80,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .spool import SPOOL_DIR, RecorderSpool, encode_event
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -89,7 +91,7 @@ from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingState, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -111,6 +113,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    SpoolReplayTask,
     StatesContextIDMigrationTask,
     StatisticsTask,
     StopTask,
@@ -153,6 +156,12 @@ ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
+# Start spooling events to disk once the backlog reaches this
+# percentage of the maximum and return to the in memory queue
+# once the backlog drops below the resume percentage
+SPOOL_BACKLOG_PERCENTAGE = 50
+SPOOL_RESUME_BACKLOG_PERCENTAGE = 10
+
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -190,6 +199,7 @@ class Recorder(threading.Thread):
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
+        self._spool = RecorderSpool(hass.config.path(SPOOL_DIR))
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -305,8 +315,7 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
-        event_task = EventTask
+        queue_event = self._async_queue_event
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -315,23 +324,23 @@ class Recorder(threading.Thread):
                 return
 
             if (entity_id := event.data.get(ATTR_ENTITY_ID)) is None:
-                queue_put(event_task(event))
+                queue_event(event)
                 return
 
             if isinstance(entity_id, str):
                 if entity_filter(entity_id):
-                    queue_put(event_task(event))
+                    queue_event(event)
                 return
 
             if isinstance(entity_id, list):
                 for eid in entity_id:
                     if entity_filter(eid):
-                        queue_put(event_task(event))
+                        queue_event(event)
                         return
                 return
 
             # Unknown what it is.
-            queue_put(event_task(event))
+            queue_event(event)
 
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL,
@@ -341,10 +350,41 @@ class Recorder(threading.Thread):
         self._queue_watcher = async_track_time_interval(
             self.hass,
             self._async_check_queue,
-            timedelta(minutes=10),
+            timedelta(minutes=1),
             name="Recorder queue watcher",
         )
 
+    @callback
+    def _async_queue_event(self, event: Event) -> None:
+        """Queue an event or spool it to disk while the recorder is behind."""
+        spool = self._spool
+        if not spool.active:
+            self._queue.put_nowait(EventTask(event))
+            return
+        try:
+            record = encode_event(event)
+        except JSON_ENCODE_EXCEPTIONS as ex:
+            # The recorder would not be able to write this event either
+            _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+            return
+        if segment_id := spool.async_append(record):
+            self.hass.async_add_executor_job(spool.write_segment, segment_id)
+        if spool.full:
+            self._async_stop_spooling()
+
+    @callback
+    def _async_stop_spooling(self) -> None:
+        """Stop spooling events and queue the spooled events for replay.
+
+        New events go to the queue again behind the replay task
+        so they are still recorded in the order they were fired.
+        """
+        _LOGGER.info(
+            "Recorder caught up; replaying spooled events (%s spooled in total)",
+            self._spool.events_spooled,
+        )
+        self._queue.put_nowait(SpoolReplayTask(self._spool.async_stop()))
+
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
         """Queue a keep alive."""
@@ -383,6 +423,24 @@ class Recorder(threading.Thread):
         """
         size = self.backlog
         _LOGGER.debug("Recorder queue size is: %s", size)
+        spool = self._spool
+        if spool.active:
+            if not self._reached_max_backlog_percentage(
+                SPOOL_RESUME_BACKLOG_PERCENTAGE
+            ):
+                self._async_stop_spooling()
+        elif not spool.full and self._reached_max_backlog_percentage(
+            SPOOL_BACKLOG_PERCENTAGE
+        ):
+            _LOGGER.warning(
+                (
+                    "The recorder backlog queue reached %s events; new events "
+                    "will be spooled to disk until the recorder catches up"
+                ),
+                size,
+            )
+            spool.async_start()
+            return
         if not self._reached_max_backlog_percentage(100):
             return
         _LOGGER.error(
@@ -456,6 +514,12 @@ class Recorder(threading.Thread):
         # We drain all the events in the queue and then insert
         # an empty one to ensure the next thing the recorder sees
         # is a request to shutdown.
+        #
+        # Events that were spooled are written to disk instead
+        # so they can be replayed on the next start.
+        if self._spool.active:
+            self._spool.async_stop()
+        await self.hass.async_add_executor_job(self._spool.write_pending)
         while True:
             try:
                 self._queue.get_nowait()
@@ -857,6 +921,9 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        # Replay events spooled by the previous run before any
+        # of the events that were fired since this run started
+        self._replay_spool(self._spool.created_segment_id)
         startup_tasks: list[RecorderTask] = []
         while not queue_.empty() and (task := queue_.get_nowait()):
             startup_tasks.append(task)
@@ -894,6 +961,39 @@ class Recorder(threading.Thread):
         self.states_meta_manager.load(state_change_events, session)
         self.state_attributes_manager.load(state_change_events, session)
 
+    def _replay_spool(self, last_segment_id: int) -> None:
+        """Replay the spooled events up to and including the last segment."""
+        spool = self._spool
+        start = time.monotonic()
+        replayed = 0
+        for segment_id in spool.segments(last_segment_id):
+            try:
+                events = spool.read_segment(segment_id)
+            except (OSError, ValueError) as err:
+                _LOGGER.error(
+                    "Discarding unreadable recorder spool segment %s: %s",
+                    segment_id,
+                    err,
+                )
+                spool.remove_segment(segment_id, 0)
+                continue
+            for event in events:
+                self._process_one_event(event)
+            # Commit before the segment is removed so the events
+            # are never lost if the database goes away again
+            self._commit_event_session_or_retry()
+            spool.remove_segment(segment_id, len(events))
+            replayed += len(events)
+        if not replayed:
+            return
+        elapsed = time.monotonic() - start
+        _LOGGER.info(
+            "Replayed %s spooled events in %.2f seconds (%.0f events/second)",
+            replayed,
+            elapsed,
+            replayed / elapsed if elapsed else replayed,
+        )
+
     def _guarded_process_one_task_or_recover(self, task: RecorderTask) -> None:
         """Process a task, guarding against exceptions to ensure the loop does not collapse."""
         _LOGGER.debug("Processing task: %s", task)
@@ -1053,44 +1153,52 @@ class Recorder(threading.Thread):
         # Map the event data to the EventData table
         shared_data = shared_data_bytes.decode("utf-8")
         # Matching attributes found in the pending commit
+        time_fired_ts = dt_util.utc_to_timestamp(event.time_fired)
         if pending_event_data := event_data_manager.get_pending(shared_data):
             dbevent.event_data_rel = pending_event_data
+            event_data_manager.mark_pending_used(shared_data, time_fired_ts)
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            event_data_manager.mark_used(data_id, time_fired_ts)
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
             event_data_manager.add_pending(dbevent_data)
+            event_data_manager.mark_pending_used(shared_data, time_fired_ts)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
         self._add_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
-        """Process a state_changed event into the session."""
+        """Process a state_changed event into the session.
+
+        The states row itself is not added to the session as an ORM object.
+        It is queued as a PendingState and inserted in bulk when the
+        session is committed.
+        """
         state_attributes_manager = self.state_attributes_manager
         states_meta_manager = self.states_meta_manager
         entity_removed = not event.data.get("new_state")
         entity_id = event.data["entity_id"]
 
-        dbstate = States.from_event(event)
+        params = States.params_from_event(event)
+        pending_state = PendingState(params)
 
         states_manager = self.states_manager
         if old_state := states_manager.pop_pending(entity_id):
-            dbstate.old_state = old_state
+            pending_state.link_old_state(old_state)
         elif old_state_id := states_manager.pop_committed(entity_id):
-            dbstate.old_state_id = old_state_id
+            params["old_state_id"] = old_state_id
         if entity_removed:
-            dbstate.state = None
-        else:
-            states_manager.add_pending(entity_id, dbstate)
+            params["state"] = None
 
         if states_meta_manager.active:
-            dbstate.entity_id = None
+            params["entity_id"] = None
 
         if entity_id is None or not (
             shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
@@ -1101,9 +1209,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         # Map the entity_id to the StatesMeta table
         if pending_states_meta := states_meta_manager.get_pending(entity_id):
-            dbstate.states_meta_rel = pending_states_meta
+            pending_state.states_meta = pending_states_meta
         elif metadata_id := states_meta_manager.get(entity_id, session, True):
-            dbstate.metadata_id = metadata_id
+            params["metadata_id"] = metadata_id
         elif states_meta_manager.active and entity_removed:
             # If the entity was removed, we don't need to add it to the
             # StatesMeta table or record it in the pending commit
@@ -1114,14 +1222,18 @@ class Recorder(threading.Thread):
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
             self._add_to_session(session, states_meta)
-            dbstate.states_meta_rel = states_meta
+            pending_state.states_meta = states_meta
 
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
-        dbstate.attributes = None
+        if new_state := event.data.get("new_state"):
+            last_updated_ts = dt_util.utc_to_timestamp(new_state.last_updated)
+        else:
+            last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
-            dbstate.state_attributes = pending_event_data
+            pending_state.state_attributes = pending_event_data
+            state_attributes_manager.mark_pending_used(shared_attrs, last_updated_ts)
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
@@ -1133,15 +1245,20 @@ class Recorder(threading.Thread):
                 )
             )
         ):
-            dbstate.attributes_id = attributes_id
+            params["attributes_id"] = attributes_id
+            state_attributes_manager.mark_used(attributes_id, last_updated_ts)
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
+            state_attributes_manager.mark_pending_used(shared_attrs, last_updated_ts)
             self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
+            pending_state.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if not entity_removed:
+            states_manager.add_pending(entity_id, pending_state)
+        states_manager.queue(pending_state)
+        self._event_session_has_pending_writes = True
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1180,6 +1297,12 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        states_manager = self.states_manager
+        if states_manager.has_queued:
+            # Flush first so the ids of any new StatesMeta and
+            # StateAttributes are known before the states are inserted
+            session.flush()
+            states_manager.insert_queued(session, States)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1239,6 +1362,13 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        sqlalchemy_event.listen(
+            self.event_session, "after_rollback", self._event_session_rolled_back
+        )
+
+    def _event_session_rolled_back(self, session: Session) -> None:
+        """Insert the queued states again after the transaction is rolled back."""
+        self.states_manager.rollback_queued()
 
     def _post_schema_migration(self, old_version: int, new_version: int) -> None:
         """Run post schema migration tasks."""
@@ -1357,6 +1487,8 @@ class Recorder(threading.Thread):
             self.engine.dialect.name,
             dbapi_connection,
             not self._completed_first_database_setup,
+            isinstance(self.engine.pool, RecorderPool)
+            and threading.current_thread().name.startswith(DB_WORKER_PREFIX),
         ):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
@@ -68,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 42
+SCHEMA_VERSION = 43
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +84,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
 
@@ -105,6 +107,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -477,36 +481,47 @@ class States(Base):
     @staticmethod
     def from_event(event: Event) -> States:
         """Create object from a state_changed event."""
-        entity_id = event.data["entity_id"]
+        return States(**States.params_from_event(event))
+
+    @staticmethod
+    def params_from_event(event: Event) -> dict[str, Any]:
+        """Create the insert parameters for a row from a state_changed event.
+
+        The returned dict always contains the same keys so it can be
+        used as one of the parameter sets of an executemany INSERT.
+        """
         state: State | None = event.data.get("new_state")
-        dbstate = States(
-            entity_id=entity_id,
-            attributes=None,
-            context_id=None,
-            context_id_bin=ulid_to_bytes_or_none(event.context.id),
-            context_user_id=None,
-            context_user_id_bin=uuid_hex_to_bytes_or_none(event.context.user_id),
-            context_parent_id=None,
-            context_parent_id_bin=ulid_to_bytes_or_none(event.context.parent_id),
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-            last_updated=None,
-            last_changed=None,
-        )
+        params: dict[str, Any] = {
+            "entity_id": event.data["entity_id"],
+            "attributes": None,
+            "context_id": None,
+            "context_id_bin": ulid_to_bytes_or_none(event.context.id),
+            "context_user_id": None,
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(event.context.user_id),
+            "context_parent_id": None,
+            "context_parent_id_bin": ulid_to_bytes_or_none(event.context.parent_id),
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "last_updated": None,
+            "last_changed": None,
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+        }
         # None state means the state was removed from the state machine
         if state is None:
-            dbstate.state = ""
-            dbstate.last_updated_ts = dt_util.utc_to_timestamp(event.time_fired)
-            dbstate.last_changed_ts = None
-            return dbstate
+            params["state"] = ""
+            params["last_updated_ts"] = dt_util.utc_to_timestamp(event.time_fired)
+            params["last_changed_ts"] = None
+            return params
 
-        dbstate.state = state.state
-        dbstate.last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+        params["state"] = state.state
+        params["last_updated_ts"] = dt_util.utc_to_timestamp(state.last_updated)
         if state.last_updated == state.last_changed:
-            dbstate.last_changed_ts = None
+            params["last_changed_ts"] = None
         else:
-            dbstate.last_changed_ts = dt_util.utc_to_timestamp(state.last_changed)
+            params["last_changed_ts"] = dt_util.utc_to_timestamp(state.last_changed)
 
-        return dbstate
+        return params
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
@@ -719,6 +734,46 @@ class StatisticsShortTerm(Base, StatisticsBase):
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsDaily(Base, StatisticsBase):
+    """Long term statistics reduced per local day.
+
+    Maintained from the hourly statistics when a day has ended.
+    """
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsBase):
+    """Long term statistics reduced per local month.
+
+    Maintained from the hourly statistics when a month has ended.
+    """
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticsMeta(Base):
     """Statistics meta data."""
 
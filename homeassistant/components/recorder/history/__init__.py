@@ -1,9 +1,9 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal, overload
 
 from sqlalchemy.orm.session import Session
 
@@ -91,7 +91,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
     """Return a dict of significant states during a time period."""
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
@@ -127,7 +127,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
     """Return a dict of significant states during a time period."""
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
@@ -152,6 +152,7 @@ def get_significant_states_with_session(
     )
 
 
+@overload
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -161,17 +162,59 @@ def state_changes_during_period(
     descending: bool = False,
     limit: int | None = None,
     include_start_time_state: bool = True,
+    columnar: Literal[False] = False,
 ) -> MutableMapping[str, list[State]]:
-    """Return a list of states that changed during a time period."""
+    ...
+
+
+@overload
+def state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+    *,
+    columnar: Literal[True],
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
+    ...
+
+
+def state_changes_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_id: str | None = None,
+    no_attributes: bool = False,
+    descending: bool = False,
+    limit: int | None = None,
+    include_start_time_state: bool = True,
+    columnar: bool = False,
+) -> MutableMapping[str, list[State]] | MutableMapping[str, Sequence[State | dict[str, Any]]]:
+    """Return a list of states that changed during a time period.
+
+    With columnar the states are returned as CompressedStates if the
+    database schema supports it, otherwise as a list of State objects.
+    """
     if not recorder.get_instance(hass).states_meta_manager.active:
         from .legacy import (  # pylint: disable=import-outside-toplevel
             state_changes_during_period as _legacy_state_changes_during_period,
         )
 
-        _target = _legacy_state_changes_during_period
-    else:
-        _target = _modern_state_changes_during_period
-    return _target(
+        return _legacy_state_changes_during_period(
+            hass,
+            start_time,
+            end_time,
+            entity_id,
+            no_attributes,
+            descending,
+            limit,
+            include_start_time_state,
+        )
+    return _modern_state_changes_during_period(
         hass,
         start_time,
         end_time,
@@ -180,4 +223,5 @@ def state_changes_during_period(
         descending,
         limit,
         include_start_time_state,
+        columnar,
     )
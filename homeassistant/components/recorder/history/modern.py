@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from collections.abc import Iterable, Iterator, MutableMapping, Sequence
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -21,7 +21,6 @@ from sqlalchemy import (
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -29,11 +28,11 @@ from ... import recorder
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
+    CompressedStates,
     LazyState,
     datetime_to_timestamp_or_none,
     extract_metadata_ids,
     process_timestamp,
-    row_to_compressed_state,
 )
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
@@ -102,7 +101,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
         return get_significant_states_with_session(
@@ -195,7 +194,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
     entity_ids is an optional iterable of entities to include in the results.
@@ -367,8 +366,12 @@ def state_changes_during_period(
     descending: bool = False,
     limit: int | None = None,
     include_start_time_state: bool = True,
-) -> MutableMapping[str, list[State]]:
-    """Return states changes during UTC period start_time - end_time."""
+    columnar: bool = False,
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    With columnar the states of the entity are returned as CompressedStates.
+    """
     if not entity_id:
         raise ValueError("entity_id must be provided")
     entity_ids = [entity_id.lower()]
@@ -409,18 +412,14 @@ def state_changes_during_period(
                 include_start_time_state,
             ],
         )
-        return cast(
-            MutableMapping[str, list[State]],
-            _sorted_states_to_dict(
-                execute_stmt_lambda_element(
-                    session, stmt, None, end_time, orm_rows=False
-                ),
-                start_time_ts if include_start_time_state else None,
-                entity_ids,
-                entity_id_to_metadata_id,
-                descending=descending,
-                no_attributes=no_attributes,
-            ),
+        return _sorted_states_to_dict(
+            execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+            start_time_ts if include_start_time_state else None,
+            entity_ids,
+            entity_id_to_metadata_id,
+            compressed_state_format=columnar,
+            descending=descending,
+            no_attributes=no_attributes,
         )
 
 
@@ -633,6 +632,99 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def _group_states_by_metadata_id(
+    states: Iterable[Row],
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+) -> Iterable[tuple[int, Iterator[Row]]]:
+    """Group rows sorted by metadata_id by their metadata_id."""
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        return ((metadata_id, iter(states)),)
+    return groupby(states, itemgetter(_FIELD_MAP["metadata_id"]))
+
+
+def _sorted_states_to_compressed_states(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    descending: bool,
+    no_attributes: bool,
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
+    """Convert SQL results into the compressed states of each entity.
+
+    The rows are appended straight to the columns of a CompressedStates
+    for each entity so no dict is created per row.
+
+    States must be sorted by entity_id and last_updated
+    """
+    result: dict[str, CompressedStates] = {
+        entity_id: CompressedStates() for entity_id in entity_ids
+    }
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+
+    for metadata_id, group in _group_states_by_metadata_id(
+        states, entity_ids, entity_id_to_metadata_id
+    ):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        ent_results = result[entity_id]
+        append_row = ent_results.append_row
+        if (
+            not minimal_response
+            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        ):
+            for db_state in group:
+                append_row(
+                    db_state,
+                    attr_cache,
+                    start_time_ts,
+                    entity_id,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
+                )
+            continue
+
+        prev_state: str | None = None
+        # With minimal response only the first state has attributes,
+        # the states in-between only have the "state" and "last_updated"
+        # and duplicate states are filtered out.
+        if not ent_results:
+            if (first_state := next(group, None)) is None:
+                continue
+            prev_state = first_state[state_idx]
+            append_row(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
+            )
+
+        append_state = ent_results.append_state
+        for row in group:
+            if (state := row[state_idx]) != prev_state:
+                append_state(state, row[last_updated_ts_idx])
+                prev_state = state
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty results if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
@@ -642,31 +734,35 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
-) -> MutableMapping[str, list[State | dict[str, Any]]]:
+) -> MutableMapping[str, Sequence[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
     This takes our state list and turns it into a JSON friendly data
     structure {'entity_id': [list of states], 'entity_id2': [list of states]}
 
+    With compressed_state_format the states of each entity are
+    returned as CompressedStates, a sequence of compressed state dicts.
+
     States must be sorted by entity_id and last_updated
 
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    field_map = _FIELD_MAP
-    state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
-        State | dict[str, Any],
-    ]
     if compressed_state_format:
-        state_class = row_to_compressed_state
-        attr_time = COMPRESSED_STATE_LAST_UPDATED
-        attr_state = COMPRESSED_STATE_STATE
-    else:
-        state_class = LazyState
-        attr_time = LAST_CHANGED_KEY
-        attr_state = STATE_KEY
+        return _sorted_states_to_compressed_states(
+            states,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            descending,
+            no_attributes,
+        )
+
+    field_map = _FIELD_MAP
+    attr_time = LAST_CHANGED_KEY
+    attr_state = STATE_KEY
 
     # Set all entity IDs to empty lists in result set to maintain the order
     result: dict[str, list[State | dict[str, Any]]] = {
@@ -677,15 +773,9 @@ def _sorted_states_to_dict(
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
     }
     # Get the states at the start time
-    if len(entity_ids) == 1:
-        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
-        assert metadata_id is not None  # should not be possible if we got here
-        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
-            (metadata_id, iter(states)),
-        )
-    else:
-        key_func = itemgetter(field_map["metadata_id"])
-        states_iter = groupby(states, key_func)
+    states_iter = _group_states_by_metadata_id(
+        states, entity_ids, entity_id_to_metadata_id
+    )
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
@@ -700,7 +790,7 @@ def _sorted_states_to_dict(
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
             ent_results.extend(
-                state_class(
+                LazyState(
                     db_state,
                     attr_cache,
                     start_time_ts,
@@ -723,7 +813,7 @@ def _sorted_states_to_dict(
                 continue
             prev_state = first_state[state_idx]
             ent_results.append(
-                state_class(
+                LazyState(
                     first_state,
                     attr_cache,
                     start_time_ts,
@@ -741,18 +831,7 @@ def _sorted_states_to_dict(
         #
         # With minimal response we do not care about attribute
         # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            )
-            continue
-
+        #
         # Non-compressed state format returns an ISO formatted string
         _utc_from_timestamp = dt_util.utc_from_timestamp
         ent_results.extend(
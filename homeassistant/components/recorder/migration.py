@@ -63,7 +63,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -83,7 +85,7 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import get_start_time, rebuild_statistics_rollups
 from .tasks import (
     CommitTask,
     PostSchemaMigrationTask,
@@ -1061,6 +1063,15 @@ def _apply_update(  # noqa: C901
         _migrate_statistics_columns_to_timestamp_removing_duplicates(
             hass, instance, session_maker, engine
         )
+    elif new_version == 43:
+        # The rollup tables are created by create_all for new databases, they
+        # are missing when migrating a database created with an older schema.
+        #
+        # We need to cast __table__ to Table, explanation in
+        # https://github.com/sqlalchemy/sqlalchemy/issues/9130
+        cast(Table, StatisticsDaily.__table__).create(engine, checkfirst=True)
+        cast(Table, StatisticsMonthly.__table__).create(engine, checkfirst=True)
+        rebuild_statistics_rollups(session_maker)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
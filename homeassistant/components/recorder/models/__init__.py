@@ -9,7 +9,12 @@ from .context import (
 )
 from .database import DatabaseEngine, DatabaseOptimizer, UnsupportedDialect
 from .event import extract_event_type_ids
-from .state import LazyState, extract_metadata_ids, row_to_compressed_state
+from .state import (
+    CompressedStates,
+    LazyState,
+    extract_metadata_ids,
+    row_to_compressed_state,
+)
 from .statistics import (
     CalendarStatisticPeriod,
     FixedStatisticPeriod,
@@ -30,6 +35,7 @@ from .time import (
 
 __all__ = [
     "CalendarStatisticPeriod",
+    "CompressedStates",
     "DatabaseEngine",
     "DatabaseOptimizer",
     "FixedStatisticPeriod",
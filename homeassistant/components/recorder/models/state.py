@@ -1,10 +1,13 @@
 """Models states in for Recorder."""
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 import logging
-from typing import Any
+from typing import Any, overload
 
+import orjson
 from sqlalchemy.engine.row import Row
 
 from homeassistant.const import (
@@ -14,6 +17,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_STATE,
 )
 from homeassistant.core import Context, State
+from homeassistant.helpers.json import json_bytes
 import homeassistant.util.dt as dt_util
 
 from .state_attributes import decode_attributes_from_source
@@ -21,6 +25,12 @@ from .time import process_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of rows serialized at a time by CompressedStates
+_JSON_CHUNK_SIZE = 4096
+
+# Index of a row that has no attributes in CompressedStates
+_NO_ATTRIBUTES = -1
+
 
 def extract_metadata_ids(
     entity_id_to_metadata_id: dict[str, int | None],
@@ -161,3 +171,196 @@ def row_to_compressed_state(
     ):
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
     return comp_state
+
+
+class CompressedStates(Sequence[dict[str, Any]]):
+    """The compressed states of one entity kept in columns.
+
+    A high frequency sensor can have millions of rows in a history
+    request. Instead of one dict per row the states and timestamps are
+    kept in arrays, and the attributes are decoded once and referenced
+    by index. The compressed state dict for a row is only created when
+    the row is accessed.
+    """
+
+    __slots__ = (
+        "_states",
+        "_last_updated_ts",
+        "_last_changed_ts",
+        "_attributes_idx",
+        "_attributes",
+        "_attributes_idx_by_source",
+    )
+
+    def __init__(self) -> None:
+        """Init the compressed states."""
+        self._states: list[str | None] = []
+        self._last_updated_ts = array("d")
+        # 0 when last_changed is the same as last_updated
+        self._last_changed_ts = array("d")
+        self._attributes_idx = array("l")
+        self._attributes: list[dict[str, Any]] = []
+        self._attributes_idx_by_source: dict[Any, int] = {}
+
+    def append_row(
+        self,
+        row: Row,
+        attr_cache: dict[str, dict[str, Any]],
+        start_time_ts: float | None,
+        entity_id: str,
+        state: str,
+        last_updated_ts: float | None,
+        no_attributes: bool,
+    ) -> None:
+        """Append a database row the same way row_to_compressed_state converts it."""
+        attributes_idx = _NO_ATTRIBUTES
+        if not no_attributes:
+            source = getattr(row, "attributes", None)
+            idx_by_source = self._attributes_idx_by_source
+            if source in idx_by_source:
+                attributes_idx = idx_by_source[source]
+            else:
+                attributes_idx = idx_by_source[source] = len(self._attributes)
+                self._attributes.append(
+                    decode_attributes_from_source(source, attr_cache)
+                )
+        row_last_updated_ts: float = last_updated_ts or start_time_ts  # type: ignore[assignment]
+        row_last_changed_ts = getattr(row, "last_changed_ts", None)
+        self._states.append(state)
+        self._last_updated_ts.append(row_last_updated_ts)
+        self._last_changed_ts.append(
+            row_last_changed_ts
+            if row_last_changed_ts and row_last_changed_ts != row_last_updated_ts
+            else 0
+        )
+        self._attributes_idx.append(attributes_idx)
+
+    def append_state(self, state: str | None, last_updated_ts: float) -> None:
+        """Append a state without attributes or last_changed."""
+        self._states.append(state)
+        self._last_updated_ts.append(last_updated_ts)
+        self._last_changed_ts.append(0)
+        self._attributes_idx.append(_NO_ATTRIBUTES)
+
+    def _compressed_state(self, idx: int) -> dict[str, Any]:
+        """Return the compressed state dict for a row."""
+        comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: self._states[idx]}
+        if (attributes_idx := self._attributes_idx[idx]) != _NO_ATTRIBUTES:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = self._attributes[attributes_idx]
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = self._last_updated_ts[idx]
+        if last_changed_ts := self._last_changed_ts[idx]:
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+        return comp_state
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]:
+        ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Return the compressed state of a row or a list of them for a slice."""
+        rows = range(len(self._states))
+        if isinstance(index, slice):
+            return [self._compressed_state(idx) for idx in rows[index]]
+        return self._compressed_state(rows[index])
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._states)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate the compressed states of all rows."""
+        return map(self._compressed_state, range(len(self._states)))
+
+    def reverse(self) -> None:
+        """Reverse the order of the rows in place."""
+        self._states.reverse()
+        self._last_updated_ts.reverse()
+        self._last_changed_ts.reverse()
+        self._attributes_idx.reverse()
+
+    def downsample(self, bucket_size: float) -> None:
+        """Downsample numeric states to at most four rows per time bucket.
+
+        Runs of numeric states are split into buckets of bucket_size
+        seconds and only the first, minimum, maximum and last state of
+        each bucket are kept, which draws the same graph at a width of
+        one pixel per bucket. States that are not numeric are always
+        kept so every transition is still shown exactly.
+        """
+        keep: list[int] = []
+        bucket: int | None = None
+        first_idx = min_idx = max_idx = last_idx = 0
+        min_value = max_value = 0.0
+        for idx, (state, last_updated_ts) in enumerate(
+            zip(self._states, self._last_updated_ts)
+        ):
+            try:
+                value = float(state)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                if bucket is not None:
+                    keep.extend(sorted({first_idx, min_idx, max_idx, last_idx}))
+                    bucket = None
+                keep.append(idx)
+                continue
+            row_bucket = int(last_updated_ts // bucket_size)
+            if row_bucket != bucket:
+                if bucket is not None:
+                    keep.extend(sorted({first_idx, min_idx, max_idx, last_idx}))
+                bucket = row_bucket
+                first_idx = min_idx = max_idx = idx
+                min_value = max_value = value
+            elif value < min_value:
+                min_idx = idx
+                min_value = value
+            elif value > max_value:
+                max_idx = idx
+                max_value = value
+            last_idx = idx
+        if bucket is not None:
+            keep.extend(sorted({first_idx, min_idx, max_idx, last_idx}))
+        if len(keep) == len(self._states):
+            return
+        self._states = [self._states[idx] for idx in keep]
+        self._last_updated_ts = array("d", map(self._last_updated_ts.__getitem__, keep))
+        self._last_changed_ts = array("d", map(self._last_changed_ts.__getitem__, keep))
+        self._attributes_idx = array("l", map(self._attributes_idx.__getitem__, keep))
+
+    def state_changes(self) -> Iterator[tuple[str | None, float]]:
+        """Iterate the state and last_changed timestamp of all rows."""
+        return zip(
+            self._states,
+            (
+                last_changed_ts or last_updated_ts
+                for last_changed_ts, last_updated_ts in zip(
+                    self._last_changed_ts, self._last_updated_ts
+                )
+            ),
+        )
+
+    def json_fragment(self) -> orjson.Fragment:
+        """Return the rows serialized as a JSON list.
+
+        The rows are serialized in chunks so only a chunk of compressed
+        state dicts exists at a time.
+        """
+        rows = len(self._states)
+        compressed_state = self._compressed_state
+        return orjson.Fragment(
+            b"["
+            + b",".join(
+                json_bytes(
+                    [
+                        compressed_state(idx)
+                        for idx in range(start, min(start + _JSON_CHUNK_SIZE, rows))
+                    ]
+                )[1:-1]
+                for start in range(0, rows, _JSON_CHUNK_SIZE)
+            )
+            + b"]"
+        )
@@ -1,5 +1,6 @@
 """A pool for sqlite connections."""
 import logging
+import os
 import threading
 import traceback
 from typing import Any
@@ -23,7 +24,11 @@ _LOGGER = logging.getLogger(__name__)
 DEBUG_MUTEX_POOL = True
 DEBUG_MUTEX_POOL_TRACE = False
 
-POOL_SIZE = 5
+# One connection for the Recorder thread and one for each db executor
+# worker. The executor only runs reads, which do not block the writer
+# in WAL mode, so it is sized to the number of cores to let dashboard
+# loads run in parallel instead of queuing behind each other.
+POOL_SIZE = min(max(os.cpu_count() or 1, 4), 8) + 1
 
 ADVISE_MSG = (
     "Use homeassistant.components.recorder.get_instance(hass).async_add_executor_job()"
@@ -201,6 +201,11 @@ def _purge_states_and_attributes_ids(
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
+    # Attributes used by a state recorded since purge_before are still
+    # referenced by that state, so they do not need to be checked.
+    attributes_ids_batch -= instance.state_attributes_manager.used_since(
+        attributes_ids_batch, purge_before.timestamp()
+    )
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
@@ -236,6 +241,11 @@ def _purge_events_and_data_ids(
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
+    # Event data used by an event recorded since purge_before is still
+    # referenced by that event, so it does not need to be checked.
+    data_ids_batch -= instance.event_data_manager.used_since(
+        data_ids_batch, purge_before.timestamp()
+    )
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
@@ -696,6 +706,9 @@ def _purge_filtered_states(
     if not to_purge:
         return True
     state_ids, attributes_ids, event_ids = zip(*to_purge)
+    # Recent states may be deleted here so we can no longer rely on
+    # when attributes were last used to know they are still referenced.
+    instance.state_attributes_manager.reset_usage()
     filtered_event_ids = {id_ for id_ in event_ids if id_ is not None}
     _LOGGER.debug(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
@@ -737,6 +750,9 @@ def _purge_filtered_events(
     if not to_purge:
         return True
     event_ids, data_ids = zip(*to_purge)
+    # Recent events may be deleted here so we can no longer rely on
+    # when event data was last used to know it is still referenced.
+    instance.event_data_manager.reset_usage()
     event_ids_set = set(event_ids)
     _LOGGER.debug(
         "Selected %s event_ids to remove that should be filtered", len(event_ids_set)
@@ -0,0 +1,329 @@
+"""An on-disk spool for events the recorder cannot keep up with."""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
+
+from .const import ALL_DOMAIN_EXCLUDE_ATTRS
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_DIR = ".recorder_spool"
+SPOOL_SEGMENT_SUFFIX = ".spool"
+
+# Events are buffered in memory until the buffer reaches this
+# size and is then written out to disk as one segment
+SPOOL_SEGMENT_BYTES = 4 * 1024 * 1024
+
+# Once this many bytes are spooled and not yet replayed the
+# spool is considered full and the recorder falls back to
+# the in memory queue
+SPOOL_MAX_BYTES = 1024 * 1024 * 1024
+
+# Each record is the length of the payload followed by the payload
+_RECORD_HEADER = struct.Struct("<I")
+
+
+def _encode_state(state: State | None) -> tuple[Any, ...] | None:
+    """Encode the parts of a state the recorder writes to the database."""
+    if state is None:
+        return None
+    exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
+    if state_info := state.state_info:
+        exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS | state_info["unrecorded_attributes"]
+    return (
+        state.state,
+        {k: v for k, v in state.attributes.items() if k not in exclude_attrs},
+        dt_util.utc_to_timestamp(state.last_changed),
+        dt_util.utc_to_timestamp(state.last_updated),
+    )
+
+
+def encode_event(event: Event) -> bytes:
+    """Encode an event into a spool record.
+
+    Only the data the recorder needs is kept. The old_state of
+    state_changed events is dropped since the recorder links the
+    previous row by entity_id, and unrecorded attributes are removed
+    since they would be excluded when writing the row anyway.
+    """
+    data: Mapping[str, Any] = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        data = {
+            "entity_id": data["entity_id"],
+            "new_state": _encode_state(data.get("new_state")),
+        }
+    context = event.context
+    payload = json_bytes(
+        (
+            event.event_type,
+            data,
+            event.origin.value,
+            dt_util.utc_to_timestamp(event.time_fired),
+            context.id,
+            context.user_id,
+            context.parent_id,
+        )
+    )
+    return _RECORD_HEADER.pack(len(payload)) + payload
+
+
+def _decode_event(payload: bytes) -> Event:
+    """Decode a spool record payload back into an event."""
+    (
+        event_type,
+        data,
+        origin,
+        time_fired_ts,
+        context_id,
+        context_user_id,
+        context_parent_id,
+    ) = json_loads(payload)  # type: ignore[misc]
+    context = Context(
+        user_id=context_user_id, parent_id=context_parent_id, id=context_id
+    )
+    if event_type == EVENT_STATE_CHANGED:
+        entity_id = data["entity_id"]
+        new_state: State | None = None
+        if encoded_state := data["new_state"]:
+            state, attributes, last_changed_ts, last_updated_ts = encoded_state
+            new_state = State(
+                entity_id,
+                state,
+                attributes,
+                dt_util.utc_from_timestamp(last_changed_ts),
+                dt_util.utc_from_timestamp(last_updated_ts),
+                context,
+                validate_entity_id=False,
+            )
+        data = {"entity_id": entity_id, "new_state": new_state}
+    return Event(
+        event_type,
+        data,
+        EventOrigin(origin),
+        dt_util.utc_from_timestamp(time_fired_ts),
+        context,
+    )
+
+
+def decode_events(data: bytes | mmap.mmap) -> Iterator[Event]:
+    """Decode the events of a segment in the order they were spooled."""
+    header_size = _RECORD_HEADER.size
+    end = len(data)
+    offset = 0
+    while offset + header_size <= end:
+        (length,) = _RECORD_HEADER.unpack_from(data, offset)
+        offset += header_size
+        if offset + length > end:
+            _LOGGER.warning("Discarding truncated record at the end of spool segment")
+            return
+        yield _decode_event(data[offset : offset + length])
+        offset += length
+
+
+class RecorderSpool:
+    """An append only spool of events split into segments.
+
+    Events are appended from the event loop while the recorder is
+    falling behind and are sealed into numbered segments that are
+    written out by the executor. The recorder thread replays the
+    segments in order once it has caught up, reading segments that
+    were already written through a memory map and segments that are
+    still waiting to be written directly from memory.
+
+    Segment ids are nanosecond timestamps so segments left behind
+    by a previous run sort before the segments of the current run.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.active = False
+        self.events_spooled = 0
+        self.events_replayed = 0
+        self.created_segment_id = time.time_ns()
+        self._last_segment_id = self.created_segment_id
+        self._buffer: list[bytes] = []
+        self._buffer_bytes = 0
+        self._spooled_bytes = 0
+        self._write_failed = False
+        self._pending: dict[int, bytes] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def full(self) -> bool:
+        """Return if the spool cannot take any more events."""
+        return (
+            self._write_failed
+            or self._spooled_bytes + self._buffer_bytes >= SPOOL_MAX_BYTES
+        )
+
+    def async_start(self) -> None:
+        """Start spooling events.
+
+        Must be called from the event loop.
+        """
+        self.active = True
+        self._write_failed = False
+
+    def async_append(self, record: bytes) -> int | None:
+        """Append an encoded event to the spool.
+
+        Returns the id of the segment to write out if the buffer
+        was sealed into a new segment.
+
+        Must be called from the event loop.
+        """
+        self._buffer.append(record)
+        self._buffer_bytes += len(record)
+        self.events_spooled += 1
+        if self._buffer_bytes < SPOOL_SEGMENT_BYTES:
+            return None
+        return self._async_seal_buffer()
+
+    def async_stop(self) -> int:
+        """Stop spooling and seal the buffered events into a segment.
+
+        Returns the id of the last segment which includes all
+        events spooled so far.
+
+        Must be called from the event loop.
+        """
+        self.active = False
+        if self._buffer:
+            self._async_seal_buffer()
+        return self._last_segment_id
+
+    def _async_seal_buffer(self) -> int:
+        """Seal the buffered events into a pending segment."""
+        segment_id = max(time.time_ns(), self._last_segment_id + 1)
+        self._last_segment_id = segment_id
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffer_bytes = 0
+        with self._lock:
+            self._pending[segment_id] = data
+            self._spooled_bytes += len(data)
+        return segment_id
+
+    def _segment_path(self, segment_id: int) -> str:
+        """Return the path of a segment."""
+        return os.path.join(self.path, f"{segment_id}{SPOOL_SEGMENT_SUFFIX}")
+
+    def write_segment(self, segment_id: int) -> None:
+        """Write a pending segment to disk.
+
+        Must be called from an executor thread.
+        """
+        with self._lock:
+            data = self._pending.get(segment_id)
+        if data is None:
+            return
+        final_path = self._segment_path(segment_id)
+        tmp_path = f"{final_path}.tmp"
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            with open(tmp_path, "wb") as fp:
+                fp.write(data)
+        except OSError as err:
+            # The segment stays in memory and will be replayed from
+            # there, but stop spooling since the disk cannot keep up
+            _LOGGER.error("Error writing recorder spool segment: %s", err)
+            with self._lock:
+                self._write_failed = True
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            return
+        with self._lock:
+            # The disk is writable again
+            self._write_failed = False
+            if self._pending.pop(segment_id, None) is not None:
+                os.replace(tmp_path, final_path)
+                return
+        # The segment was replayed while it was being written
+        os.unlink(tmp_path)
+
+    def write_pending(self) -> None:
+        """Write all pending segments to disk.
+
+        Must be called from an executor thread.
+        """
+        with self._lock:
+            segment_ids = sorted(self._pending)
+        for segment_id in segment_ids:
+            self.write_segment(segment_id)
+
+    def segments(self, last_segment_id: int) -> list[int]:
+        """Return the ids of the segments up to last_segment_id in order.
+
+        Must be called from the recorder thread.
+        """
+        with self._lock:
+            segment_ids = {
+                segment_id
+                for segment_id in self._pending
+                if segment_id <= last_segment_id
+            }
+            with contextlib.suppress(FileNotFoundError):
+                for name in os.listdir(self.path):
+                    segment_id_str, _, suffix = name.partition(".")
+                    if (
+                        f".{suffix}" == SPOOL_SEGMENT_SUFFIX
+                        and segment_id_str.isdigit()
+                        and int(segment_id_str) <= last_segment_id
+                    ):
+                        segment_ids.add(int(segment_id_str))
+        return sorted(segment_ids)
+
+    def read_segment(self, segment_id: int) -> list[Event]:
+        """Read the events of a segment.
+
+        Must be called from the recorder thread.
+        """
+        with self._lock:
+            data = self._pending.get(segment_id)
+        if data is not None:
+            return list(decode_events(data))
+        with open(self._segment_path(segment_id), "rb") as fp:
+            if not os.fstat(fp.fileno()).st_size:
+                return []
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return list(decode_events(mapped))
+
+    def remove_segment(self, segment_id: int, replayed_events: int) -> None:
+        """Remove a segment once its events are committed.
+
+        Must be called from the recorder thread.
+        """
+        with self._lock:
+            if (data := self._pending.pop(segment_id, None)) is not None:
+                size = len(data)
+            else:
+                path = self._segment_path(segment_id)
+                try:
+                    size = os.path.getsize(path)
+                    os.unlink(path)
+                except FileNotFoundError:
+                    size = 0
+            # Segments left behind by a previous run were never
+            # counted as spooled by this run
+            if segment_id > self.created_segment_id:
+                self._spooled_bytes -= size
+            # Nothing is left in memory once the segments that could
+            # not be written are replayed, so spooling can resume
+            if not self._pending:
+                self._write_failed = False
+        self.events_replayed += replayed_events
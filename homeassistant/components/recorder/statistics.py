@@ -1,18 +1,19 @@
 """Statistics helper."""
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
-from operator import itemgetter
+from operator import attrgetter, itemgetter
 import re
-from statistics import mean
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+from statistics import fmean
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
@@ -51,12 +52,16 @@ from .const import (
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    STATISTICS_ROLLUP_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -559,6 +564,8 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        if instance.schema_version >= STATISTICS_ROLLUP_SCHEMA_VERSION:
+            _compile_statistics_rollups(session, start)
 
     session.add(StatisticsRuns(start=start))
 
@@ -856,16 +863,27 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
+_get_start = itemgetter("start")
+_get_mean = itemgetter("mean")
+_get_min = itemgetter("min")
+_get_max = itemgetter("max")
+
+
+_StatisticKeyT = TypeVar("_StatisticKeyT", int, str)
+
+
 def _reduce_statistics(
-    stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
+    stats: dict[_StatisticKeyT, list[StatisticsRow]],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
+) -> dict[_StatisticKeyT, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics.
+
+    The rows of each statistic are sorted by start, so the rows of a
+    period are found by bisecting the start column at the period end
+    and the period is reduced with builtins over slices of the columns.
+    """
+    result: dict[_StatisticKeyT, list[StatisticsRow]] = defaultdict(list)
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
@@ -873,44 +891,48 @@ def _reduce_statistics(
     _want_state = "state" in types
     _want_sum = "sum" in types
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        starts = list(map(_get_start, stat_list))
+        if _want_mean:
+            means = list(map(_get_mean, stat_list))
+            means_has_none = None in means
+        if _want_min:
+            mins = list(map(_get_min, stat_list))
+            mins_has_none = None in mins
+        if _want_max:
+            maxs = list(map(_get_max, stat_list))
+            maxs_has_none = None in maxs
+        result_append = result[statistic_id].append
+        num_rows = len(starts)
+        idx = 0
+        while idx < num_rows:
+            start, end = period_start_end(starts[idx])
+            next_idx = bisect_left(starts, end, idx + 1)
+            # The last statistic of the period
+            last_stat = stat_list[next_idx - 1]
+            row: StatisticsRow = {"start": start, "end": end}
+            if _want_mean:
+                values = means[idx:next_idx]
+                if means_has_none:
+                    values = [value for value in values if value is not None]
+                row["mean"] = fmean(values) if values else None
+            if _want_min:
+                values = mins[idx:next_idx]
+                if mins_has_none:
+                    values = [value for value in values if value is not None]
+                row["min"] = min(values) if values else None
+            if _want_max:
+                values = maxs[idx:next_idx]
+                if maxs_has_none:
+                    values = [value for value in values if value is not None]
+                row["max"] = max(values) if values else None
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            result_append(row)
+            idx = next_idx
 
     return result
 
@@ -957,10 +979,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1007,10 +1027,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1064,12 +1082,151 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics(stats, _month_start_end_ts, types)
+
+
+def _statistics_rollups() -> (
+    tuple[tuple[type[StatisticsBase], Callable[[float], tuple[float, float]]], ...]
+):
+    """Return the rollup tables and how to find the period a timestamp is within."""
+    return (
+        (StatisticsDaily, reduce_day_ts_factory()[1]),
+        (StatisticsMonthly, reduce_month_ts_factory()[1]),
+    )
+
+
+def _get_statistics_rollup_cutoff_ts(session: Session) -> float | None:
+    """Return the end of the last compiled hour.
+
+    The rollup tables hold all periods which ended at or before it.
+    """
+    last_run: datetime | None = session.query(func.max(StatisticsRuns.start)).scalar()
+    if not last_run:
+        return None
+    last_run_end = process_timestamp(last_run) + timedelta(minutes=5)
+    return last_run_end.replace(minute=0, second=0, microsecond=0).timestamp()
+
+
+def _reduced_row_to_statistic_data(row: StatisticsRow) -> StatisticDataTimestamp:
+    """Convert a reduced statistics row to the shape of the rollup tables."""
+    data: StatisticDataTimestamp = {
+        "start_ts": row["start"],
+        "last_reset_ts": row.get("last_reset"),
+    }
+    if (mean := row.get("mean")) is not None:
+        data["mean"] = mean
+    if (min_ := row.get("min")) is not None:
+        data["min"] = min_
+    if (max_ := row.get("max")) is not None:
+        data["max"] = max_
+    if (state := row.get("state")) is not None:
+        data["state"] = state
+    if (sum_ := row.get("sum")) is not None:
+        data["sum"] = sum_
+    return data
+
+
+def _rebuild_statistics_rollups(
+    session: Session,
+    metadata_ids: list[int] | None,
+    first_start_ts: float,
+    last_start_ts: float | None,
+    cutoff_ts: float,
+) -> None:
+    """Rebuild the rollups for the periods with hourly statistics in a range.
+
+    The periods containing hourly statistics starting from first_start_ts up to
+    and including last_start_ts are reduced again. Only periods which ended at
+    or before cutoff_ts are rolled up, the other periods are reduced from the
+    hourly statistics when queried.
+    """
+    for table, period_start_end in _statistics_rollups():
+        start_ts = period_start_end(first_start_ts)[0]
+        end_ts = period_start_end(cutoff_ts)[0]
+        if last_start_ts is not None:
+            end_ts = min(end_ts, period_start_end(last_start_ts)[1])
+        if start_ts >= end_ts:
+            continue
+        delete_query = session.query(table).filter(
+            table.start_ts >= start_ts, table.start_ts < end_ts
+        )
+        query = session.query(*QUERY_STATISTICS).filter(
+            Statistics.start_ts >= start_ts, Statistics.start_ts < end_ts
+        )
+        if metadata_ids is not None:
+            delete_query = delete_query.filter(table.metadata_id.in_(metadata_ids))
+            query = query.filter(Statistics.metadata_id.in_(metadata_ids))
+        delete_query.delete(synchronize_session=False)
+        rows = execute(query.order_by(Statistics.metadata_id, Statistics.start_ts))
+        stats: dict[int, list[StatisticsRow]] = {
+            metadata_id: [
+                {
+                    "start": row.start_ts,
+                    "mean": row.mean,
+                    "min": row.min,
+                    "max": row.max,
+                    "last_reset": row.last_reset_ts,
+                    "state": row.state,
+                    "sum": row.sum,
+                }
+                for row in group
+            ]
+            for metadata_id, group in groupby(rows, attrgetter("metadata_id"))
+        }
+        reduced = _reduce_statistics(
+            stats,
+            period_start_end,
+            {"last_reset", "max", "mean", "min", "state", "sum"},
+        )
+        session.add_all(
+            table.from_stats_ts(metadata_id, _reduced_row_to_statistic_data(row))
+            for metadata_id, period_rows in reduced.items()
+            for row in period_rows
+        )
+
+
+def _rebuild_statistics_rollups_for_metadata_id(
+    instance: Recorder,
+    session: Session,
+    metadata_id: int,
+    first_start_ts: float,
+    last_start_ts: float | None,
+) -> None:
+    """Rebuild the rollups after the hourly statistics of a metadata_id changed."""
+    if instance.schema_version < STATISTICS_ROLLUP_SCHEMA_VERSION or (
+        (cutoff_ts := _get_statistics_rollup_cutoff_ts(session)) is None
+    ):
+        return
+    _rebuild_statistics_rollups(
+        session, [metadata_id], first_start_ts, last_start_ts, cutoff_ts
     )
 
 
+def _compile_statistics_rollups(session: Session, start: datetime) -> None:
+    """Roll up the periods which ended with the compiled hour."""
+    hour_start_ts = start.replace(minute=0).timestamp()
+    cutoff_ts = hour_start_ts + 3600
+    if (last_cutoff_ts := _get_statistics_rollup_cutoff_ts(session)) is not None:
+        # The hour was compiled after later hours, for example when
+        # compiling statistics for a past period.
+        cutoff_ts = max(cutoff_ts, last_cutoff_ts)
+    _rebuild_statistics_rollups(session, None, hour_start_ts, hour_start_ts, cutoff_ts)
+
+
+def rebuild_statistics_rollups(session_maker: Callable[[], Session]) -> None:
+    """Rebuild the rollups of all statistics from the hourly statistics."""
+    with session_scope(session=session_maker(), read_only=True) as session:
+        if (cutoff_ts := _get_statistics_rollup_cutoff_ts(session)) is None:
+            return
+        metadata_ids = [
+            metadata_id for (metadata_id,) in session.query(StatisticsMeta.id)
+        ]
+    for metadata_id in metadata_ids:
+        with session_scope(session=session_maker()) as session:
+            _rebuild_statistics_rollups(session, [metadata_id], 0, None, cutoff_ts)
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1692,16 +1849,119 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
+    result: dict[str, list[StatisticsRow]] = {}
+    hourly_start_time = start_time
+    if period in {"day", "month"} and (
+        rollup := _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            units,
+            types,
+            period,
+        )
+    ):
+        # Periods which have ended are read from the rollup tables,
+        # the remaining periods are reduced from the hourly statistics
+        result, hourly_start_time = rollup
+
     stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
+        hourly_start_time, end_time, metadata_ids, table, types
     )
     stats = cast(
         Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
     )
 
-    if not stats:
+    if stats:
+        period_result = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            units,
+            types,
+        )
+
+        if period == "day":
+            period_result = _reduce_statistics_per_day(period_result, types)
+
+        if period == "week":
+            period_result = _reduce_statistics_per_week(period_result, types)
+
+        if period == "month":
+            period_result = _reduce_statistics_per_month(period_result, types)
+
+        if result:
+            for statistic_id, rows in period_result.items():
+                result.setdefault(statistic_id, []).extend(rows)
+        else:
+            result = period_result
+
+    if not result:
         return {}
 
+    if "change" in _types:
+        _augment_result_with_change(
+            hass, session, start_time, units, _types, table, metadata, result
+        )
+
+    # Return statistics combined with metadata
+    return result
+
+
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[dict[str, list[StatisticsRow]], datetime] | None:
+    """Return daily or monthly statistics from the rollup tables.
+
+    Returns the statistics of the periods which have been rolled up and the
+    start of the first period which was not, or None if the rollup tables
+    can't be used.
+    """
+    if get_instance(hass).schema_version < STATISTICS_ROLLUP_SCHEMA_VERSION or (
+        (cutoff_ts := _get_statistics_rollup_cutoff_ts(session)) is None
+    ):
+        return None
+    table: type[StatisticsDaily | StatisticsMonthly]
+    if period == "day":
+        table = StatisticsDaily
+        _, period_start_end = reduce_day_ts_factory()
+    else:
+        table = StatisticsMonthly
+        _, period_start_end = reduce_month_ts_factory()
+    rollup_end_ts = period_start_end(cutoff_ts)[0]
+    if end_time is not None:
+        rollup_end_ts = min(rollup_end_ts, end_time.timestamp())
+    if rollup_end_ts <= start_time.timestamp():
+        return None
+    rollup_end_time = dt_util.utc_from_timestamp(rollup_end_ts)
+
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, rollup_end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return {}, rollup_end_time
+
     result = _sorted_statistics_to_dict(
         hass,
         session,
@@ -1714,23 +1974,13 @@ def _statistics_during_period_with_session(
         units,
         types,
     )
-
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
-
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
-
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
-
-    if "change" in _types:
-        _augment_result_with_change(
-            hass, session, start_time, units, _types, table, metadata, result
-        )
-
-    # Return statistics combined with metadata
-    return result
+    for rows in result.values():
+        for row in rows:
+            period_start, row["end"] = period_start_end(row["start"])
+            if period_start != row["start"]:
+                # The rollups were made with another time zone
+                return None
+    return result, rollup_end_time
 
 
 def statistics_during_period(
@@ -2295,13 +2545,27 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    first_start: datetime | None = None
+    last_start: datetime | None = None
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        if first_start is None or stat["start"] < first_start:
+            first_start = stat["start"]
+        if last_start is None or stat["start"] > last_start:
+            last_start = stat["start"]
 
     if table != StatisticsShortTerm:
+        if first_start is not None and last_start is not None:
+            _rebuild_statistics_rollups_for_metadata_id(
+                instance,
+                session,
+                metadata_id,
+                first_start.timestamp(),
+                last_start.timestamp(),
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2429,6 +2693,14 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _rebuild_statistics_rollups_for_metadata_id(
+            instance,
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0).timestamp(),
+            None,
+        )
+
     return True
 
 
@@ -2493,6 +2765,10 @@ def change_statistics_unit(
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
 
+        _rebuild_statistics_rollups_for_metadata_id(
+            instance, session, metadata_id, 0, None
+        )
+
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
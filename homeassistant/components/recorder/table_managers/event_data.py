@@ -5,6 +5,7 @@ from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
@@ -31,6 +32,13 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
+        # The newest time_fired_ts of an event that was recorded with each
+        # recently used data_id, so purge can skip checking if a data_id
+        # is still referenced by an event that is not purged.
+        self._last_used: LRU[int, float] = LRU(CACHE_SIZE)
+        # The same for the pending EventData which have no data_id until
+        # they are committed.
+        self._pending_last_used: dict[str, float] = {}
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -121,8 +129,60 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         recorder thread.
         """
         for shared_data, db_event_data in self._pending.items():
-            self._id_map[shared_data] = db_event_data.data_id
+            self._id_map[shared_data] = data_id = db_event_data.data_id
+            if data_id is not None and (
+                time_fired_ts := self._pending_last_used.get(shared_data)
+            ):
+                self.mark_used(data_id, time_fired_ts)
         self._pending.clear()
+        self._pending_last_used.clear()
+
+    def mark_used(self, data_id: int, time_fired_ts: float) -> None:
+        """Mark a data_id as used by an event recorded at time_fired_ts.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if time_fired_ts > self._last_used.get(data_id, 0):
+            self._last_used[data_id] = time_fired_ts
+
+    def mark_pending_used(self, shared_data: str, time_fired_ts: float) -> None:
+        """Mark a pending EventData as used by an event recorded at time_fired_ts.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if time_fired_ts > self._pending_last_used.get(shared_data, 0):
+            self._pending_last_used[shared_data] = time_fired_ts
+
+    def used_since(self, data_ids: set[int], timestamp: float) -> set[int]:
+        """Return the data_ids used by an event recorded at or after timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        return {
+            data_id for data_id in data_ids if last_used.get(data_id, 0) >= timestamp
+        }
+
+    def reset_usage(self) -> None:
+        """Forget when data_ids were used after events were deleted out of order.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_used.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._last_used.clear()
+        self._pending_last_used.clear()
 
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
@@ -137,3 +197,6 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         # Evict any purged data from the cache
         for purged_data_id in data_ids.intersection(event_data_ids_reversed):
             id_map.pop(event_data_ids_reversed[purged_data_id], None)
+        last_used = self._last_used
+        for purged_data_id in data_ids.intersection(last_used.keys()):
+            del last_used[purged_data_id]
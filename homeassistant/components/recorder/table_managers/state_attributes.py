@@ -5,6 +5,7 @@ from collections.abc import Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event
@@ -38,6 +39,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         super().__init__(recorder, CACHE_SIZE)
         self.active = True  # always active
         self._entity_sources = entity_sources(recorder.hass)
+        # The newest last_updated_ts of a state that was recorded with each
+        # recently used attributes_id, so purge can skip checking if an
+        # attributes_id is still referenced by a state that is not purged.
+        self._last_used: LRU[int, float] = LRU(CACHE_SIZE)
+        # The same for the pending StateAttributes which have no
+        # attributes_id until they are committed.
+        self._pending_last_used: dict[str, float] = {}
 
     def serialize_from_event(self, event: Event) -> bytes | None:
         """Serialize event data."""
@@ -134,8 +142,64 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         for shared_attrs, db_state_attributes in self._pending.items():
-            self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            self._id_map[shared_attrs] = (
+                attributes_id
+            ) = db_state_attributes.attributes_id
+            if attributes_id is not None and (
+                last_updated_ts := self._pending_last_used.get(shared_attrs)
+            ):
+                self.mark_used(attributes_id, last_updated_ts)
         self._pending.clear()
+        self._pending_last_used.clear()
+
+    def mark_used(self, attributes_id: int, last_updated_ts: float) -> None:
+        """Mark an attributes_id as used by a state recorded at last_updated_ts.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if last_updated_ts > self._last_used.get(attributes_id, 0):
+            self._last_used[attributes_id] = last_updated_ts
+
+    def mark_pending_used(self, shared_attrs: str, last_updated_ts: float) -> None:
+        """Mark a pending StateAttributes as used by a state recorded at last_updated_ts.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if last_updated_ts > self._pending_last_used.get(shared_attrs, 0):
+            self._pending_last_used[shared_attrs] = last_updated_ts
+
+    def used_since(self, attributes_ids: set[int], timestamp: float) -> set[int]:
+        """Return the attributes_ids used by a state recorded at or after timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        return {
+            attributes_id
+            for attributes_id in attributes_ids
+            if last_used.get(attributes_id, 0) >= timestamp
+        }
+
+    def reset_usage(self) -> None:
+        """Forget when attributes_ids were used after states were deleted out of order.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_used.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._last_used.clear()
+        self._pending_last_used.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -153,3 +217,6 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+        last_used = self._last_used
+        for purged_attributes_id in attributes_ids.intersection(last_used.keys()):
+            del last_used[purged_attributes_id]
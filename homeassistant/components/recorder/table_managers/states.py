@@ -1,7 +1,49 @@
 """Support managing States."""
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import Any, cast
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm.session import Session
+
+from ..db_schema import StateAttributes, States, StatesMeta
+
+
+class PendingState:
+    """A states row that is waiting to be inserted.
+
+    Instead of building an ORM object for every state change, the
+    row is kept as a plain dict of insert parameters. The ids that
+    are not known until the session is flushed (new StatesMeta,
+    new StateAttributes, and an old state from the same commit)
+    are resolved in bulk right before the rows are inserted.
+    """
+
+    __slots__ = (
+        "params",
+        "old_state",
+        "states_meta",
+        "state_attributes",
+        "generation",
+        "state_id",
+    )
+
+    def __init__(self, params: dict[str, Any]) -> None:
+        """Initialize a pending state from the insert parameters."""
+        self.params = params
+        self.old_state: PendingState | None = None
+        self.states_meta: StatesMeta | None = None
+        self.state_attributes: StateAttributes | None = None
+        # The generation is the number of pending states for the same
+        # entity that must be inserted before this one so the
+        # old_state_id can be resolved.
+        self.generation = 0
+        self.state_id: int | None = None
+
+    def link_old_state(self, old_state: PendingState) -> None:
+        """Link to an old state that has not been inserted yet."""
+        self.old_state = old_state
+        self.generation = old_state.generation + 1
 
 
 class StatesManager:
@@ -9,10 +51,16 @@ class StatesManager:
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
-        self._pending: dict[str, States] = {}
+        self._pending: dict[str, PendingState] = {}
+        self._queued: list[PendingState] = []
         self._last_committed_id: dict[str, int] = {}
 
-    def pop_pending(self, entity_id: str) -> States | None:
+    @property
+    def has_queued(self) -> bool:
+        """Return if there are states waiting to be inserted."""
+        return bool(self._queued)
+
+    def pop_pending(self, entity_id: str) -> PendingState | None:
         """Pop a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -33,7 +81,7 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
-    def add_pending(self, entity_id: str, state: States) -> None:
+    def add_pending(self, entity_id: str, state: PendingState) -> None:
         """Add a pending state.
 
         Pending states are states that are in the session but not yet committed.
@@ -43,15 +91,97 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def queue(self, state: PendingState) -> None:
+        """Queue a state to be inserted when the session is committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._queued.append(state)
+
+    def insert_queued(self, session: Session, states: type[States]) -> None:
+        """Insert the queued states with executemany INSERT statements.
+
+        The session must be flushed before calling this so the ids
+        of any new StatesMeta and StateAttributes rows are known.
+
+        States are inserted in generations: the first generation holds
+        every state whose old state was already committed (or does not
+        exist), and each following generation holds the states whose
+        old state was inserted by the previous one. This way every
+        old_state_id is known before its row is inserted.
+
+        The queue is kept until the session is committed so the
+        states are inserted again if the commit is retried. States
+        that already have a state_id were inserted earlier in the
+        same transaction and are skipped so a retried commit does
+        not insert them twice.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        generations: list[list[PendingState]] = []
+        for state in self._queued:
+            if state.state_id is not None:
+                continue
+            while state.generation >= len(generations):
+                generations.append([])
+            generations[state.generation].append(state)
+
+        table = cast(Table, states.__table__)
+        insert_states = insert(table)
+        dialect = session.get_bind().dialect
+        if returning := dialect.insert_executemany_returning_sort_by_parameter_order:
+            insert_states = insert_states.returning(
+                table.c.state_id, sort_by_parameter_order=True
+            )
+        for generation in generations:
+            if not generation:
+                continue
+            params_list: list[dict[str, Any]] = []
+            for state in generation:
+                params = state.params
+                if old_state := state.old_state:
+                    params["old_state_id"] = old_state.state_id
+                if states_meta := state.states_meta:
+                    params["metadata_id"] = states_meta.metadata_id
+                if state_attributes := state.state_attributes:
+                    params["attributes_id"] = state_attributes.attributes_id
+                params_list.append(params)
+            if returning:
+                result = session.execute(insert_states, params_list)
+                for state, state_id in zip(generation, result.scalars()):
+                    state.state_id = state_id
+                continue
+            # The dialect cannot return the generated ids from an
+            # executemany so we fall back to inserting row by row
+            for state, params in zip(generation, params_list):
+                result = session.execute(insert_states, params)
+                state.state_id = result.inserted_primary_key[0]
+
+    def rollback_queued(self) -> None:
+        """Forget the state_ids of the queued states after a rollback.
+
+        The rows inserted in the rolled back transaction are gone so
+        the queued states must be inserted again.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for state in self._queued:
+            state.state_id = None
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        for entity_id, db_states in self._pending.items():
-            self._last_committed_id[entity_id] = db_states.state_id
+        for entity_id, pending_state in self._pending.items():
+            if (state_id := pending_state.state_id) is not None:
+                self._last_committed_id[entity_id] = state_id
         self._pending.clear()
+        self._queued.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +191,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._queued.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -281,6 +281,19 @@ class EventTask(RecorderTask):
         instance._process_one_event(self.event)
 
 
+@dataclass(slots=True)
+class SpoolReplayTask(RecorderTask):
+    """Replay the events spooled to disk while the recorder was behind."""
+
+    last_segment_id: int
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        # pylint: disable-next=[protected-access]
+        instance._replay_spool(self.last_segment_id)
+
+
 @dataclass(slots=True)
 class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
@@ -69,6 +69,9 @@ QUERY_RETRY_WAIT = 0.1
 SQLITE3_POSTFIXES = ["", "-wal", "-shm"]
 DEFAULT_YIELD_STATES_ROWS = 32768
 
+# Memory map up to 64MiB of the database for the read only connections
+SQLITE_READ_ONLY_MMAP_SIZE = 64 * 1024 * 1024
+
 
 # Our minimum versions for each database
 #
@@ -475,6 +478,7 @@ def setup_connection_for_dialect(
     dialect_name: str,
     dbapi_connection: DBAPIConnection,
     first_connection: bool,
+    read_only: bool = False,
 ) -> DatabaseEngine | None:
     """Execute statements needed for dialect connection."""
     version: AwesomeVersion | None = None
@@ -518,6 +522,15 @@ def setup_connection_for_dialect(
         # enable support for foreign keys
         execute_on_connection(dbapi_connection, "PRAGMA foreign_keys=ON")
 
+        if read_only:
+            # Connections used by the db executor only read so they can
+            # never take the write lock away from the Recorder thread
+            # and can read pages directly from the memory mapped file.
+            execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+            execute_on_connection(
+                dbapi_connection, f"PRAGMA mmap_size={SQLITE_READ_ONLY_MMAP_SIZE}"
+            )
+
     elif dialect_name == SupportedDialect.MYSQL:
         max_bind_vars = DEFAULT_MAX_BIND_VARS
         execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
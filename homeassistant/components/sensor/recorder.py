@@ -24,12 +24,13 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
@@ -64,6 +65,122 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Keep track of the states of sensors with a state class in memory
+STATES_COLLECTOR = "sensor_statistics_states_collector"
+
+
+class StatesCollector:
+    """Collect the states of sensors with a state class as they change.
+
+    This allows compiling statistics for the period that just ended without
+    reading back the states the recorder has just written. Periods which
+    started before the collector was started, or which are older than the
+    states kept in memory, are compiled from the database.
+
+    The states are only modified from the event loop. States are appended
+    in place and trimmed by replacing the list, so the recorder thread can
+    take a snapshot without a lock.
+    """
+
+    def __init__(self, sensor_states: list[State]) -> None:
+        """Initialize the collector with the current states."""
+        self._states: dict[str, list[State]] = {
+            state.entity_id: [state] for state in sensor_states
+        }
+        # States are only complete for periods starting after the
+        # newest state we have been handed instead of seeing it change
+        self._complete_after = max(
+            [dt_util.utcnow(), *(state.last_updated for state in sensor_states)]
+        )
+
+    @callback
+    def async_state_changed(self, event: Event) -> None:
+        """Collect the new state of a sensor."""
+        entity_id: str = event.data["entity_id"]
+        if not (new_state := event.data["new_state"]):
+            self._states.pop(entity_id, None)
+            return
+        if new_state.domain != DOMAIN:
+            return
+        if ATTR_STATE_CLASS not in new_state.attributes:
+            self._states.pop(entity_id, None)
+            return
+        if not (entity_states := self._states.get(entity_id)):
+            self._states[entity_id] = [new_state]
+            return
+        entity_states.append(new_state)
+        # Only keep the state at the start of the period that ended last
+        # and the changes after it, which is all the next compile needs
+        last_updated = new_state.last_updated
+        keep_after = last_updated.replace(
+            minute=last_updated.minute - last_updated.minute % 5,
+            second=0,
+            microsecond=0,
+        ) - datetime.timedelta(minutes=5)
+        if entity_states[1].last_updated >= keep_after:
+            return
+        first_idx = 1
+        while entity_states[first_idx + 1].last_updated < keep_after:
+            first_idx += 1
+        if keep_after > self._complete_after:
+            self._complete_after = keep_after
+        self._states[entity_id] = entity_states[first_idx:]
+
+    def states_during_period(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entities_full_history: set[str],
+    ) -> dict[str, list[State]] | None:
+        """Return the states during start-end or None if not collected.
+
+        The states match what the history queries of compile_statistics
+        return: the state at start followed by all changes during the
+        period, limited to changes of the state for entities which do
+        not need the full history.
+
+        Must be called from the recorder thread.
+        """
+        collected = {
+            entity_id: entity_states[:]
+            for entity_id, entity_states in self._states.copy().items()
+        }
+        # Checked after taking the snapshot so states trimmed while it was
+        # taken are detected
+        if start < self._complete_after:
+            return None
+        states_during_period: dict[str, list[State]] = {}
+        for entity_id, entity_states in collected.items():
+            full_history = entity_id in entities_full_history
+            period_states: list[State] = []
+            for state in entity_states:
+                if state.last_updated >= end:
+                    continue
+                if state.last_updated < start:
+                    period_states = [state]
+                elif full_history or state.last_changed == state.last_updated:
+                    period_states.append(state)
+            if period_states:
+                states_during_period[entity_id] = period_states
+        return states_during_period
+
+
+@callback
+def _async_start_states_collector(hass: HomeAssistant) -> None:
+    """Start collecting the states of sensors with a state class."""
+    if STATES_COLLECTOR in hass.data:
+        return
+    collector = StatesCollector(
+        [
+            state
+            for state in hass.states.async_all(DOMAIN)
+            if ATTR_STATE_CLASS in state.attributes
+        ]
+    )
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, collector.async_state_changed, run_immediately=True
+    )
+    hass.data[STATES_COLLECTOR] = collector
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -389,29 +506,39 @@ def compile_statistics(  # noqa: C901
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
     ]
     history_list: MutableMapping[str, list[State]] = {}
-    if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+    collector: StatesCollector | None = hass.data.get(STATES_COLLECTOR)
+    if collector is None:
+        hass.add_job(_async_start_states_collector, hass)
+    if collector and (
+        collected_states := collector.states_during_period(
+            start, end, set(entities_full_history)
         )
-    entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
-    ]
-    if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_significant_history,
-        )
-        history_list = {**history_list, **_history_list}
+    ) is not None:
+        history_list = collected_states
+    else:
+        if entities_full_history:
+            history_list = history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
+        entities_significant_history = [
+            i.entity_id
+            for i in sensor_states
+            if "sum" not in wanted_statistics[i.entity_id]
+        ]
+        if entities_significant_history:
+            _history_list = history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_significant_history,
+            )
+            history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 import datetime as dt
 from functools import lru_cache, partial
 import json
@@ -19,6 +20,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     HomeAssistant,
@@ -357,26 +359,92 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+@dataclass(slots=True, eq=False)
+class _EntitiesSubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    send_message: Callable[[str | dict[str, Any] | messages.StateDiffMessage], None]
+    user: User
+    msg_id: int
+
+
+class _EntitiesSubscriptions:
+    """Forward state changed events to all subscribe_entities subscriptions.
+
+    A single state changed listener is shared by all connections. Each event
+    is only offered to the subscriptions that asked for its entity or for all
+    entities, and the permissions of a user are checked once per event no
+    matter how many connections the user has open.
+    """
+
+    __slots__ = ("_hass", "_all_entities", "_by_entity_id", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self._hass = hass
+        self._all_entities: set[_EntitiesSubscription] = set()
+        self._by_entity_id: dict[str, set[_EntitiesSubscription]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, subscription: _EntitiesSubscription, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of entity_ids, or all entities if empty."""
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, set()).add(subscription)
+        else:
+            self._all_entities.add(subscription)
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_forward,  # type: ignore[arg-type]
+                run_immediately=True,
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            if entity_ids:
+                for entity_id in entity_ids:
+                    subscriptions = self._by_entity_id[entity_id]
+                    subscriptions.discard(subscription)
+                    if not subscriptions:
+                        del self._by_entity_id[entity_id]
+            else:
+                self._all_entities.discard(subscription)
+            if not self._all_entities and not self._by_entity_id and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward(self, event: EventType[EventStateChangedData]) -> None:
+        """Forward a state changed event to the interested subscriptions."""
+        entity_id = event.data["entity_id"]
+        if entity_subscriptions := self._by_entity_id.get(entity_id):
+            subscriptions = (*self._all_entities, *entity_subscriptions)
+        elif self._all_entities:
+            subscriptions = tuple(self._all_entities)
+        else:
+            return
+        allowed_by_user_id: dict[str, bool] = {}
+        for subscription in subscriptions:
+            user = subscription.user
+            if (allowed := allowed_by_user_id.get(user.id)) is None:
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                permissions = user.permissions
+                allowed = permissions.access_all_entities(
+                    POLICY_READ
+                ) or permissions.check_entity(entity_id, POLICY_READ)
+                allowed_by_user_id[user.id] = allowed
+            if allowed:
+                subscription.send_message(
+                    messages.StateDiffMessage(subscription.msg_id, event)
+                )
 
 
 @callback
@@ -395,16 +463,15 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+    if (
+        entities_subscriptions := hass.data.get(const.DATA_ENTITIES_SUBSCRIPTIONS)
+    ) is None:
+        entities_subscriptions = hass.data[
+            const.DATA_ENTITIES_SUBSCRIPTIONS
+        ] = _EntitiesSubscriptions(hass)
+    connection.subscriptions[msg["id"]] = entities_subscriptions.async_subscribe(
+        _EntitiesSubscription(connection.send_message, connection.user, msg["id"]),
+        entity_ids,
     )
     connection.send_result(msg["id"])
 
@@ -51,7 +51,9 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[
+            [str | dict[str, Any] | messages.StateDiffMessage], None
+        ],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -244,7 +246,7 @@ class ActiveConnection:
 
     @callback
     def _connect_closed_error(
-        self, msg: str | dict[str, Any] | Callable[[], str]
+        self, msg: str | dict[str, Any] | messages.StateDiffMessage
     ) -> None:
         """Send a message when the connection is closed."""
         self.logger.debug("Tried to send message %s on closed connection", msg)
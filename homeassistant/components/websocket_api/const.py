@@ -25,6 +25,9 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Number of pending messages after which state changes of an entity
+# are merged into its pending state diff message instead of queued.
+PENDING_MSG_COALESCE_STATE_DIFFS: Final = 256
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -49,4 +52,10 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
+# Data used to store the number of merged state diff messages
+DATA_COALESCED_STATE_DIFFS: Final = f"{DOMAIN}.coalesced_state_diffs"
+
+# Data used to store the shared subscribe_entities subscriptions
+DATA_ENTITIES_SUBSCRIPTIONS: Final = f"{DOMAIN}.entities_subscriptions"
+
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
@@ -19,8 +19,10 @@ from homeassistant.util.json import json_loads
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
+    DATA_COALESCED_STATE_DIFFS,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE_STATE_DIFFS,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -28,7 +30,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import StateDiffMessage, message_to_json
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -75,6 +77,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_pending_state_diffs",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -94,8 +97,11 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | StateDiffMessage | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # State diff messages in the queue that later state changes of
+        # the same entity are merged into while the client is behind.
+        self._pending_state_diffs: dict[tuple[int, str], StateDiffMessage] = {}
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -137,6 +143,8 @@ class WebSocketHandler:
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
+                if isinstance(message, StateDiffMessage):
+                    message = self._pop_state_diff(message)
 
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
@@ -156,6 +164,8 @@ class WebSocketHandler:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
+                    if isinstance(message, StateDiffMessage):
+                        message = self._pop_state_diff(message)
                     messages.append(message)
                     messages_remaining -= 1
 
@@ -180,8 +190,13 @@ class WebSocketHandler:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
 
+    def _pop_state_diff(self, message: StateDiffMessage) -> str:
+        """Stop merging into a state diff message and serialize it."""
+        del self._pending_state_diffs[message.key]
+        return message.as_json()
+
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(self, message: str | dict[str, Any] | StateDiffMessage) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -193,11 +208,27 @@ class WebSocketHandler:
             # max pending messages.
             return
 
-        if isinstance(message, dict):
-            message = message_to_json(message)
-
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
+
+        if isinstance(message, dict):
+            message = message_to_json(message)
+        elif isinstance(message, StateDiffMessage):
+            # Only the latest state of an entity matters to a client that
+            # has fallen behind so we merge the change into a pending
+            # message for the entity instead of queueing another one.
+            key = message.key
+            if (pending := self._pending_state_diffs.get(key)) is not None:
+                pending.merge(message)
+                hass_data = self._hass.data
+                hass_data[DATA_COALESCED_STATE_DIFFS] = (
+                    hass_data.get(DATA_COALESCED_STATE_DIFFS, 0) + 1
+                )
+                return
+            if queue_size_before_add < PENDING_MSG_COALESCE_STATE_DIFFS:
+                message = message.as_json()
+            else:
+                self._pending_state_diffs[key] = message
         if queue_size_before_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
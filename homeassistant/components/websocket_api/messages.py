@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 import logging
-from typing import TYPE_CHECKING, Any, Final, cast
+from typing import Any, Final
 
 import voluptuous as vol
 
@@ -146,6 +146,48 @@ def _partial_cached_state_diff_message(event: Event) -> str:
     )
 
 
+class StateDiffMessage:
+    """A state diff message for an entity that can be merged while pending.
+
+    When a client falls behind, later state changes of the same entity are
+    merged into the message that is still waiting to be sent instead of
+    being queued after it, so only the latest state of the entity is sent.
+    """
+
+    __slots__ = ("iden", "event", "old_state", "new_state", "merged")
+
+    def __init__(self, iden: int, event: Event) -> None:
+        """Initialize the message."""
+        self.iden = iden
+        self.event = event
+        self.old_state: State | None = event.data["old_state"]
+        self.new_state: State | None = event.data["new_state"]
+        self.merged = False
+
+    @property
+    def key(self) -> tuple[int, str]:
+        """Return the key of the subscription and entity of the message."""
+        return (self.iden, self.event.data["entity_id"])
+
+    def merge(self, later: StateDiffMessage) -> None:
+        """Merge a later state diff message of the same entity."""
+        self.new_state = later.new_state
+        self.merged = True
+
+    def as_json(self) -> str:
+        """Serialize the message to json."""
+        if not self.merged:
+            return cached_state_diff_message(self.iden, self.event)
+        return message_to_json(
+            event_message(
+                self.iden,
+                _state_diff_from_states(
+                    self.event.data["entity_id"], self.old_state, self.new_state
+                ),
+            )
+        )
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -157,19 +199,20 @@ def _state_diff_event(event: Event) -> dict:
         "r": [entity_id,…]
     }
     """
-    if (event_new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if TYPE_CHECKING:
-        event_new_state = cast(State, event_new_state)
-    if (event_old_state := event.data["old_state"]) is None:
-        return {
-            ENTITY_EVENT_ADD: {
-                event_new_state.entity_id: event_new_state.as_compressed_state
-            }
-        }
-    if TYPE_CHECKING:
-        event_old_state = cast(State, event_old_state)
-    return _state_diff(event_old_state, event_new_state)
+    return _state_diff_from_states(
+        event.data["entity_id"], event.data["old_state"], event.data["new_state"]
+    )
+
+
+def _state_diff_from_states(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict:
+    """Convert the old and new state of an entity to the minimal version."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
+        return {ENTITY_EVENT_ADD: {entity_id: new_state.as_compressed_state}}
+    return _state_diff(old_state, new_state)
 
 
 def _state_diff(
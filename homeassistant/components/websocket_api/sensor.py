@@ -1,13 +1,16 @@
 """Entity to track connections to websocket API."""
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from typing import cast
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
+    DATA_COALESCED_STATE_DIFFS,
     DATA_CONNECTIONS,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
@@ -21,9 +24,7 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the API streams platform."""
-    entity = APICount()
-
-    async_add_entities([entity])
+    async_add_entities([APICount(), CoalescedStateDiffCount()])
 
 
 class APICount(SensorEntity):
@@ -65,3 +66,20 @@ class APICount(SensorEntity):
     def _update_count(self) -> None:
         self.count = self.hass.data.get(DATA_CONNECTIONS, 0)
         self.async_write_ha_state()
+
+
+class CoalescedStateDiffCount(SensorEntity):
+    """Entity to represent how many state changes were merged for slow clients.
+
+    The count is polled instead of pushed since every update of this sensor
+    is itself a state change that has to be sent to the slow clients.
+    """
+
+    _attr_name = "Coalesced state changes"
+    _attr_native_unit_of_measurement = "messages"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of state changes merged into pending messages."""
+        return cast(int, self.hass.data.get(DATA_COALESCED_STATE_DIFFS, 0))
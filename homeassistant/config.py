@@ -8,9 +8,11 @@ from dataclasses import dataclass
 from enum import StrEnum
 from functools import reduce
 import logging
+import mmap
 import operator
 import os
 from pathlib import Path
+import pickle
 import re
 import shutil
 from types import ModuleType
@@ -61,18 +63,27 @@ from .exceptions import ConfigValidationError, HomeAssistantError
 from .generated.currencies import HISTORIC_CURRENCIES
 from .helpers import config_validation as cv, issue_registry as ir
 from .helpers.entity_values import EntityValues
+from .helpers.storage import STORAGE_DIR
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.package import is_docker_env
 from .util.unit_system import get_unit_system, validate_unit_system
-from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml import (
+    SECRET_YAML,
+    Secrets,
+    YamlTypeError,
+    load_yaml_dict,
+    track_dependencies,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
+YAML_CONFIG_CACHE_FILE = "core.config_yaml_cache"
+YAML_CONFIG_CACHE_VERSION = 1
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
@@ -469,8 +480,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     try:
         config = await hass.loop.run_in_executor(
             None,
-            load_yaml_config_file,
+            _load_yaml_config_file_cached,
             hass.config.path(YAML_CONFIG_FILE),
+            hass.config.path(STORAGE_DIR, YAML_CONFIG_CACHE_FILE),
             secrets,
         )
     except HomeAssistantError as exc:
@@ -527,6 +539,79 @@ def load_yaml_config_file(
     return conf_dict
 
 
+def _read_yaml_config_cache(cache_path: str, config_path: str) -> dict | None:
+    """Return the cached configuration or None if it is missing or outdated."""
+    try:
+        with open(cache_path, "rb") as cache_file, mmap.mmap(
+            cache_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            version, cached_config_path, dependencies, conf_dict = pickle.loads(data)
+    except FileNotFoundError:
+        return None
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Ignoring unreadable configuration cache", exc_info=True)
+        return None
+    if (
+        version != (YAML_CONFIG_CACHE_VERSION, __version__)
+        or cached_config_path != config_path
+        or not dependencies.unchanged()
+    ):
+        return None
+    return conf_dict  # type: ignore[no-any-return]
+
+
+def _write_yaml_config_cache(cache_path: str, data: bytes) -> None:
+    """Write the configuration cache, which contains the resolved secrets."""
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(
+            os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb"
+        ) as cache_file:
+            cache_file.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        _LOGGER.debug("Unable to write configuration cache: %s", err)
+
+
+def _load_yaml_config_file_cached(
+    config_path: str, cache_path: str, secrets: Secrets
+) -> dict[Any, Any]:
+    """Parse a YAML configuration file or return it from the cache.
+
+    The parsed configuration is cached along with a digest of every file
+    and directory read while parsing it and the environment variables it
+    substitutes. It is only parsed again when one of them changed.
+
+    Raises FileNotFoundError or HomeAssistantError.
+
+    This method needs to run in an executor.
+    """
+    if (conf_dict := _read_yaml_config_cache(cache_path, config_path)) is not None:
+        _LOGGER.debug("Loaded %s from the configuration cache", config_path)
+        return conf_dict
+    with track_dependencies() as dependencies:
+        conf_dict = load_yaml_config_file(config_path, secrets)
+    if dependencies.paths.get(config_path) is None:
+        # The configuration was not read from disk
+        return conf_dict
+    try:
+        data = pickle.dumps(
+            (
+                (YAML_CONFIG_CACHE_VERSION, __version__),
+                config_path,
+                dependencies,
+                conf_dict,
+            ),
+            pickle.HIGHEST_PROTOCOL,
+        )
+    except (pickle.PicklingError, AttributeError, TypeError, RecursionError) as err:
+        _LOGGER.debug("Unable to cache configuration: %s", err)
+    else:
+        _write_yaml_config_cache(cache_path, data)
+    return conf_dict
+
+
 def process_ha_config_upgrade(hass: HomeAssistant) -> None:
     """Upgrade configuration if necessary.
 
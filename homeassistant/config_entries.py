@@ -33,7 +33,12 @@ from .helpers.event import (
 )
 from .helpers.frame import report
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
-from .setup import DATA_SETUP_DONE, async_process_deps_reqs, async_setup_component
+from .setup import (
+    DATA_SETUP_DONE,
+    async_process_deps_reqs,
+    async_setup_component,
+    async_trace_setup_phase,
+)
 from .util import uuid as uuid_util
 from .util.decorator import Registry
 
@@ -403,7 +408,8 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)
+            with async_trace_setup_phase(hass, self.domain, "config_entry"):
+                result = await component.async_setup_entry(hass, self)
 
             if not isinstance(result, bool):
                 _LOGGER.error(  # type: ignore[unreachable]
@@ -1180,7 +1180,7 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listeners = self._listeners.get(event_type)
         match_all_listeners = self._match_all_listeners
 
         event = Event(event_type, event_data, origin, time_fired, context)
@@ -1192,9 +1192,22 @@ class EventBus:
             return
 
         # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if match_all_listeners and event_type != EVENT_HOMEASSISTANT_CLOSE:
+            self._async_dispatch(event, match_all_listeners)
+        if listeners:
+            self._async_dispatch(event, listeners)
 
+    @callback
+    def _async_dispatch(
+        self, event: Event, listeners: list[_FilterableJobType]
+    ) -> None:
+        """Dispatch an event to a list of listeners.
+
+        The listener lists are never mutated in place (see
+        _async_listen_filterable_job) so they can be iterated
+        without making a copy even if a listener is added or
+        removed while the event is being dispatched.
+        """
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1274,7 +1287,12 @@ class EventBus:
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
     ) -> CALLBACK_TYPE:
-        self._listeners.setdefault(event_type, []).append(filterable_job)
+        # Listener lists are copied on write so async_fire can iterate
+        # them without allocating a new list for every event fired
+        listeners = [*self._listeners.get(event_type, ()), filterable_job]
+        self._listeners[event_type] = listeners
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = listeners
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1359,17 +1377,23 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
-
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
-                self._listeners.pop(event_type)
+            listeners = list(self._listeners[event_type])
+            listeners.remove(filterable_job)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+
+        if event_type == MATCH_ALL:
+            self._listeners[MATCH_ALL] = self._match_all_listeners = listeners
+        # delete event_type list if empty
+        elif listeners:
+            self._listeners[event_type] = listeners
+        else:
+            del self._listeners[event_type]
 
 
 class State:
@@ -1409,7 +1433,14 @@ class State:
 
         self.entity_id = entity_id
         self.state = state
-        self.attributes = ReadOnlyDict(attributes or {})
+        # A ReadOnlyDict can never change so it is shared instead of copied,
+        # which lets consecutive states with unchanged attributes use the
+        # same mapping
+        self.attributes = (
+            attributes
+            if type(attributes) is ReadOnlyDict  # noqa: E721
+            else ReadOnlyDict(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1804,12 +1835,18 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            old_attributes = old_state.attributes
+            same_attr = old_attributes is attributes or old_attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
             return
 
+        if same_attr:
+            # Share the attributes with the old state instead of making
+            # another copy when only the state changed
+            attributes = old_state.attributes  # type: ignore[union-attr]
+
         if context is None:
             # It is much faster to convert a timestamp to a utc datetime object
             # than converting a utc datetime object to a timestamp since cpython
@@ -30,7 +30,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.generated import languages
-from homeassistant.setup import async_start_setup
+from homeassistant.setup import async_start_setup, async_trace_setup_phase
 
 from . import (
     config_validation as cv,
@@ -352,7 +352,9 @@ class EntityPlatform:
             self.platform_name,
             SLOW_SETUP_WARNING,
         )
-        with async_start_setup(hass, [full_name]):
+        with async_start_setup(hass, [full_name]), async_trace_setup_phase(
+            hass, full_name, "platform"
+        ):
             try:
                 task = async_create_setup_task()
 
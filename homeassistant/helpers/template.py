@@ -144,6 +144,13 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+#
+# Recently compiled templates are kept alive even when no Template
+# object references them anymore so templates that are discarded and
+# recreated (reloads, discovery updates, render_template subscriptions)
+# do not have to be compiled again.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
@@ -338,6 +345,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "iterated_entities",
         "rate_limit",
         "has_time",
     )
@@ -356,6 +364,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities whose state was read while iterating over all states
+        # or the states of a domain
+        self.iterated_entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -368,6 +379,7 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" iterated_entities={self.iterated_entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -375,14 +387,16 @@ class RenderInfo:
             ">"
         )
 
-    def _filter_domains_and_entities(self, entity_id: str) -> bool:
+    def _filter_entities_and_iterated_entities(self, entity_id: str) -> bool:
         """Template should re-render if the entity state changes.
 
-        Only when we match specific domains or entities.
+        Only when we match specific entities or entities that were read
+        while iterating over all states or a domain. The state of an
+        iterated entity that was never read cannot change the result,
+        unless the entity is added or removed which is handled by
+        filter_lifecycle.
         """
-        return (
-            split_entity_id(entity_id)[0] in self.domains or entity_id in self.entities
-        )
+        return entity_id in self.entities or entity_id in self.iterated_entities
 
     def _filter_entities(self, entity_id: str) -> bool:
         """Template should re-render if the entity state changes.
@@ -394,9 +408,10 @@ class RenderInfo:
     def _filter_lifecycle_domains(self, entity_id: str) -> bool:
         """Template should re-render if the entity is added or removed.
 
-        Only with domains watched.
+        Only with domains watched or iterated.
         """
-        return split_entity_id(entity_id)[0] in self.domains_lifecycle
+        domain = split_entity_id(entity_id)[0]
+        return domain in self.domains_lifecycle or domain in self.domains
 
     def result(self) -> str:
         """Results of the template computation."""
@@ -411,6 +426,7 @@ class RenderInfo:
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
+        self.iterated_entities = frozenset(self.iterated_entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
@@ -426,17 +442,16 @@ class RenderInfo:
         if self.exception:
             return
 
-        if not self.all_states_lifecycle:
-            if self.domains_lifecycle:
+        # Iterating over all states or a domain also depends on
+        # which entities exist
+        if not self.all_states_lifecycle and not self.all_states:
+            if self.domains_lifecycle or self.domains:
                 self.filter_lifecycle = self._filter_lifecycle_domains
             else:
                 self.filter_lifecycle = _false
 
-        if self.all_states:
-            return
-
-        if self.domains:
-            self.filter = self._filter_domains_and_entities
+        if self.all_states or self.domains:
+            self.filter = self._filter_entities_and_iterated_entities
         elif self.entities:
             self.filter = self._filter_entities
         else:
@@ -943,8 +958,11 @@ class TemplateStateBase(State):
         self._as_dict: ReadOnlyDict[str, Collection[Any]] | None = None
 
     def _collect_state(self) -> None:
-        if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+        if render_info := _render_info.get():
+            if self._collect:
+                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            else:
+                render_info.iterated_entities.add(self._entity_id)  # type: ignore[attr-defined]
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -952,8 +970,11 @@ class TemplateStateBase(State):
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
-            if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            if render_info := _render_info.get():
+                if self._collect:
+                    render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                else:
+                    render_info.iterated_entities.add(self._entity_id)  # type: ignore[attr-defined]
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1045,6 +1066,11 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.__eq__(other)
 
+    def as_dict(self) -> ReadOnlyDict[str, Collection[Any]]:
+        """Ensure we collect when the state is converted to a dict."""
+        self._collect_state()
+        return super().as_dict()
+
 
 class TemplateState(TemplateStateBase):
     """Class to represent a state object in a template."""
@@ -1059,6 +1085,7 @@ class TemplateState(TemplateStateBase):
 
     def __repr__(self) -> str:
         """Representation of Template State."""
+        self._collect_state()
         return f"<template TemplateState({self._state!r})>"
 
 
@@ -2427,6 +2454,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
+        self.template_cache_lru: LRU[
+            str | jinja2.nodes.Template, CodeType | str | None
+        ] = LRU(COMPILED_TEMPLATE_CACHE_SIZE)
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2725,8 +2755,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
+        if (cached := self.template_cache_lru.get(source)) is not None:
+            return cached
         if (cached := self.template_cache.get(source)) is None:
             cached = self.template_cache[source] = super().compile(source)
+        self.template_cache_lru[source] = cached
 
         return cached
 
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
 import sys
 from types import ModuleType
@@ -22,9 +23,11 @@ from awesomeversion import (
     AwesomeVersionException,
     AwesomeVersionStrategy,
 )
+import orjson
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -48,6 +51,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -63,6 +67,10 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+# The manifest index is stored next to the files of helpers.storage
+MANIFEST_INDEX_FILE = os.path.join(".storage", "core.manifest_index")
+MANIFEST_INDEX_VERSION = 1
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -192,6 +200,226 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+class _ManifestIndex:
+    """The manifests of integrations resolved by previous starts.
+
+    Built-in integrations are indexed per version of Home Assistant and
+    custom integrations as long as the manifests in custom_components
+    are not modified, added or removed. The dependencies of an integration
+    are indexed once resolved, so resolving them is a lookup.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key: dict[str, Any],
+        integrations: dict[str, dict[str, Any]],
+        custom_indexed: bool,
+    ) -> None:
+        """Initialize the manifest index."""
+        self.path = path
+        self.key = key
+        self.integrations = integrations
+        self.custom_indexed = custom_indexed
+        # Built-in manifests may change without a new version in development
+        self.index_built_in = ".dev" not in __version__
+        self.dirty = False
+
+    @callback
+    def async_get_integration(
+        self, hass: HomeAssistant, domain: str
+    ) -> Integration | None:
+        """Return an indexed built-in integration."""
+        if not self.index_built_in or (entry := self.integrations.get(domain)) is None:
+            return None
+        if entry["pkg_path"] != f"{PACKAGE_BUILTIN}.{domain}":
+            return None
+        return self._async_create_integration(hass, entry)
+
+    @callback
+    def async_get_custom_integrations(
+        self, hass: HomeAssistant
+    ) -> dict[str, Integration]:
+        """Return the indexed custom integrations."""
+        return {
+            domain: integration
+            for domain, entry in self.integrations.items()
+            if entry["pkg_path"].startswith(f"{PACKAGE_CUSTOM_COMPONENTS}.")
+            and (integration := self._async_create_integration(hass, entry))
+        }
+
+    @callback
+    def _async_create_integration(
+        self, hass: HomeAssistant, entry: dict[str, Any]
+    ) -> Integration | None:
+        """Create an integration from an index entry."""
+        return Integration.from_manifest(
+            hass,
+            entry["pkg_path"],
+            pathlib.Path(entry["file_path"]),
+            # The integration adds to the manifest, keep the entry as is
+            cast(Manifest, dict(entry["manifest"])),
+        )
+
+    @callback
+    def async_add(self, integration: Integration) -> None:
+        """Add the manifest of a resolved integration."""
+        if integration.is_built_in and not self.index_built_in:
+            return
+        self.integrations[integration.domain] = {
+            "pkg_path": integration.pkg_path,
+            "file_path": str(integration.file_path),
+            "manifest": integration.manifest,
+        }
+        self.dirty = True
+
+    def get_dependencies(self, integration: Integration) -> set[str] | None:
+        """Return the indexed dependencies of an integration."""
+        entry = self.integrations.get(integration.domain)
+        if (
+            entry is None
+            or entry["pkg_path"] != integration.pkg_path
+            or (dependencies := entry.get("all_dependencies")) is None
+        ):
+            return None
+        return set(dependencies)
+
+    def set_dependencies(
+        self, integration: Integration, dependencies: set[str]
+    ) -> None:
+        """Index the resolved dependencies of an integration."""
+        if not self.index_built_in:
+            # Dependencies of custom integrations include built-in ones
+            return
+        entry = self.integrations.get(integration.domain)
+        if entry is None or entry["pkg_path"] != integration.pkg_path:
+            return
+        entry["all_dependencies"] = sorted(dependencies)
+        self.dirty = True
+
+    def as_bytes(self) -> bytes:
+        """Return the index to write to disk."""
+        return orjson.dumps(
+            {
+                "key": self.key,
+                "custom_indexed": self.custom_indexed,
+                "integrations": self.integrations,
+            }
+        )
+
+
+def _custom_components_fingerprint(paths: Iterable[str]) -> list[list[Any]]:
+    """Return the size and modification time of custom integration manifests."""
+    fingerprint: list[list[Any]] = []
+    for path in paths:
+        with suppress(OSError), os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if not entry.is_dir():
+                    continue
+                try:
+                    stat = os.stat(os.path.join(entry.path, "manifest.json"))
+                except OSError:
+                    fingerprint.append([path, entry.name, None, None])
+                else:
+                    fingerprint.append(
+                        [path, entry.name, stat.st_mtime_ns, stat.st_size]
+                    )
+    return fingerprint
+
+
+def _load_manifest_index(index_path: str, custom_paths: list[str]) -> _ManifestIndex:
+    """Load the manifest index if it is still valid.
+
+    Must be called from an executor thread.
+    """
+    key = {
+        "version": [MANIFEST_INDEX_VERSION, __version__],
+        "root": generated.__path__[0],
+        "custom_components": _custom_components_fingerprint(custom_paths),
+    }
+    try:
+        data = json_loads(pathlib.Path(index_path).read_bytes())
+    except FileNotFoundError:
+        data = None
+    except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+        _LOGGER.debug("Ignoring unreadable manifest index: %s", err)
+        data = None
+    if isinstance(data, dict) and data.get("key") == key:
+        return _ManifestIndex(
+            index_path,
+            key,
+            cast(dict[str, dict[str, Any]], data["integrations"]),
+            cast(bool, data["custom_indexed"]),
+        )
+    return _ManifestIndex(index_path, key, {}, False)
+
+
+def _write_manifest_index(index_path: str, data: bytes) -> None:
+    """Write the manifest index.
+
+    Must be called from an executor thread.
+    """
+    tmp_path = f"{index_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(tmp_path, "wb") as index_file:
+            index_file.write(data)
+        os.replace(tmp_path, index_path)
+    except OSError as err:
+        _LOGGER.debug("Unable to write manifest index: %s", err)
+
+
+async def _async_get_manifest_index(hass: HomeAssistant) -> _ManifestIndex | None:
+    """Return the cached manifest index.
+
+    There is no index when custom integrations are not loaded, so the
+    index of a regular start is not replaced.
+    """
+    if hass.config.recovery_mode or hass.config.safe_mode:
+        return None
+
+    if (index_or_evt := hass.data.get(DATA_MANIFEST_INDEX)) is None:
+        evt = hass.data[DATA_MANIFEST_INDEX] = asyncio.Event()
+
+        try:
+            import custom_components  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            custom_paths: list[str] = []
+        else:
+            custom_paths = list(custom_components.__path__)
+
+        index = await hass.async_add_executor_job(
+            _load_manifest_index, hass.config.path(MANIFEST_INDEX_FILE), custom_paths
+        )
+
+        hass.data[DATA_MANIFEST_INDEX] = index
+        evt.set()
+        return index
+
+    if isinstance(index_or_evt, asyncio.Event):
+        await index_or_evt.wait()
+        return cast(_ManifestIndex, hass.data.get(DATA_MANIFEST_INDEX))
+
+    return cast(_ManifestIndex, index_or_evt)
+
+
+@callback
+def _async_get_loaded_manifest_index(hass: HomeAssistant) -> _ManifestIndex | None:
+    """Return the manifest index if it has been loaded."""
+    index = hass.data.get(DATA_MANIFEST_INDEX)
+    return index if isinstance(index, _ManifestIndex) else None
+
+
+async def async_save_manifest_index(hass: HomeAssistant) -> None:
+    """Write the manifest index if integrations were resolved since loading it."""
+    if (index := _async_get_loaded_manifest_index(hass)) is None or not index.dirty:
+        return
+    index.dirty = False
+    await hass.async_add_executor_job(
+        _write_manifest_index, index.path, index.as_bytes()
+    )
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -204,6 +432,10 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
+    index = await _async_get_manifest_index(hass)
+    if index is not None and index.custom_indexed:
+        return index.async_get_custom_integrations(hass)
+
     def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
         """Return all sub directories in a set of paths."""
         return [
@@ -223,6 +455,19 @@ async def _async_get_custom_components(
         custom_components,
         [comp.name for comp in dirs],
     )
+
+    if index is not None:
+        for integration in integrations.values():
+            index.async_add(integration)
+        # Only rely on the index when every manifest resolved, so
+        # errors in the others are logged again on the next start
+        index.custom_indexed = len(integrations) == sum(
+            1
+            for _path, _name, mtime, _size in index.key["custom_components"]
+            if mtime is not None
+        )
+        index.dirty = True
+
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -576,56 +821,70 @@ class Integration:
                 )
                 continue
 
-            integration = cls(
+            return cls.from_manifest(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 manifest_path.parent,
                 manifest,
             )
 
-            if integration.is_built_in:
-                return integration
+        return None
 
-            _LOGGER.warning(CUSTOM_WARNING, integration.domain)
-            if integration.version is None:
-                _LOGGER.error(
-                    (
-                        "The custom integration '%s' does not have a version key in the"
-                        " manifest file and was blocked from loading. See"
-                        " https://developers.home-assistant.io"
-                        "/blog/2021/01/29/custom-integration-changes#versions"
-                        " for more details"
-                    ),
-                    integration.domain,
-                )
-                return None
-            try:
-                AwesomeVersion(
-                    integration.version,
-                    ensure_strategy=[
-                        AwesomeVersionStrategy.CALVER,
-                        AwesomeVersionStrategy.SEMVER,
-                        AwesomeVersionStrategy.SIMPLEVER,
-                        AwesomeVersionStrategy.BUILDVER,
-                        AwesomeVersionStrategy.PEP440,
-                    ],
-                )
-            except AwesomeVersionException:
-                _LOGGER.error(
-                    (
-                        "The custom integration '%s' does not have a valid version key"
-                        " (%s) in the manifest file and was blocked from loading. See"
-                        " https://developers.home-assistant.io"
-                        "/blog/2021/01/29/custom-integration-changes#versions"
-                        " for more details"
-                    ),
-                    integration.domain,
-                    integration.version,
-                )
-                return None
+    @classmethod
+    def from_manifest(
+        cls,
+        hass: HomeAssistant,
+        pkg_path: str,
+        file_path: pathlib.Path,
+        manifest: Manifest,
+    ) -> Integration | None:
+        """Create an integration from its manifest.
+
+        Returns None if it is a custom integration without a valid version.
+        """
+        integration = cls(hass, pkg_path, file_path, manifest)
+
+        if integration.is_built_in:
             return integration
 
-        return None
+        _LOGGER.warning(CUSTOM_WARNING, integration.domain)
+        if integration.version is None:
+            _LOGGER.error(
+                (
+                    "The custom integration '%s' does not have a version key in the"
+                    " manifest file and was blocked from loading. See"
+                    " https://developers.home-assistant.io"
+                    "/blog/2021/01/29/custom-integration-changes#versions"
+                    " for more details"
+                ),
+                integration.domain,
+            )
+            return None
+        try:
+            AwesomeVersion(
+                integration.version,
+                ensure_strategy=[
+                    AwesomeVersionStrategy.CALVER,
+                    AwesomeVersionStrategy.SEMVER,
+                    AwesomeVersionStrategy.SIMPLEVER,
+                    AwesomeVersionStrategy.BUILDVER,
+                    AwesomeVersionStrategy.PEP440,
+                ],
+            )
+        except AwesomeVersionException:
+            _LOGGER.error(
+                (
+                    "The custom integration '%s' does not have a valid version key"
+                    " (%s) in the manifest file and was blocked from loading. See"
+                    " https://developers.home-assistant.io"
+                    "/blog/2021/01/29/custom-integration-changes#versions"
+                    " for more details"
+                ),
+                integration.domain,
+                integration.version,
+            )
+            return None
+        return integration
 
     def __init__(
         self,
@@ -782,6 +1041,15 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        index = _async_get_loaded_manifest_index(self.hass)
+        if (
+            index is not None
+            and (dependencies := index.get_dependencies(self)) is not None
+        ):
+            self._all_dependencies = dependencies
+            self._all_dependencies_resolved = True
+            return True
+
         self._all_dependencies_resolved = False
         try:
             dependencies = await _async_component_dependencies(self.hass, self)
@@ -808,6 +1076,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if index is not None:
+                index.set_dependencies(self, dependencies)
 
         return self._all_dependencies_resolved
 
@@ -953,6 +1223,13 @@ async def async_get_integrations(
         if domain in needed:
             del needed[domain]
 
+    # Then we look for built-in integrations resolved by previous starts
+    if (index := await _async_get_manifest_index(hass)) is not None:
+        for domain in list(needed):
+            if integration := index.async_get_integration(hass, domain):
+                results[domain] = cache[domain] = integration
+                needed.pop(domain).set_result(None)
+
     # Now the rest use resolve_from_root
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
@@ -972,6 +1249,8 @@ async def async_get_integrations(
                 results[domain] = exc
             else:
                 results[domain] = cache[domain] = int_or_exc
+                if index is not None:
+                    index.async_add(int_or_exc)
             future.set_result(None)
 
     return results
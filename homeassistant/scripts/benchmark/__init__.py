@@ -12,7 +12,7 @@ from timeit import default_timer as timer
 from typing import TypeVar
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -120,6 +120,42 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_match_all_listener(hass):
+    """Fire a million events with a MATCH_ALL listener and 2000 entity listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(MATCH_ALL, listener, run_immediately=True)
+    async_track_state_change_event(
+        hass, [f"{entity_id}{idx}" for idx in range(2000)], listener
+    )
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == 2 * events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -314,6 +350,177 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 100k topics against 10k MQTT wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import MQTT
+
+    mqtt_client = MQTT(hass, None, {})
+    devices = 10**4
+    topics_to_match = 10**5
+
+    @core.callback
+    def msg_callback(msg):
+        """Handle message."""
+
+    for idx in range(devices):
+        await mqtt_client.async_subscribe(
+            f"zigbee2mqtt/device_{idx}/+/state", msg_callback, 0
+        )
+    await mqtt_client.async_subscribe("tasmota/discovery/+/config", msg_callback, 0)
+    await mqtt_client.async_subscribe("homeassistant/#", msg_callback, 0)
+
+    topics = [
+        f"zigbee2mqtt/device_{idx % devices}/endpoint_{idx}/state"
+        for idx in range(topics_to_match)
+    ]
+
+    start = timer()
+
+    for topic in topics:
+        assert len(mqtt_client._matching_subscriptions(topic)) == 1
+
+    return timer() - start
+
+
+@benchmark
+async def reduce_statistics(hass):
+    """Reduce a million hourly statistics rows to daily and monthly statistics."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    statistic_ids = 100
+    rows_per_statistic = 10**4
+    first_start = 1672531200.0  # 2023-01-01T00:00:00+00:00
+    stats = {
+        f"sensor.energy_{idx}": [
+            {
+                "start": (start := first_start + hour * 3600),
+                "end": start + 3600,
+                "mean": float(hour % 24),
+                "min": float(hour % 12),
+                "max": float(hour % 36),
+                "state": float(hour),
+                "sum": float(hour * 2),
+            }
+            for hour in range(rows_per_statistic)
+        ]
+        for idx in range(statistic_ids)
+    }
+    types = {"mean", "min", "max", "state", "sum"}
+
+    start = timer()
+
+    statistics._reduce_statistics_per_day(stats, types)
+    statistics._reduce_statistics_per_month(stats, types)
+
+    return timer() - start
+
+
+@benchmark
+async def logbook_humanify(hass):
+    """Humanify a million logbook rows that share 100k contexts."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.logbook.const import DOMAIN as LOGBOOK_DOMAIN
+    from homeassistant.components.logbook.models import LogbookConfig
+    from homeassistant.components.logbook.processor import EventProcessor
+    from homeassistant.components.logbook.queries.common import (
+        PSEUDO_EVENT_STATE_CHANGED,
+    )
+    from homeassistant.const import EVENT_CALL_SERVICE, EVENT_LOGBOOK_ENTRY
+    from homeassistant.helpers import entity_registry as er
+
+    # pylint: enable=import-outside-toplevel
+
+    await er.async_load(hass)
+    hass.data[LOGBOOK_DOMAIN] = LogbookConfig({})
+    for idx in range(1000):
+        hass.states.async_set(
+            f"light.kitchen_{idx}", "on", {"friendly_name": f"Kitchen {idx}"}
+        )
+
+    row = collections.namedtuple(
+        "Row",
+        [
+            "row_id",
+            "event_type",
+            "event_data",
+            "time_fired_ts",
+            "context_id_bin",
+            "context_user_id_bin",
+            "context_parent_id_bin",
+            "state",
+            "entity_id",
+            "icon",
+            "context_only",
+        ],
+    )
+    first_time_fired = 1672531200.0  # 2023-01-01T00:00:00+00:00
+    rows = []
+    for idx in range(10**6):
+        time_fired_ts = first_time_fired + idx
+        if idx % 10 == 0:
+            # Each service call starts a context for the next nine rows
+            context_id_bin = idx.to_bytes(16, "big")
+            rows.append(
+                row(
+                    idx,
+                    EVENT_CALL_SERVICE,
+                    '{"domain":"light","service":"turn_on"}',
+                    time_fired_ts,
+                    context_id_bin,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                )
+            )
+        elif idx % 10 == 1:
+            rows.append(
+                row(
+                    idx,
+                    EVENT_LOGBOOK_ENTRY,
+                    '{"name":"Kitchen","message":"turned on","domain":"light"}',
+                    time_fired_ts,
+                    context_id_bin,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                    None,
+                )
+            )
+        else:
+            rows.append(
+                row(
+                    idx,
+                    PSEUDO_EVENT_STATE_CHANGED,
+                    None,
+                    time_fired_ts,
+                    context_id_bin,
+                    None,
+                    None,
+                    "on" if idx % 2 else "off",
+                    f"light.kitchen_{idx % 1000}",
+                    None,
+                    None,
+                )
+            )
+    event_processor = EventProcessor(
+        hass, (EVENT_CALL_SERVICE, EVENT_LOGBOOK_ENTRY), timestamp=True
+    )
+
+    start = timer()
+
+    assert len(event_processor.humanify(rows)) == 9 * 10**5
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
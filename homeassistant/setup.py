@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
+from dataclasses import dataclass
 from datetime import timedelta
 import logging.handlers
 from timeit import default_timer as timer
@@ -53,6 +55,12 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_SPANS is a list[SetupSpan], recording the phases of setting up
+# integrations while Home Assistant is starting:
+# - The list is created by bootstrap before integrations are set up.
+# - Spans are added by async_trace_setup_phase when a phase finishes.
+DATA_SETUP_SPANS = "setup_spans"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
@@ -66,6 +74,17 @@ SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
 
+@dataclass(slots=True, frozen=True)
+class SetupSpan:
+    """A phase of setting up an integration."""
+
+    name: str
+    phase: str
+    start: float
+    end: float
+    waits_on: tuple[str, ...] = ()
+
+
 @callback
 def async_notify_setup_error(
     hass: HomeAssistant, component: str, display_link: str | None = None
@@ -182,10 +201,16 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with async_trace_setup_phase(
+        hass,
+        integration.domain,
+        "wait_dependencies",
+        [*dependencies_tasks, *after_dependencies_tasks],
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -248,14 +273,16 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_trace_setup_phase(hass, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    integration_config_info = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_trace_setup_phase(hass, domain, "config"):
+        integration_config_info = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
     processed_config = conf_util.async_handle_component_errors(
         hass, integration_config_info, integration
     )
@@ -328,8 +355,9 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with async_trace_setup_phase(hass, domain, "setup"):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 (
@@ -462,10 +490,11 @@ async def async_process_deps_reqs(
     if failed_deps := await _async_process_dependencies(hass, config, integration):
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_trace_setup_phase(hass, integration.domain, "requirements"):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -568,3 +597,50 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+
+
+@contextlib.contextmanager
+def async_trace_setup_phase(
+    hass: core.HomeAssistant, name: str, phase: str, waits_on: Iterable[str] = ()
+) -> Generator[None, None, None]:
+    """Record a phase of setting up an integration while Home Assistant is starting.
+
+    waits_on are the integrations the phase is waiting for to be set up.
+    """
+    spans: list[SetupSpan] | None = hass.data.get(DATA_SETUP_SPANS)
+    if spans is None or hass.state is not core.CoreState.not_running:
+        yield
+        return
+    start = timer()
+    try:
+        yield
+    finally:
+        spans.append(SetupSpan(name, phase, start, timer(), tuple(waits_on)))
+
+
+def async_get_setup_critical_path(spans: Iterable[SetupSpan]) -> list[str]:
+    """Return the chain of integrations startup had to wait for in order.
+
+    Starting from the integration that finished setting up last, follow
+    the dependency it waited for the longest until reaching an integration
+    that did not wait for any other integration.
+    """
+    ends: dict[str, float] = {}
+    waits_on: defaultdict[str, set[str]] = defaultdict(set)
+    for span in spans:
+        if "." in span.name:
+            # Platforms are not waited for by other integrations
+            continue
+        ends[span.name] = max(ends.get(span.name, span.end), span.end)
+        waits_on[span.name].update(span.waits_on)
+    if not ends:
+        return []
+    critical_path = [max(ends, key=ends.__getitem__)]
+    while dependencies := [
+        dependency
+        for dependency in waits_on[critical_path[-1]]
+        if dependency in ends and dependency not in critical_path
+    ]:
+        critical_path.append(max(dependencies, key=ends.__getitem__))
+    critical_path.reverse()
+    return critical_path
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
-from contextlib import suppress
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 import fnmatch
+import hashlib
 from io import StringIO, TextIOWrapper
 import logging
 import os
@@ -40,6 +42,64 @@ class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
 
 
+def _path_digest(path: str) -> str | None:
+    """Return a digest of the content of a file or directory or None if missing."""
+    try:
+        if os.path.isdir(path):
+            content = "\0".join(sorted(os.listdir(path))).encode()
+        else:
+            content = Path(path).read_bytes()
+    except OSError:
+        return None
+    return hashlib.sha256(content).hexdigest()
+
+
+class YamlDependencies:
+    """Track what the result of loading a YAML file depends on.
+
+    These are the files and directories that were read, including
+    secrets files that were looked for but do not exist, and the
+    environment variables that were substituted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the dependencies."""
+        self.paths: dict[str, str | None] = {}
+        self.env_vars: dict[str, str | None] = {}
+
+    def add_path(self, path: str) -> None:
+        """Add a file or directory."""
+        self.paths[path] = _path_digest(path)
+
+    def add_env_var(self, name: str) -> None:
+        """Add an environment variable."""
+        self.env_vars[name] = os.environ.get(name)
+
+    def unchanged(self) -> bool:
+        """Return if none of the dependencies changed since they were added."""
+        return all(
+            _path_digest(path) == digest for path, digest in self.paths.items()
+        ) and all(
+            os.environ.get(name) == value for name, value in self.env_vars.items()
+        )
+
+
+_dependencies_cv: ContextVar[YamlDependencies | None] = ContextVar(
+    "yaml_dependencies", default=None
+)
+
+
+@contextmanager
+def track_dependencies() -> Iterator[YamlDependencies]:
+    """Track the dependencies of the YAML files loaded in this context."""
+    dependencies = YamlDependencies()
+    token = _dependencies_cv.set(dependencies)
+    try:
+        yield dependencies
+    finally:
+        _dependencies_cv.reset(token)
+
+
 class Secrets:
     """Store secrets while loading YAML."""
 
@@ -76,7 +136,10 @@ class Secrets:
 
     def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
-        if (secret_path := secret_dir / SECRET_YAML) in self._cache:
+        secret_path = secret_dir / SECRET_YAML
+        if dependencies := _dependencies_cv.get():
+            dependencies.add_path(str(secret_path))
+        if secret_path in self._cache:
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
@@ -217,6 +280,8 @@ LoaderType = FastSafeLoader | PythonSafeLoader
 
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE | None:
     """Load a YAML file."""
+    if dependencies := _dependencies_cv.get():
+        dependencies.add_path(fname)
     try:
         with open(fname, encoding="utf-8") as conf_file:
             return parse_yaml(conf_file, secrets)
@@ -339,7 +404,12 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    dependencies = _dependencies_cv.get()
+    if dependencies:
+        dependencies.add_path(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
+        if dependencies:
+            dependencies.add_path(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -465,6 +535,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if dependencies := _dependencies_cv.get():
+        dependencies.add_env_var(args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -523,6 +523,110 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends long time ranges in chunks."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    end_time = dt_util.utcnow()
+    start_time = end_time - timedelta(days=3)
+    state_times = [
+        start_time + timedelta(hours=1),
+        start_time + timedelta(days=1),
+        start_time + timedelta(days=2, hours=12),
+    ]
+    for state_time, state in zip(state_times, ("on", "off", "on")):
+        with freeze_time(state_time):
+            hass.states.async_set("sensor.one", state, attributes={"any": "attr"})
+            await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    streamed_states = []
+    for state_time in state_times:
+        response = await client.receive_json()
+        assert response["type"] == "event"
+        assert response["event"]["end_time"] == state_time.timestamp()
+        streamed_states.extend(response["event"]["states"]["sensor.one"])
+    assert streamed_states == [
+        {"lu": state_times[0].timestamp(), "s": "on"},
+        {"lu": state_times[1].timestamp(), "s": "off"},
+        {"lu": state_times[2].timestamp(), "s": "on"},
+    ]
+
+
+async def test_history_stream_historical_only_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream downsamples numeric states to max_points."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    end_time = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    start_time = end_time - timedelta(hours=4)
+    state_times = [
+        start_time + timedelta(hours=1, minutes=minutes) for minutes in range(6)
+    ]
+    for state_time, state in zip(state_times, ("3", "5", "1", "2", "4", "unknown")):
+        with freeze_time(state_time):
+            hass.states.async_set("sensor.one", state)
+            await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    # The whole range is a single bucket so the first, minimum,
+    # maximum and last numeric states are kept along with the
+    # state that is not numeric
+    assert response["event"]["states"]["sensor.one"] == [
+        {"lu": state_times[0].timestamp(), "s": "3"},
+        {"lu": state_times[1].timestamp(), "s": "5"},
+        {"lu": state_times[2].timestamp(), "s": "1"},
+        {"lu": state_times[4].timestamp(), "s": "4"},
+        {"lu": state_times[5].timestamp(), "s": "unknown"},
+    ]
+
+
 async def test_history_stream_significant_domain_historical_only(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -256,6 +256,42 @@ async def test_home_assistant_start(hass_) -> None:
     assert_entry(entries[1], pointA, "bla", entity_id=entity_id)
 
 
+async def test_context_described_once(hass_) -> None:
+    """Test rows sharing a context only describe the context row once."""
+    describe_calls = 0
+
+    def _describe(event: LazyEventPartialState) -> dict[str, str]:
+        nonlocal describe_calls
+        describe_calls += 1
+        return {"name": "Test", "message": "fired", "entity_id": "light.test"}
+
+    hass_.data[logbook.DOMAIN].external_events["test_event"] = ("test", _describe)
+    context = ha.Context()
+    context_row = MockRow("test_event", {}, context)
+    context_row.row_id = 1
+    rows = [context_row]
+    for row_id in range(2, 5):
+        row = MockRow(
+            EVENT_LOGBOOK_ENTRY,
+            {"name": f"Entry {row_id}", "message": "logged", "domain": "test"},
+            context,
+        )
+        row.row_id = row_id
+        rows.append(row)
+
+    entries = mock_humanify(hass_, rows)
+
+    assert len(entries) == 4
+    # Once for the context row itself and once to describe its context
+    assert describe_calls == 2
+    for entry in entries[1:]:
+        assert entry["context_event_type"] == "test_event"
+        assert entry["context_domain"] == "test"
+        assert entry["context_name"] == "Test"
+        assert entry["context_message"] == "fired"
+        assert entry["context_entity_id"] == "light.test"
+
+
 def test_process_custom_logbook_entries(hass_) -> None:
     """Test if custom log book entries get added as an entry."""
     name = "Nice name"
@@ -49,6 +49,7 @@ async def test_entry_diagnostics(
         "devices": [],
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
+        "received_messages": {"backlog_max": 0, "deferred_batches": 0},
     }
 
     # Discover a device with an entity and a trigger
@@ -133,6 +134,7 @@ async def test_entry_diagnostics(
         "devices": [expected_device],
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
+        "received_messages": {"backlog_max": 0, "deferred_batches": 0},
     }
 
     assert await get_diagnostics_for_device(
@@ -142,6 +144,7 @@ async def test_entry_diagnostics(
         "device": expected_device,
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
+        "received_messages": {"backlog_max": 0, "deferred_batches": 0},
     }
 
 
@@ -260,6 +263,7 @@ async def test_redact_diagnostics(
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
+        "received_messages": {"backlog_max": 0, "deferred_batches": 0},
     }
 
     assert await get_diagnostics_for_device(
@@ -269,4 +273,5 @@ async def test_redact_diagnostics(
         "device": expected_device,
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
+        "received_messages": {"backlog_max": 0, "deferred_batches": 0},
     }
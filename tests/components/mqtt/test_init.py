@@ -1,5 +1,6 @@
 """The tests for the MQTT component."""
 import asyncio
+from collections import deque
 from collections.abc import Generator
 from datetime import datetime, timedelta
 from functools import partial
@@ -14,7 +15,11 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -1296,6 +1301,50 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert calls[0].payload == "test-payload"
 
 
+def test_subscription_trie() -> None:
+    """Test matching and removing wildcard subscriptions in the trie."""
+    trie = SubscriptionTrie()
+    job = ha.HassJob(lambda msg: None)
+    subscriptions = {
+        topic: Subscription(topic, job)
+        for topic in (
+            "#",
+            "+/+",
+            "sensor/+/state",
+            "sensor/#",
+            "sensor/+/+/config",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    def _match(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.match(topic)}
+
+    assert _match("sensor") == {"#", "sensor/#"}
+    assert _match("sensor/kitchen") == {"#", "+/+", "sensor/#"}
+    assert _match("sensor/kitchen/state") == {"#", "sensor/+/state", "sensor/#"}
+    assert _match("sensor//state") == {"#", "sensor/+/state", "sensor/#"}
+    assert _match("sensor/a/b/config") == {"#", "sensor/#", "sensor/+/+/config"}
+    assert _match("light/kitchen/state") == {"#"}
+    assert _match("$SYS/broker") == {"$SYS/#"}
+    assert _match("$SYS") == {"$SYS/#"}
+    assert "sensor/+/state" in trie
+    assert set(trie) == set(subscriptions.values())
+
+    trie.remove(subscriptions["sensor/+/+/config"])
+    assert _match("sensor/a/b/config") == {"#", "sensor/#"}
+    assert "sensor/+/+/config" not in trie
+    trie.remove(subscriptions["sensor/#"])
+    trie.remove(subscriptions["sensor/+/state"])
+    assert _match("sensor/kitchen/state") == {"#"}
+    assert "sensor" not in trie._root.children
+
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["sensor/#"])
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -2119,6 +2168,126 @@ async def test_handle_message_callback(
     assert callbacks[0].payload == "test-payload"
 
 
+async def test_handle_message_callback_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test a flood of incoming messages is handled in bounded batches."""
+    callbacks = []
+
+    @callback
+    def _callback(args) -> None:
+        callbacks.append(args)
+
+    mock_mqtt = await mqtt_mock_entry()
+    mqtt_client_mock.on_connect(mqtt_client_mock, None, None, 0)
+    await mqtt.async_subscribe(hass, "some-topic/#", _callback)
+    # The MQTT client instance the paho callbacks are bound to
+    client = mqtt_client_mock.on_message.__self__
+
+    with patch("homeassistant.components.mqtt.client.MAX_MESSAGES_PER_BATCH", 2):
+        for idx in range(5):
+            msg = ReceiveMessage(
+                f"some-topic/{idx}", b"test-payload", 0, True, "", datetime.now()
+            )
+            await hass.async_add_executor_job(
+                mqtt_client_mock.on_message, mock_mqtt, None, msg
+            )
+        await hass.async_block_till_done()
+
+    assert [msg.topic for msg in callbacks] == [f"some-topic/{idx}" for idx in range(5)]
+    assert not client._received_messages
+    assert client.received_messages_backlog_max >= 1
+    assert client.received_messages_deferred_batches == 0
+
+    callbacks.clear()
+    with patch("homeassistant.components.mqtt.client.MAX_MESSAGES_PER_BATCH", 2):
+        for idx in range(5):
+            msg = ReceiveMessage(
+                f"some-topic/{idx}", b"test-payload", 0, False, "", datetime.now()
+            )
+            mqtt_client_mock.on_message(mock_mqtt, None, msg)
+        # Each batch is handled in its own event loop iteration
+        for _ in range(3):
+            assert client._received_messages
+            await asyncio.sleep(0)
+
+    assert [msg.topic for msg in callbacks] == [f"some-topic/{idx}" for idx in range(5)]
+    assert client.received_messages_backlog_max == 5
+    assert client.received_messages_deferred_batches == 2
+
+
+async def test_handle_message_received_while_reading_backlog(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test a message received while the backlog is read is not left behind."""
+    callbacks = []
+
+    @callback
+    def _callback(args) -> None:
+        callbacks.append(args)
+
+    mock_mqtt = await mqtt_mock_entry()
+    mqtt_client_mock.on_connect(mqtt_client_mock, None, None, 0)
+    await mqtt.async_subscribe(hass, "some-topic/#", _callback)
+    client = mqtt_client_mock.on_message.__self__
+    late_msg = ReceiveMessage(
+        "some-topic/late", b"test-payload", 0, False, "", datetime.now()
+    )
+
+    class _RacingDeque(deque):
+        """Receive a message from the paho thread while the length is read."""
+
+        def __len__(self) -> int:
+            length = super().__len__()
+            if late_msg not in self and not callbacks:
+                mqtt_client_mock.on_message(mock_mqtt, None, late_msg)
+            return length
+
+    client._received_messages = _RacingDeque()
+    msg = ReceiveMessage("some-topic/1", b"test-payload", 0, False, "", datetime.now())
+    mqtt_client_mock.on_message(mock_mqtt, None, msg)
+    await hass.async_block_till_done()
+
+    assert [msg.topic for msg in callbacks] == ["some-topic/1", "some-topic/late"]
+    assert not client._received_messages
+
+
+async def test_handle_message_callback_raises(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test the rest of a batch is handled when handling a message raises."""
+    await mqtt_mock_entry()
+    client = mqtt_client_mock.on_message.__self__
+    handled = []
+
+    def _handle_message(msg) -> None:
+        handled.append(msg.topic)
+        if msg.topic == "some-topic/0":
+            raise ValueError("boom")
+
+    for idx in range(3):
+        client._received_messages.append(
+            ReceiveMessage(
+                f"some-topic/{idx}", b"test-payload", 0, False, "", datetime.now()
+            )
+        )
+    # The call handling the messages is running
+    client._received_messages_scheduled = True
+    with patch.object(client, "_mqtt_handle_message", side_effect=_handle_message):
+        with pytest.raises(ValueError, match="boom"):
+            client._mqtt_handle_received_messages()
+        await hass.async_block_till_done()
+
+    assert handled == ["some-topic/0", "some-topic/1", "some-topic/2"]
+    assert not client._received_messages
+
+
 @pytest.mark.parametrize(
     "hass_config",
     [
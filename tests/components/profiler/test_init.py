@@ -13,6 +13,7 @@ from homeassistant.components.profiler import (
     _SQLALCHEMY_LRU_OBJECT,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_STARTUP_TRACE,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
@@ -27,7 +28,9 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import DATA_SETUP_SPANS, SetupSpan
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import load_json
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -94,6 +97,61 @@ async def test_memory_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     await hass.async_block_till_done()
 
 
+async def test_dump_startup_trace(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test we can dump the setup phases recorded at startup as a trace."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_STARTUP_TRACE)
+
+    with pytest.raises(
+        HomeAssistantError, match="No setup of integrations was recorded at startup"
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    hass.data[DATA_SETUP_SPANS] = [
+        SetupSpan("http", "setup", 10.0, 10.5),
+        SetupSpan("hue", "wait_dependencies", 10.0, 10.5, ("http",)),
+        SetupSpan("hue", "setup", 10.5, 11.0),
+        SetupSpan("hue.light", "platform", 11.0, 11.25),
+    ]
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(tmp_path / filename)
+        return last_filename
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    trace = load_json(last_filename)
+    assert trace["otherData"] == {"critical_path": ["http", "hue"]}
+    spans = {
+        event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"
+    }
+    assert spans["http setup"]["ts"] == 0
+    assert spans["http setup"]["dur"] == 500000
+    assert spans["hue wait_dependencies"]["args"] == {
+        "critical_path": True,
+        "waits_on": ["http"],
+    }
+    assert spans["hue.light platform"]["ts"] == 1000000
+    assert spans["hue.light platform"]["tid"] == spans["hue setup"]["tid"]
+    assert spans["hue setup"]["tid"] != spans["http setup"]["tid"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_object_growth_logging(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
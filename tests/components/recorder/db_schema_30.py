@@ -414,32 +414,39 @@ class States(Base):  # type: ignore[misc,valid-type]
     @staticmethod
     def from_event(event: Event) -> States:
         """Create object from a state_changed event."""
-        entity_id = event.data["entity_id"]
+        return States(**States.params_from_event(event))
+
+    @staticmethod
+    def params_from_event(event: Event) -> dict[str, Any]:
+        """Create the insert parameters for a row from a state_changed event."""
         state: State | None = event.data.get("new_state")
-        dbstate = States(
-            entity_id=entity_id,
-            attributes=None,
-            context_id=event.context.id,
-            context_user_id=event.context.user_id,
-            context_parent_id=event.context.parent_id,
-            origin_idx=EVENT_ORIGIN_TO_IDX.get(event.origin),
-        )
+        params: dict[str, Any] = {
+            "entity_id": event.data["entity_id"],
+            "attributes": None,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+            "origin_idx": EVENT_ORIGIN_TO_IDX.get(event.origin),
+            "old_state_id": None,
+            "attributes_id": None,
+            "metadata_id": None,
+        }
 
         # None state means the state was removed from the state machine
         if state is None:
-            dbstate.state = ""
-            dbstate.last_updated = event.time_fired
-            dbstate.last_changed = None
-            return dbstate
+            params["state"] = ""
+            params["last_updated"] = event.time_fired
+            params["last_changed"] = None
+            return params
 
-        dbstate.state = state.state
-        dbstate.last_updated = state.last_updated
+        params["state"] = state.state
+        params["last_updated"] = state.last_updated
         if state.last_updated == state.last_changed:
-            dbstate.last_changed = None
+            params["last_changed"] = None
         else:
-            dbstate.last_changed = state.last_changed
+            params["last_changed"] = state.last_changed
 
-        return dbstate
+        return params
 
     def to_native(self, validate_entity_id: bool = True) -> State | None:
         """Convert to an HA state object."""
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -377,17 +378,14 @@ def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_queued(*args, **kwargs):
+        if get_instance(hass).states_manager.has_queued:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
-        side_effect=_throw_if_state_in_session,
+        side_effect=_throw_if_state_queued,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -407,6 +405,78 @@ def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+def test_saving_state_retried_after_insert_fails(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test queued states are inserted again when the insert is retried."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    session = instance.event_session
+    execute = session.execute
+    failed = False
+
+    def _fail_first_states_insert(statement, *args, **kwargs):
+        nonlocal failed
+        if (
+            not failed
+            and getattr(statement, "is_insert", False)
+            and statement.table.name == "states"
+        ):
+            failed = True
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return execute(statement, *args, **kwargs)
+
+    with patch("time.sleep"), patch.object(
+        session, "execute", side_effect=_fail_first_states_insert
+    ):
+        hass.states.set("test.recorder", "on", {"test_attr": 5})
+        wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].state == "on"
+
+
+def test_saving_state_not_duplicated_when_commit_retried(
+    hass_recorder: Callable[..., HomeAssistant],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test states inserted before a failed commit are not inserted again."""
+    hass = hass_recorder()
+    instance = get_instance(hass)
+    session = instance.event_session
+    commit = session.commit
+    failed = False
+
+    def _fail_first_commit():
+        nonlocal failed
+        if not failed and instance.states_manager.has_queued:
+            failed = True
+            raise OperationalError("COMMIT", "fake params", "database is locked")
+        return commit()
+
+    with patch("time.sleep"), patch.object(
+        session, "commit", side_effect=_fail_first_commit
+    ):
+        hass.states.set("test.recorder", "on", {"test_attr": 5})
+        hass.states.set("test.recorder", "off", {"test_attr": 5})
+        wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States).order_by(States.state_id))
+        assert len(db_states) == 2
+        assert [db_state.state for db_state in db_states] == ["on", "off"]
+        assert db_states[1].old_state_id == db_states[0].state_id
+
+
 def test_saving_state_with_sqlalchemy_exception(
     hass_recorder: Callable[..., HomeAssistant],
     hass: HomeAssistant,
@@ -419,17 +489,14 @@ def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_queued(*args, **kwargs):
+        if get_instance(hass).states_manager.has_queued:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
         get_instance(hass).event_session,
         "flush",
-        side_effect=_throw_if_state_in_session,
+        side_effect=_throw_if_state_queued,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -1390,6 +1457,60 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+def test_saving_sets_old_state_inside_commit_interval(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test saving sets old state for states inserted in the same commit."""
+    hass = hass_recorder()
+
+    hass.states.set("test.one", "s1", {"attr": 1})
+    hass.states.set("test.one", "s2", {"attr": 2})
+    hass.states.set("test.two", "s3", {})
+    hass.states.set("test.one", "s4", {"attr": 1})
+    hass.states.remove("test.one")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 5
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.one"
+        assert states_by_state["s3"].entity_id == "test.two"
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state[None].entity_id == "test.one"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state[None].old_state_id == states_by_state["s4"].state_id
+
+        assert states_by_state["s1"].attributes_id is not None
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s4"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id != states_by_state["s2"].attributes_id
+        )
+
+    hass.states.set("test.one", "s5", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        state = session.query(States).filter(States.state == "s5").one()
+        assert state.old_state_id is None
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1964,6 +2085,40 @@ async def test_in_memory_database(
     assert "In-memory SQLite database is not supported" in caplog.text
 
 
+async def test_events_spooled_while_behind_are_recorded_in_order(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test spooled events are recorded once the recorder catches up."""
+    entity_id = "test.spooled"
+    await async_wait_recording_done(hass)
+
+    def _get_states() -> list[tuple[str, int | None, int]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (db_state.state, db_state.old_state_id, db_state.state_id)
+                for db_state in session.query(States)
+                .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .filter(StatesMeta.entity_id == entity_id)
+                .order_by(States.state_id)
+            ]
+
+    recorder_mock._spool.async_start()
+    hass.states.async_set(entity_id, "1", {"test_attr": 5})
+    hass.states.async_set(entity_id, "2", {"test_attr": 5})
+    await async_wait_recording_done(hass)
+    assert await recorder_mock.async_add_executor_job(_get_states) == []
+
+    # The queue watcher stops spooling since the backlog is empty
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=1))
+    await async_wait_recording_done(hass)
+    assert not recorder_mock._spool.active
+
+    db_states = await recorder_mock.async_add_executor_job(_get_states)
+    assert [state for state, _, _ in db_states] == ["1", "2"]
+    assert db_states[1][1] == db_states[0][2]
+    assert recorder_mock._spool.events_replayed == 2
+
+
 async def test_database_connection_keep_alive(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -2006,6 +2161,34 @@ async def test_database_connection_keep_alive_disabled_on_sqlite(
     assert "Sending keepalive" not in caplog.text
 
 
+async def test_database_executor_connections_are_read_only_on_sqlite(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test the database executor cannot write to a SQLite database."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # This test is specific for SQLite
+        return
+
+    # On-disk database because the MutexPool shares a single connection
+    recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_DB_URL: recorder_db_url}
+    )
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    def _read_and_try_to_write() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.query(States).count() == 1
+            with pytest.raises(OperationalError, match="readonly"):
+                session.execute(text("DELETE FROM states"))
+
+    await instance.async_add_executor_job(_read_and_try_to_write)
+
+
 def test_deduplication_event_data_inside_commit_interval(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
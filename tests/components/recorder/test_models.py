@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
 from datetime import datetime, timedelta
+from typing import Any
 from unittest.mock import PropertyMock
 
 from freezegun import freeze_time
@@ -13,18 +14,22 @@ from homeassistant.components.recorder.db_schema import (
     States,
 )
 from homeassistant.components.recorder.models import (
+    CompressedStates,
     LazyState,
     bytes_to_ulid_or_none,
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
+    row_to_compressed_state,
     ulid_to_bytes_or_none,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 
 def test_from_event_to_db_event() -> None:
@@ -370,6 +375,68 @@ async def test_lazy_state_handles_same_last_updated_and_last_changed(
     }
 
 
+def test_compressed_states_match_row_to_compressed_state() -> None:
+    """Test CompressedStates rows match the rows of row_to_compressed_state."""
+    now_ts = datetime(2021, 6, 12, 3, 4, 1, 323, tzinfo=dt_util.UTC).timestamp()
+    rows = [
+        PropertyMock(
+            state="on",
+            attributes='{"shared":true}',
+            last_updated_ts=0,
+            last_changed_ts=0,
+        ),
+        PropertyMock(
+            state="off",
+            attributes='{"shared":true}',
+            last_updated_ts=now_ts + 1,
+            last_changed_ts=now_ts + 1,
+        ),
+        PropertyMock(
+            state="on",
+            attributes=None,
+            last_updated_ts=now_ts + 2,
+            last_changed_ts=now_ts + 1,
+        ),
+    ]
+    compressed_states = CompressedStates()
+    attr_cache: dict[str, dict[str, Any]] = {}
+    expected = []
+    for row in rows:
+        compressed_states.append_row(
+            row,
+            attr_cache,
+            now_ts,
+            "sensor.valid",
+            row.state,
+            row.last_updated_ts,
+            False,
+        )
+        expected.append(
+            row_to_compressed_state(
+                row, {}, now_ts, "sensor.valid", row.state, row.last_updated_ts, False
+            )
+        )
+    compressed_states.append_state("off", now_ts + 3)
+    expected.append({"s": "off", "lu": now_ts + 3})
+
+    assert len(compressed_states) == 4
+    assert list(compressed_states) == expected
+    assert compressed_states[-1] == expected[-1]
+    assert compressed_states[1:3] == expected[1:3]
+    # Identical attributes are decoded once and shared
+    assert compressed_states[0]["a"] is compressed_states[1]["a"]
+    assert list(compressed_states.state_changes()) == [
+        ("on", now_ts),
+        ("off", now_ts + 1),
+        ("on", now_ts + 1),
+        ("off", now_ts + 3),
+    ]
+    assert json_loads(json_bytes(compressed_states.json_fragment())) == expected
+
+    compressed_states.reverse()
+    assert list(compressed_states) == expected[::-1]
+
+
 @pytest.mark.parametrize(
     "time_zone", ["Europe/Berlin", "America/Chicago", "US/Hawaii", "UTC"]
 )
@@ -464,3 +531,26 @@ def test_bytes_to_ulid_or_none(caplog: pytest.LogCaptureFixture) -> None:
     assert bytes_to_ulid_or_none(b"invalid") is None
     assert "invalid" in caplog.text
     assert bytes_to_ulid_or_none(None) is None
+
+
+def test_compressed_states_downsample() -> None:
+    """Test downsampling keeps the extremes of numeric states and all others."""
+    compressed_states = CompressedStates()
+    for offset, state in enumerate(["3", "5", "1", "2", "4", "unavailable", "6"]):
+        compressed_states.append_state(state, 100.0 + offset)
+    for offset, state in enumerate(["7", "9", "8"]):
+        compressed_states.append_state(state, 110.0 + offset)
+
+    compressed_states.downsample(10)
+
+    assert [(row["s"], row["lu"]) for row in compressed_states] == [
+        ("3", 100.0),
+        ("5", 101.0),
+        ("1", 102.0),
+        ("4", 104.0),
+        ("unavailable", 105.0),
+        ("6", 106.0),
+        ("7", 110.0),
+        ("9", 111.0),
+        ("8", 112.0),
+    ]
@@ -12,6 +12,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -1969,3 +1970,102 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_skips_recently_used_attributes(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test purge does not check attributes still used by newer states."""
+    instance = await async_setup_recorder_instance(hass, {})
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+    start = dt_util.utcnow()
+    one_week_ago = start - timedelta(days=7)
+    with freeze_time(one_week_ago):
+        hass.states.async_set("sensor.shared", "old", {"unit": "shared"})
+        hass.states.async_set("sensor.unused", "old", {"unit": "unused"})
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.shared", "new", {"unit": "shared"})
+    hass.states.async_set("sensor.unused", "new", {"unit": "new"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 4
+        assert session.query(StateAttributes).count() == 3
+        shared_attributes_id = (
+            session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.shared_attrs == '{"unit":"shared"}')
+            .scalar()
+        )
+
+    purge_before = start - timedelta(days=1)
+    assert instance.state_attributes_manager.used_since(
+        {shared_attributes_id}, purge_before.timestamp()
+    ) == {shared_attributes_id}
+
+    checked_attributes_ids: list[set[int]] = []
+    original_purge_unused_attributes_ids = recorder.purge._purge_unused_attributes_ids
+
+    def _purge_unused_attributes_ids(instance, session, attributes_ids):
+        checked_attributes_ids.append(set(attributes_ids))
+        original_purge_unused_attributes_ids(instance, session, attributes_ids)
+
+    with session_scope(hass=hass) as session, patch.object(
+        recorder.purge,
+        "_purge_unused_attributes_ids",
+        _purge_unused_attributes_ids,
+    ):
+        assert purge_old_data(instance, purge_before, repack=False)
+        assert session.query(States).count() == 2
+        assert session.query(StateAttributes).count() == 2
+        assert (
+            session.query(StateAttributes)
+            .filter(StateAttributes.attributes_id == shared_attributes_id)
+            .count()
+            == 1
+        )
+
+    assert checked_attributes_ids
+    assert not any(
+        shared_attributes_id in attributes_ids
+        for attributes_ids in checked_attributes_ids
+    )
+
+
+async def test_new_attributes_and_event_data_marked_used(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+) -> None:
+    """Test attributes and event data inserted with a new row are marked used."""
+    instance = await async_setup_recorder_instance(hass, {})
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.new", "on", {"unit": "new"})
+    hass.bus.async_fire("new_event", {"data": "new"})
+    await async_wait_recording_done(hass)
+    last_updated_ts = hass.states.get("sensor.new").last_updated.timestamp()
+
+    with session_scope(hass=hass) as session:
+        attributes_id = (
+            session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.shared_attrs == '{"unit":"new"}')
+            .scalar()
+        )
+        data_id = (
+            session.query(EventData.data_id)
+            .filter(EventData.shared_data == '{"data":"new"}')
+            .scalar()
+        )
+        time_fired_ts = (
+            session.query(Events.time_fired_ts)
+            .filter(Events.data_id == data_id)
+            .scalar()
+        )
+
+    assert instance.state_attributes_manager.used_since(
+        {attributes_id}, last_updated_ts
+    ) == {attributes_id}
+    assert instance.event_data_manager.used_since({data_id}, time_fired_ts) == {data_id}
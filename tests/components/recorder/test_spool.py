@@ -0,0 +1,174 @@
+"""Test the recorder spool."""
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.components.recorder import spool as spool_module
+from homeassistant.components.recorder.spool import (
+    RecorderSpool,
+    decode_events,
+    encode_event,
+)
+from homeassistant.const import ATTR_ATTRIBUTION, EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, State
+import homeassistant.util.dt as dt_util
+
+
+def _state_changed_event(entity_id: str, state: str) -> Event:
+    """Return a state_changed event for an entity."""
+    context = Context(user_id="abc", parent_id="01H0000000000000000000000A")
+    new_state = State(
+        entity_id,
+        state,
+        {"friendly_name": "Test", ATTR_ATTRIBUTION: "Data from somewhere"},
+        context=context,
+    )
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+        EventOrigin.local,
+        new_state.last_updated,
+        context,
+    )
+
+
+def test_encode_decode_events() -> None:
+    """Test events keep the data the recorder writes when spooled."""
+    state_changed = _state_changed_event("sensor.test", "on")
+    removed = Event(EVENT_STATE_CHANGED, {"entity_id": "sensor.old", "new_state": None})
+    custom = Event("custom_event", {"some": ["data", 1]}, EventOrigin.remote)
+
+    events = list(
+        decode_events(
+            encode_event(state_changed) + encode_event(removed) + encode_event(custom)
+        )
+    )
+
+    assert len(events) == 3
+    decoded = events[0]
+    assert decoded.event_type == EVENT_STATE_CHANGED
+    assert decoded.time_fired == state_changed.time_fired
+    assert decoded.context.id == state_changed.context.id
+    assert decoded.context.user_id == "abc"
+    assert decoded.context.parent_id == "01H0000000000000000000000A"
+    assert "old_state" not in decoded.data
+    new_state = decoded.data["new_state"]
+    original_state = state_changed.data["new_state"]
+    assert new_state.entity_id == "sensor.test"
+    assert new_state.state == "on"
+    assert new_state.attributes == {"friendly_name": "Test"}
+    assert new_state.last_changed == original_state.last_changed
+    assert new_state.last_updated == original_state.last_updated
+
+    assert events[1].data == {"entity_id": "sensor.old", "new_state": None}
+
+    assert events[2].event_type == "custom_event"
+    assert events[2].data == {"some": ["data", 1]}
+    assert events[2].origin is EventOrigin.remote
+    assert events[2].time_fired == custom.time_fired
+
+
+def test_decode_truncated_segment() -> None:
+    """Test a truncated record at the end of a segment is discarded."""
+    event = Event("custom_event", {"some": "data"})
+    record = encode_event(event)
+    events = list(decode_events(record + record[:-1]))
+    assert len(events) == 1
+
+
+def test_spool_segments(tmp_path: Path) -> None:
+    """Test events are replayed in order from disk and from memory."""
+    spool = RecorderSpool(str(tmp_path / "spool"))
+    spool.async_start()
+    time_fired = dt_util.utcnow()
+    records = [
+        encode_event(Event("custom_event", {"idx": idx}, time_fired=time_fired))
+        for idx in range(5)
+    ]
+
+    with patch.object(spool_module, "SPOOL_SEGMENT_BYTES", len(records[0]) * 2):
+        assert spool.async_append(records[0]) is None
+        first_segment_id = spool.async_append(records[1])
+        assert first_segment_id is not None
+        assert spool.async_append(records[2]) is None
+        second_segment_id = spool.async_append(records[3])
+        assert second_segment_id is not None
+        assert spool.async_append(records[4]) is None
+
+    spool.write_segment(first_segment_id)
+    last_segment_id = spool.async_stop()
+    assert not spool.active
+    assert spool.events_spooled == 5
+
+    segment_ids = spool.segments(last_segment_id)
+    assert segment_ids == [first_segment_id, second_segment_id, last_segment_id]
+    assert (tmp_path / "spool" / f"{first_segment_id}.spool").exists()
+    assert not (tmp_path / "spool" / f"{second_segment_id}.spool").exists()
+
+    replayed = []
+    for segment_id in segment_ids:
+        events = spool.read_segment(segment_id)
+        replayed.extend(event.data["idx"] for event in events)
+        spool.remove_segment(segment_id, len(events))
+
+    assert replayed == [0, 1, 2, 3, 4]
+    assert spool.events_replayed == 5
+    assert spool.segments(last_segment_id) == []
+    assert not list((tmp_path / "spool").iterdir())
+    assert not spool.full
+
+
+def test_spool_write_pending_survives_restart(tmp_path: Path) -> None:
+    """Test pending segments written at shutdown are found by the next run."""
+    path = str(tmp_path / "spool")
+    spool = RecorderSpool(path)
+    spool.async_start()
+    spool.async_append(encode_event(Event("custom_event", {"idx": 1})))
+    spool.async_stop()
+    spool.write_pending()
+
+    next_spool = RecorderSpool(path)
+    segment_ids = next_spool.segments(next_spool.created_segment_id)
+    assert len(segment_ids) == 1
+    events = next_spool.read_segment(segment_ids[0])
+    assert [event.data for event in events] == [{"idx": 1}]
+
+
+def test_spool_full(tmp_path: Path) -> None:
+    """Test the spool reports when it cannot take more events."""
+    spool = RecorderSpool(str(tmp_path / "spool"))
+    spool.async_start()
+    record = encode_event(Event("custom_event", {"idx": 1}))
+    with patch.object(spool_module, "SPOOL_MAX_BYTES", len(record) * 2):
+        spool.async_append(record)
+        assert not spool.full
+        spool.async_append(record)
+        assert spool.full
+        last_segment_id = spool.async_stop()
+        spool.remove_segment(last_segment_id, 2)
+        assert not spool.full
+
+
+def test_spool_full_after_write_failure(tmp_path: Path) -> None:
+    """Test a failed write only stops spooling until the spool drains."""
+    spool = RecorderSpool(str(tmp_path / "spool"))
+    spool.async_start()
+    spool.async_append(encode_event(Event("custom_event", {"idx": 1})))
+    first_segment_id = spool.async_stop()
+    with patch("builtins.open", side_effect=OSError("No space left on device")):
+        spool.write_segment(first_segment_id)
+    assert spool.full
+
+    # A later write that succeeds clears the failure
+    spool.async_append(encode_event(Event("custom_event", {"idx": 2})))
+    second_segment_id = spool.async_stop()
+    spool.write_segment(second_segment_id)
+    assert not spool.full
+
+    with patch("builtins.open", side_effect=OSError("No space left on device")):
+        spool.write_segment(first_segment_id)
+    assert spool.full
+
+    # Replaying the segments left in memory clears the failure
+    for segment_id in spool.segments(second_segment_id):
+        spool.remove_segment(segment_id, 1)
+    assert not spool.full
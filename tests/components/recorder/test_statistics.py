@@ -1,14 +1,19 @@
 """The tests for sensor recorder platform."""
 from collections.abc import Callable
-from datetime import timedelta
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -18,6 +23,8 @@ from homeassistant.components.recorder.statistics import (
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
+    _reduce_statistics_per_day,
+    _reduce_statistics_per_month,
     async_add_external_statistics,
     async_import_statistics,
     get_last_short_term_statistics,
@@ -1183,6 +1190,123 @@ def test_daily_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.freeze_time("2022-10-10 12:00:00+00:00")
+def test_daily_and_monthly_statistics_rollups(
+    hass_recorder: Callable[..., HomeAssistant],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test daily and monthly statistics are read from the rollup tables."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+    hass = hass_recorder()
+    wait_recording_done(hass)
+    zero = dt_util.as_utc(dt_util.parse_datetime("2022-09-29 00:00:00"))
+    today = dt_util.as_utc(dt_util.parse_datetime("2022-10-10 00:00:00"))
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    statistic_id = "test:total_energy_import"
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+
+    def _external_statistics(start: datetime, hours: int, offset: float):
+        return [
+            {
+                "start": start + timedelta(hours=hour),
+                "last_reset": None,
+                "mean": hour % 24 + offset,
+                "min": hour % 12 + offset,
+                "max": hour % 36 + offset,
+                "state": hour + offset,
+                "sum": hour * 2 + offset,
+            }
+            for hour in range(hours)
+        ]
+
+    def _rollups(table) -> list[tuple[float, float]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (row.start_ts, row.mean)
+                for row in session.query(table).order_by(table.start_ts)
+            ]
+
+    def _assert_reduced_from_hourly() -> None:
+        hourly = statistics_during_period(hass, zero, statistic_ids={statistic_id})
+        for period, reduce in (
+            ("day", _reduce_statistics_per_day),
+            ("month", _reduce_statistics_per_month),
+        ):
+            stats = statistics_during_period(
+                hass, zero, statistic_ids={statistic_id}, period=period
+            )
+            assert stats == reduce(hourly, types)
+
+    # Four closed days and a day in progress
+    async_add_external_statistics(
+        hass, external_metadata, _external_statistics(zero, 4 * 24, 0)
+    )
+    async_add_external_statistics(
+        hass, external_metadata, _external_statistics(today, 12, 0)
+    )
+    wait_recording_done(hass)
+
+    day1_start = zero.timestamp()
+    assert [start for start, _ in _rollups(StatisticsDaily)] == [
+        (zero + timedelta(days=day)).timestamp() for day in range(4)
+    ]
+    assert [start for start, _ in _rollups(StatisticsMonthly)] == [
+        dt_util.as_utc(dt_util.parse_datetime("2022-09-01 00:00:00")).timestamp()
+    ]
+    _assert_reduced_from_hourly()
+
+    # Closed periods are read from the rollup tables
+    with session_scope(hass=hass) as session:
+        session.query(StatisticsDaily).filter(
+            StatisticsDaily.start_ts == day1_start
+        ).update({StatisticsDaily.mean: 1000.0})
+    stats = statistics_during_period(
+        hass, zero, statistic_ids={statistic_id}, period="day"
+    )
+    assert stats[statistic_id][0]["mean"] == 1000.0
+    assert stats[statistic_id][0]["end"] == (zero + timedelta(days=1)).timestamp()
+    assert len(stats[statistic_id]) == 5
+
+    # Importing statistics rebuilds the rollups of the affected periods
+    async_add_external_statistics(
+        hass, external_metadata, _external_statistics(zero, 2, 100)
+    )
+    wait_recording_done(hass)
+    assert _rollups(StatisticsDaily)[0][1] != 1000.0
+    _assert_reduced_from_hourly()
+
+    # Adjusting the sum rebuilds the rollups from the adjusted hour
+    recorder.get_instance(hass).async_adjust_statistics(
+        statistic_id, zero + timedelta(hours=30), 10, "kWh"
+    )
+    wait_recording_done(hass)
+    _assert_reduced_from_hourly()
+
+    # Rollups made in another time zone are not used
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Europe/Vienna"))
+    _assert_reduced_from_hourly()
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+    # The day in progress is rolled up when its last hour is compiled
+    async_add_external_statistics(
+        hass, external_metadata, _external_statistics(today, 24, 0)
+    )
+    wait_recording_done(hass)
+    assert len(_rollups(StatisticsDaily)) == 4
+    freezer.move_to("2022-10-11 00:10:00+00:00")
+    do_adhoc_statistics(hass, start=today + timedelta(hours=23, minutes=55))
+    wait_recording_done(hass)
+    assert len(_rollups(StatisticsDaily)) == 5
+    _assert_reduced_from_hourly()
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 def test_weekly_statistics_mean(
@@ -2393,3 +2517,63 @@ def test_change_with_none(
     assert stats == {}
 
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+def test_reduce_statistics_per_day_with_none() -> None:
+    """Test reducing hourly statistics to daily statistics skips None values."""
+    day1 = dt_util.as_utc(dt_util.parse_datetime("2023-10-01 00:00:00"))
+    day2 = day1 + timedelta(days=1)
+    day3 = day2 + timedelta(days=1)
+    hour = timedelta(hours=1).total_seconds()
+    stats = {
+        "sensor.test": [
+            {
+                "start": day1.timestamp(),
+                "mean": 1.0,
+                "min": None,
+                "max": 2.0,
+                "state": 5.0,
+                "sum": 1.0,
+            },
+            {
+                "start": day1.timestamp() + hour,
+                "mean": 3.0,
+                "min": 0.5,
+                "max": None,
+                "state": 6.0,
+                "sum": 2.0,
+            },
+            {
+                "start": day2.timestamp() + 23 * hour,
+                "mean": None,
+                "min": None,
+                "max": None,
+                "state": 7.0,
+                "sum": 3.0,
+            },
+        ]
+    }
+    assert _reduce_statistics_per_day(
+        stats, {"mean", "min", "max", "state", "sum"}
+    ) == {
+        "sensor.test": [
+            {
+                "start": day1.timestamp(),
+                "end": day2.timestamp(),
+                "mean": 2.0,
+                "min": 0.5,
+                "max": 2.0,
+                "state": 6.0,
+                "sum": 2.0,
+            },
+            {
+                "start": day2.timestamp(),
+                "end": day3.timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "state": 7.0,
+                "sum": 3.0,
+            },
+        ]
+    }
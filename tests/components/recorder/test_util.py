@@ -303,6 +303,36 @@ def test_setup_connection_for_dialect_sqlite_zero_commit_interval(
     assert execute_args[2] == "PRAGMA foreign_keys=ON"
 
 
+def test_setup_connection_for_dialect_sqlite_read_only() -> None:
+    """Test setting up a read only connection for a sqlite dialect."""
+    instance_mock = MagicMock()
+    execute_args = []
+    close_mock = MagicMock()
+
+    def execute_mock(statement):
+        nonlocal execute_args
+        execute_args.append(statement)
+
+    def _make_cursor_mock(*_):
+        return MagicMock(execute=execute_mock, close=close_mock)
+
+    dbapi_connection = MagicMock(cursor=_make_cursor_mock)
+
+    assert (
+        util.setup_connection_for_dialect(
+            instance_mock, "sqlite", dbapi_connection, False, True
+        )
+        is None
+    )
+
+    assert len(execute_args) == 5
+    assert execute_args[0] == "PRAGMA cache_size = -16384"
+    assert execute_args[1] == "PRAGMA synchronous=NORMAL"
+    assert execute_args[2] == "PRAGMA foreign_keys=ON"
+    assert execute_args[3] == "PRAGMA query_only=ON"
+    assert execute_args[4] == "PRAGMA mmap_size=67108864"
+
+
 @pytest.mark.parametrize(
     ("mysql_version", "message"),
     [
@@ -3,7 +3,7 @@ from collections.abc import Callable
 from datetime import datetime, timedelta
 import math
 from statistics import mean
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 from freezegun.api import FrozenDateTimeFactory
@@ -33,8 +33,13 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
-from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
-from homeassistant.core import HomeAssistant, State
+from homeassistant.components.sensor.recorder import StatesCollector
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import Event, HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
@@ -99,6 +104,123 @@ def set_time_zone():
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+async def test_compile_statistics_from_collected_states(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics are compiled from collected states after the first run."""
+    zero = dt_util.utcnow()
+    period1 = zero + timedelta(minutes=5)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "100", ENERGY_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    # The first run compiles from the database and starts collecting states
+    do_adhoc_statistics(hass, start=zero)
+    await async_wait_recording_done(hass)
+
+    with freeze_time(period1 + timedelta(minutes=1)):
+        hass.states.async_set("sensor.test1", "30", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.test2", "150", ENERGY_SENSOR_ATTRIBUTES)
+    with freeze_time(period1 + timedelta(minutes=4)):
+        hass.states.async_set("sensor.test1", "20", POWER_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_full_significant_states_mock:
+        do_adhoc_statistics(hass, start=period1)
+        await async_wait_recording_done(hass)
+    assert get_full_significant_states_mock.call_count == 0
+
+    stats = statistics_during_period(hass, period1, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(period1).timestamp(),
+                "end": process_timestamp(period1 + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(24.0),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(period1).timestamp(),
+                "end": process_timestamp(period1 + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(150.0),
+                "sum": pytest.approx(50.0),
+            }
+        ],
+    }
+
+
+def test_states_collector_trims_and_drops_states() -> None:
+    """Test the states collector only keeps the states the next compile needs."""
+    period0 = datetime(2023, 5, 8, 10, 0, tzinfo=dt_util.UTC)
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period1 + timedelta(minutes=5)
+
+    def _state_changed(
+        entity_id: str, state: str | None, when: datetime
+    ) -> tuple[State | None, Event]:
+        new_state = (
+            State(entity_id, state, POWER_SENSOR_ATTRIBUTES, when, when)
+            if state is not None
+            else None
+        )
+        return new_state, Event(
+            EVENT_STATE_CHANGED, {"entity_id": entity_id, "new_state": new_state}
+        )
+
+    with freeze_time(period0):
+        collector = StatesCollector([])
+    states = []
+    for minute, value in ((1, "10"), (4, "20"), (6, "30"), (11, "40")):
+        new_state, event = _state_changed(
+            "sensor.test1", value, period0 + timedelta(minutes=minute)
+        )
+        states.append(new_state)
+        collector.async_state_changed(event)
+    collector.async_state_changed(
+        _state_changed("sensor.test2", "1", period0 + timedelta(minutes=1))[1]
+    )
+
+    # The change in the third period only keeps the state at the start
+    # of the second period and the changes after it
+    assert collector.states_during_period(period0, period1, set()) is None
+    assert collector.states_during_period(period1, period2, set()) == {
+        "sensor.test1": states[1:3],
+        "sensor.test2": [ANY],
+    }
+
+    # Removed sensors and sensors without a state class are dropped
+    collector.async_state_changed(
+        _state_changed("sensor.test2", None, period2 + timedelta(minutes=1))[1]
+    )
+    collector.async_state_changed(
+        Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.test1",
+                "new_state": State("sensor.test1", "50", {}),
+            },
+        )
+    )
+    assert collector.states_during_period(period1, period2, set()) == {}
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
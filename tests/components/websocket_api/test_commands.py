@@ -1260,6 +1260,58 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_share_state_changed_listener(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities subscriptions share one state changed listener."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+    init_count = sum(hass.bus.async_listeners().values())
+
+    for msg_id, extra in (
+        (5, {}),
+        (6, {"entity_ids": ["light.one"]}),
+        (7, {"entity_ids": ["light.one", "light.two"]}),
+    ):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities", **extra}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert "a" in msg["event"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    hass.states.async_set("light.two", "on")
+    received = set()
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["c"]["light.two"]["+"]["s"] == "on"
+        received.add(msg["id"])
+    assert received == {5, 7}
+
+    hass.states.async_set("light.one", "on")
+    received = set()
+    for _ in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["c"]["light.one"]["+"]["s"] == "on"
+        received.add(msg["id"])
+    assert received == {5, 6, 7}
+
+    for msg_id, subscription in ((8, 5), (9, 6), (10, 7)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
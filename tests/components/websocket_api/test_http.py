@@ -2,7 +2,7 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -431,6 +431,44 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_pending_state_diffs_coalesced(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changes of an entity are merged for a client that fell behind."""
+    hass.states.async_set("light.one", "off", {"color": "red", "effect": "none"})
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json({"id": 5, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.one", "light.two"}
+
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE_STATE_DIFFS",
+        0,
+    ):
+        hass.states.async_set("light.one", "on", {"color": "red", "effect": "none"})
+        hass.states.async_set("light.two", "on")
+        hass.states.async_set("light.one", "on", {"color": "blue"})
+        hass.states.async_set("light.one", "on", {"color": "green"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"]["c"]["light.one"]["+"]["s"] == "on"
+    assert msg["event"]["c"]["light.one"]["+"]["a"] == {"color": "green"}
+    assert msg["event"]["c"]["light.one"]["-"] == {"a": ["effect"]}
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"]["c"]["light.two"]["+"]["s"] == "on"
+    assert hass.data[const.DATA_COALESCED_STATE_DIFFS] == 2
+
+    # Once sent, later changes are queued again
+    hass.states.async_set("light.one", "off", {"color": "green"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.one"]["+"] == {"s": "off", "lc": ANY, "c": ANY}
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2,6 +2,7 @@
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
+    StateDiffMessage,
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
@@ -9,6 +10,7 @@ from homeassistant.components.websocket_api.messages import (
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -282,6 +284,53 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_state_diff_message_merge(hass: HomeAssistant) -> None:
+    """Test merging state diff messages of an entity."""
+    old_state = State("light.window", "off", {"color": "red"})
+    mid_state = State("light.window", "on", {"color": "blue"})
+    new_state = State(
+        "light.window", "on", {"color": "red"}, last_changed=mid_state.last_changed
+    )
+
+    def _state_changed(old: State | None, new: State | None) -> Event:
+        return Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "light.window", "old_state": old, "new_state": new},
+        )
+
+    message = StateDiffMessage(1, _state_changed(old_state, mid_state))
+    assert message.key == (1, "light.window")
+    message.merge(StateDiffMessage(1, _state_changed(mid_state, new_state)))
+    assert json_loads(message.as_json()) == {
+        "id": 1,
+        "type": "event",
+        "event": {
+            "c": {
+                "light.window": {
+                    "+": {
+                        "s": "on",
+                        "lc": new_state.last_changed.timestamp(),
+                        "c": new_state.context.id,
+                    }
+                }
+            }
+        },
+    }
+
+    message.merge(StateDiffMessage(1, _state_changed(new_state, None)))
+    assert json_loads(message.as_json()) == {
+        "id": 1,
+        "type": "event",
+        "event": {"r": ["light.window"]},
+    }
+
+    message = StateDiffMessage(1, _state_changed(None, mid_state))
+    message.merge(StateDiffMessage(1, _state_changed(mid_state, new_state)))
+    assert json_loads(message.as_json())["event"] == {
+        "a": json_loads(f"{{{new_state.as_compressed_state_json}}}")
+    }
+
+
 async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
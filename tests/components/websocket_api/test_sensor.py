@@ -35,6 +35,8 @@ async def test_websocket_api(
 
     state = hass.states.get("sensor.connected_clients")
     assert state.state == "0"
+    state = hass.states.get("sensor.coalesced_state_changes")
+    assert state.state == "0"
 
     await test_auth_active_with_token(hass, ws, hass_access_token)
 
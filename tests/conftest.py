@@ -302,6 +302,54 @@ def skip_stop_scripts(
         yield
 
 
+@pytest.fixture
+def enable_yaml_config_cache() -> bool:
+    """Add ability to write the configuration cache.
+
+    The configuration cache would otherwise be written to the
+    configuration directories of the test fixtures.
+
+    Parametrize to True to write the cache.
+    @pytest.mark.parametrize("enable_yaml_config_cache", [True])
+    """
+    return False
+
+
+@pytest.fixture(autouse=True)
+def skip_yaml_config_cache(
+    enable_yaml_config_cache: bool,
+) -> Generator[None, None, None]:
+    """Add ability to bypass writing the configuration cache."""
+    if enable_yaml_config_cache:
+        yield
+        return
+    with patch("homeassistant.config._write_yaml_config_cache", Mock()):
+        yield
+
+
+@pytest.fixture
+def enable_manifest_index() -> bool:
+    """Add ability to write the manifest index.
+
+    The manifest index would otherwise be written to the
+    configuration directories of the test fixtures.
+
+    Parametrize to True to write the index.
+    @pytest.mark.parametrize("enable_manifest_index", [True])
+    """
+    return False
+
+
+@pytest.fixture(autouse=True)
+def skip_manifest_index(enable_manifest_index: bool) -> Generator[None, None, None]:
+    """Add ability to bypass writing the manifest index."""
+    if enable_manifest_index:
+        yield
+        return
+    with patch("homeassistant.loader._write_manifest_index", Mock()):
+        yield
+
+
 @contextmanager
 def long_repr_strings() -> Generator[None, None, None]:
     """Increase reprlib maxstring and maxother to 300."""
@@ -981,6 +1029,12 @@ async def _mqtt_mock_entry(
         # Assert that MQTT is setup
         assert real_mqtt_instance is not None, "MQTT was not setup correctly"
         mock_mqtt_instance.conf = real_mqtt_instance.conf  # For diagnostics
+        mock_mqtt_instance.received_messages_backlog_max = (
+            real_mqtt_instance.received_messages_backlog_max
+        )
+        mock_mqtt_instance.received_messages_deferred_batches = (
+            real_mqtt_instance.received_messages_deferred_batches
+        )
         mock_mqtt_instance._mqttc = mqtt_client_mock
 
         # connected set to True to get a more realistic behavior when subscribing
@@ -2150,6 +2150,63 @@ async def test_track_template_result_and_conditional_upper_case(
     assert specific_runs[2] == "on"
 
 
+async def test_track_template_result_iterator_skips_unread_entities(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes to iterated entities that were never read do not re-render."""
+    hass.states.async_set("sensor.phone_battery", 50)
+    hass.states.async_set("sensor.temperature", 20)
+    runs = []
+
+    @ha.callback
+    def _callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    template = Template(
+        """{{ states.sensor|selectattr("entity_id","search","battery")
+        |map(attribute="state")|join(" ") }}""",
+        hass,
+    )
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None, timedelta(seconds=0))], _callback
+    )
+    await hass.async_block_till_done()
+    assert info.listeners == {
+        "all": False,
+        "domains": {"sensor"},
+        "entities": set(),
+        "time": False,
+    }
+    render_info = info._info[template]
+    assert render_info.iterated_entities == {"sensor.phone_battery"}
+
+    hass.states.async_set("sensor.temperature", 21)
+    await hass.async_block_till_done()
+    assert info._info[template] is render_info
+    assert runs == []
+
+    hass.states.async_set("sensor.phone_battery", 49)
+    await hass.async_block_till_done()
+    assert info._info[template] is not render_info
+    assert runs == [49]
+
+    # Adding or removing entities in the domain always re-renders
+    render_info = info._info[template]
+    hass.states.async_set("sensor.tablet_battery", 80)
+    await hass.async_block_till_done()
+    assert info._info[template] is not render_info
+    assert runs == [49, "49 80"]
+
+    render_info = info._info[template]
+    hass.states.async_remove("sensor.temperature")
+    await hass.async_block_till_done()
+    assert info._info[template] is not render_info
+    assert runs == [49, "49 80"]
+
+
 async def test_track_template_result_iterator(hass: HomeAssistant) -> None:
     """Test tracking template."""
     iterator_runs = []
@@ -99,17 +99,16 @@ def assert_result_info(
     """Check result info."""
     assert info.result() == result
     assert info.all_states == all_states
-    assert info.filter("invalid_entity_name.somewhere") == all_states
+    assert not info.filter("invalid_entity_name.somewhere")
+    assert info.filter_lifecycle("invalid_entity_name.somewhere") == all_states
     if entities is not None:
         assert info.entities == frozenset(entities)
         assert all(info.filter(entity) for entity in entities)
-        if not all_states:
-            assert not info.filter("invalid_entity_name.somewhere")
     else:
         assert not info.entities
     if domains is not None:
         assert info.domains == frozenset(domains)
-        assert all(info.filter(domain + ".entity") for domain in domains)
+        assert all(info.filter_lifecycle(domain + ".entity") for domain in domains)
     else:
         assert not hasattr(info, "_domains")
 
@@ -4393,9 +4392,34 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
+    # Recently compiled templates are still held by the LRU
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    template._NO_HASS_ENV.template_cache_lru.clear()
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache_reused(hass: HomeAssistant) -> None:
+    """Test compiled templates are reused after the template is discarded."""
+    template_string = "{{ value_json.compiled_template_cache_reused }}"
+    env = template._NO_HASS_ENV
+    tpl = template.Template(template_string)
+    tpl.ensure_valid()
+    compiled = tpl._compiled_code
+    del tpl
+
+    hits, misses = env.template_cache_lru.get_stats()
+    tpl2 = template.Template(template_string)
+    tpl2.ensure_valid()
+    assert tpl2._compiled_code is compiled
+    assert env.template_cache_lru.get_stats() == (hits + 1, misses)
+
+    with patch.object(template, "COMPILED_TEMPLATE_CACHE_SIZE", 1):
+        limited_env = template.TemplateEnvironment(None)
+    limited_env.compile("{{ 1 }}")
+    limited_env.compile("{{ 2 }}")
+    assert list(limited_env.template_cache_lru.keys()) == ["{{ 2 }}"]
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, loader, runner
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -16,7 +16,8 @@ from homeassistant.core import HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import Integration
+from homeassistant.loader import Integration, async_get_integrations
+from homeassistant.setup import SetupSpan
 
 from .common import (
     MockConfigEntry,
@@ -128,6 +129,72 @@ async def test_setting_up_config(hass: HomeAssistant) -> None:
     assert "group" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_preimport_integrations(hass: HomeAssistant) -> None:
+    """Test integrations and their platforms are imported before setup."""
+    mock_integration(hass, MockModule("mocked"))
+    integration_cache = await async_get_integrations(
+        hass, {"group", "light", "mocked"}
+    )
+    imported: list[str] = []
+
+    def _mock_preimport(module_name: str) -> tuple[float, float] | None:
+        imported.append(module_name)
+        if module_name == "homeassistant.components.light":
+            return None
+        return 1.0, 2.0
+
+    setup_spans: list[SetupSpan] = []
+    with patch.object(bootstrap, "_preimport_module", _mock_preimport):
+        await bootstrap._async_preimport_integrations(
+            hass,
+            {"light": [{"platform": "group"}, {"platform": "mocked"}]},
+            integration_cache,
+            setup_spans,
+        )
+
+    # The platform is imported after the integration and the entity component
+    assert sorted(imported[:2]) == [
+        "homeassistant.components.group",
+        "homeassistant.components.light",
+    ]
+    assert imported[2:] == ["homeassistant.components.group.light"]
+    assert setup_spans == [
+        SetupSpan("group", "preimport", 1.0, 2.0),
+        SetupSpan("group.light", "preimport", 1.0, 2.0),
+    ]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_preimport_skips_custom_and_missing_requirements(
+    hass: HomeAssistant,
+) -> None:
+    """Test custom integrations and missing requirements are not preimported."""
+    mock_integration(hass, MockModule("custom"), built_in=False)
+    mock_integration(hass, MockModule("needs_lib", requirements=["missing==1.0"]))
+    mock_integration(hass, MockModule("depends_on_lib", dependencies=["needs_lib"]))
+    mock_integration(hass, MockModule("ready", requirements=["installed==1.0"]))
+    for domain in ("custom", "needs_lib", "depends_on_lib", "ready"):
+        hass.data[loader.DATA_COMPONENTS].pop(domain)
+    integration_cache = await async_get_integrations(
+        hass, {"custom", "needs_lib", "depends_on_lib", "ready"}
+    )
+    imported: list[str] = []
+
+    def _mock_preimport(module_name: str) -> tuple[float, float] | None:
+        imported.append(module_name)
+        return None
+
+    with patch.object(bootstrap, "_preimport_module", _mock_preimport), patch.object(
+        bootstrap, "is_installed", lambda requirement: requirement == "installed==1.0"
+    ):
+        await bootstrap._async_preimport_integrations(
+            hass, {}, integration_cache, []
+        )
+
+    assert imported == ["homeassistant.components.ready"]
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_all_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when all present."""
@@ -4,6 +4,7 @@ import contextlib
 import copy
 import logging
 import os
+from pathlib import Path
 from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock, Mock, patch
@@ -1061,6 +1062,43 @@ async def test_async_hass_config_yaml_merge(
     assert len(conf["light"]) == 1
 
 
+@pytest.mark.parametrize("enable_yaml_config_cache", [True])
+async def test_async_hass_config_yaml_cache(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test the parsed configuration is cached until a file it depends on changes."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / config_util.YAML_CONFIG_FILE).write_text(
+        "frontend:\nlight: !include light.yaml\nhttp:\n  api_password: !secret pw\n"
+    )
+    (tmp_path / "light.yaml").write_text("- platform: demo\n")
+    (tmp_path / SECRET_YAML).write_text("pw: abc123\n")
+    expected = {
+        "frontend": {},
+        "light": [{"platform": "demo"}],
+        "http": {"api_password": "abc123"},
+    }
+
+    assert await config_util.async_hass_config_yaml(hass) == expected
+    assert (tmp_path / ".storage" / config_util.YAML_CONFIG_CACHE_FILE).exists()
+
+    with patch("homeassistant.config.load_yaml_config_file") as load_mock:
+        config = await config_util.async_hass_config_yaml(hass)
+    assert load_mock.call_count == 0
+    assert config == expected
+    assert config["http"].__config_file__ == str(
+        tmp_path / config_util.YAML_CONFIG_FILE
+    )
+
+    (tmp_path / "light.yaml").write_text("- platform: template\n")
+    config = await config_util.async_hass_config_yaml(hass)
+    assert config["light"] == [{"platform": "template"}]
+
+    (tmp_path / SECRET_YAML).write_text("pw: changed\n")
+    config = await config_util.async_hass_config_yaml(hass)
+    assert config["http"] == {"api_password": "changed"}
+
+
 @pytest.fixture
 def merge_log_err(hass):
     """Patch _merge_log_error from packages."""
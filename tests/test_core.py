@@ -848,6 +848,56 @@ async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_run_immediately_unsubscribe_during_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners can be added and removed while an event is dispatched."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener that unsubscribes all listeners."""
+        calls.append(("listener", event.event_type))
+        while unsubs:
+            unsubs.pop()()
+        hass.bus.async_listen("test", late_listener, run_immediately=True)
+
+    @ha.callback
+    def late_listener(event):
+        """Mock listener added during dispatch."""
+        calls.append(("late_listener", event.event_type))
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append(("match_all_listener", event.event_type))
+
+    unsubs.append(
+        hass.bus.async_listen(MATCH_ALL, match_all_listener, run_immediately=True)
+    )
+    unsubs.append(hass.bus.async_listen("test", listener, run_immediately=True))
+    unsubs.append(
+        hass.bus.async_listen("test", match_all_listener, run_immediately=True)
+    )
+
+    hass.bus.async_fire("test")
+    # Listeners removed during dispatch still get the event being dispatched
+    # and listeners added during dispatch only get the next event
+    assert calls == [
+        ("match_all_listener", "test"),
+        ("listener", "test"),
+        ("match_all_listener", "test"),
+    ]
+
+    calls.clear()
+    hass.bus.async_fire("test")
+    assert calls == [("late_listener", "test")]
+    listeners = hass.bus.async_listeners()
+    assert listeners[MATCH_ALL] == 0
+    assert listeners["test"] == 1
+
+
 async def test_eventbus_run_immediately_not_callback(hass: HomeAssistant) -> None:
     """Test we raise when passing a non-callback with run_immediately."""
 
@@ -1157,6 +1207,28 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass: HomeAssistant) -> None:
+    """Test unchanged attributes are shared between states instead of copied."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    first_state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    second_state = hass.states.get("light.bowl")
+    assert second_state.state == "off"
+    assert second_state.attributes is first_state.attributes
+
+    hass.states.async_set("light.bowl", "on", second_state.attributes)
+    third_state = hass.states.get("light.bowl")
+    assert third_state.state == "on"
+    assert third_state.attributes is first_state.attributes
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    fourth_state = hass.states.get("light.bowl")
+    assert fourth_state.attributes == {"brightness": 50}
+    assert fourth_state.attributes is not first_state.attributes
+    assert first_state.attributes == {"brightness": 100}
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
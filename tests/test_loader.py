@@ -1,4 +1,5 @@
 """Test to verify that we can load components."""
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -333,6 +334,46 @@ async def test_integrations_only_once(hass: HomeAssistant) -> None:
     assert await int_1 is await int_2
 
 
+@pytest.mark.parametrize("enable_manifest_index", [True])
+async def test_manifest_index(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test integrations are resolved from the manifest index of the last start."""
+    hass.config.config_dir = str(tmp_path)
+    with patch.object(loader, "__version__", "2024.2.0"):
+        api = await loader.async_get_integration(hass, "api")
+        assert await api.resolve_dependencies()
+        await loader.async_save_manifest_index(hass)
+    assert (tmp_path / loader.MANIFEST_INDEX_FILE).exists()
+
+    # Start again
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass.data.pop(loader.DATA_MANIFEST_INDEX)
+    with patch.object(loader, "__version__", "2024.2.0"), patch(
+        "homeassistant.loader._resolve_integrations_from_root"
+    ) as mock_resolve, patch(
+        "homeassistant.loader._async_component_dependencies"
+    ) as mock_dependencies:
+        integration = await loader.async_get_integration(hass, "api")
+        assert await integration.resolve_dependencies()
+
+    assert not mock_resolve.called
+    assert not mock_dependencies.called
+    assert integration is not api
+    assert integration.manifest == api.manifest
+    assert integration.file_path == api.file_path
+    assert integration.all_dependencies == {"http"}
+
+    # Start again after an update
+    hass.data[loader.DATA_INTEGRATIONS] = {}
+    hass.data.pop(loader.DATA_MANIFEST_INDEX)
+    with patch.object(loader, "__version__", "2024.3.0"), patch(
+        "homeassistant.loader._async_component_dependencies", return_value={"http"}
+    ) as mock_dependencies:
+        integration = await loader.async_get_integration(hass, "api")
+        assert await integration.resolve_dependencies()
+
+    assert mock_dependencies.called
+
+
 def _get_test_integration(hass, name, config_flow):
     """Return a generated test integration."""
     return loader.Integration(
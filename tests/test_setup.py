@@ -10,7 +10,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries, setup
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import discovery
 from homeassistant.helpers.config_validation import (
@@ -739,6 +739,48 @@ async def test_async_start_setup_platforms(hass: HomeAssistant) -> None:
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
 
 
+async def test_async_trace_setup_phase(hass: HomeAssistant) -> None:
+    """Test setup phases are recorded while Home Assistant is starting."""
+    with setup.async_trace_setup_phase(hass, "august", "setup"):
+        pass
+    assert setup.DATA_SETUP_SPANS not in hass.data
+
+    spans = hass.data[setup.DATA_SETUP_SPANS] = []
+    with setup.async_trace_setup_phase(hass, "august", "setup"):
+        pass
+    assert spans == []
+
+    hass.state = CoreState.not_running
+    mock_integration(hass, MockModule("comp_dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["comp_dep"]))
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    phases = {(span.name, span.phase): span for span in spans}
+    assert phases["comp", "wait_dependencies"].waits_on == ("comp_dep",)
+    assert ("comp_dep", "wait_dependencies") not in phases
+    for name in ("comp", "comp_dep"):
+        for phase in ("requirements", "import", "config", "setup"):
+            span = phases[name, phase]
+            assert span.start <= span.end
+
+
+def test_async_get_setup_critical_path() -> None:
+    """Test the critical path follows the dependency waited for the longest."""
+    spans = [
+        setup.SetupSpan("http", "setup", 0.0, 2.0),
+        setup.SetupSpan("zeroconf", "setup", 0.0, 1.0),
+        setup.SetupSpan("api", "wait_dependencies", 0.0, 2.0, ("http",)),
+        setup.SetupSpan("api", "setup", 2.0, 3.0),
+        setup.SetupSpan(
+            "hue", "wait_dependencies", 0.0, 3.0, ("api", "zeroconf", "unknown")
+        ),
+        setup.SetupSpan("hue", "setup", 3.0, 4.0),
+        setup.SetupSpan("hue.light", "platform", 4.0, 6.0),
+    ]
+    assert setup.async_get_setup_critical_path(spans) == ["http", "api", "hue"]
+    assert setup.async_get_setup_critical_path([]) == []
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None: